@@ -4,9 +4,8 @@ from ttkbootstrap import Style
 import mysql.connector
 from mysql.connector import Error
 from PIL import Image, ImageTk
-from datetime import datetime
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
-import requests
 import random
 import os
 import shutil
@@ -15,6 +14,27 @@ import re
 import logging
 import time
 import sys
+import database
+from query_service import QueryService
+from pagination import KeysetQuery, invalidate_counts
+from search import SearchQuery
+from fuzzy import FuzzyFallbackQuery
+import fuzzy
+import autocomplete
+from tree_pager import TreePager
+from live_search import LiveSearch
+import live_search
+import thumbnails
+import image_cache
+import dashboard_stats
+import ratings
+from page_cache import PageCache
+from chunked_render import ChunkedRenderer
+from lazy_import import lazy_module
+from screen_router import ScreenRouter
+
+# Only sending email uses requests (and urllib3, charset detection, ...)
+requests = lazy_module("requests")
 
 # Utility function for handling paths in both development and PyInstaller
 def resource_path(relative_path):
@@ -69,15 +89,11 @@ def send_email(to_email, subject, message):
         print(f"Error: {err}")
         return {"error": f"An error occurred: {err}"}
     
-# Database Connection with error handling
+# Database Connection with error handling (borrowed from the shared pool;
+# calling close() on it returns it to the pool)
 def connect_db():
     try:
-        return mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="",
-            database="tourism_db"
-        )
+        return database.get_connection()
     except mysql.connector.Error as err:
         logging.error(f"Database connection failed: {err}")
         messagebox.showerror("Database Error",
@@ -87,6 +103,9 @@ def connect_db():
 # Session Management
 SESSION_TIMEOUT = 300  # 5 minutes
 
+# Seconds a cached list page is shown before its rows are reloaded on the next visit
+LIST_PAGE_MAX_AGE = 60
+
 def create_session(user_id):
     """Create a session file with user ID and timestamp."""
     try:
@@ -135,40 +154,20 @@ def update_last_activity(user_id):
         cursor.close()
         db.close()
 
+# Live replies per review, grouped once and joined (instead of a COUNT(*) subquery per review row)
+REPLY_COUNTS_QUERY = """
+    SELECT review_id, COUNT(*) AS reply_count
+    FROM review_replies
+    WHERE date_deleted IS NULL
+    GROUP BY review_id
+"""
+
 # Database Manager Class
 class DatabaseManager:
-    @staticmethod
-    def get_count(table):
-        try:
-            db = connect_db()
-            if db:
-                cursor = db.cursor()
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                count = cursor.fetchone()[0]
-                cursor.close()
-                db.close()
-                return count
-            return 0
-        except mysql.connector.Error as e:
-            messagebox.showerror("Database Error", str(e))
-            return 0
-    
     @staticmethod
     def execute_query(query, params=None):
         try:
-            db = connect_db()
-            if db:
-                cursor = db.cursor(dictionary=True)
-                if params:
-                    cursor.execute(query, params)
-                else:
-                    cursor.execute(query)
-                
-                result = cursor.fetchall()
-                db.commit()
-                cursor.close()
-                db.close()
-                return result
+            return database.fetch_all(query, params, dictionary=True)
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", str(e))
         return None
@@ -229,9 +228,13 @@ class CustomDatePicker:
 
 # Admin Dashboard Class
 class AdminDashboard:
-    def __init__(self, root, user_id):
+    def __init__(self, root, user_id, router=None):
         self.root = root
         self.current_user_id = user_id
+        # Screen router of the app window (None when run on its own)
+        self.router = router
+        # after() ids of the periodic jobs, cancelled by close()
+        self.timers = {}
         self.root.title("Tourism Information System - Admin Dashboard")
         self.root.geometry("900x500")
         self.root.resizable(True, True)
@@ -302,9 +305,26 @@ class AdminDashboard:
             
         # Track current active page
         self.current_page = None
-        # Main Content Frame
-        self.content_frame = ttk.Frame(self.root)
-        self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        
+        # Builds the cards of the feedback list while it fills in
+        self.feedback_renderer = None
+        
+        # Background worker for database queries (results are delivered on the Tk thread)
+        self.queries = QueryService(self.root)
+        
+        # Main Content Frame; every page is built into its own frame inside it
+        self.page_container = ttk.Frame(self.root)
+        self.page_container.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        self.content_frame = self.page_container
+
+        # Built pages stay alive (hidden) while switching; stale ones reload only their data
+        self.pages = PageCache(self.page_container, self.build_page, self.set_content_frame, {
+            "Dashboard": (dashboard_stats.STATS_CACHE_TTL, self.load_dashboard_stats),
+            "Manage Places": (LIST_PAGE_MAX_AGE, lambda: self.places_pager.reload()),
+            "Manage Events": (LIST_PAGE_MAX_AGE, lambda: self.events_pager.reload()),
+            "User Management": (LIST_PAGE_MAX_AGE, lambda: self.users_pager.reload()),
+            "Feedback": (LIST_PAGE_MAX_AGE, self.refresh_feedback),
+        })
         
         # Default Page
         self.show_page("Dashboard")
@@ -320,10 +340,19 @@ class AdminDashboard:
                 self.logout()
                 return
         # Check again after 1 minute
-        self.root.after(60000, self.check_session_timeout)
+        self.timers["session"] = self.root.after(60000, self.check_session_timeout)
+
+    def close(self):
+        """Stop the periodic jobs and background work (the pool and caches stay for the next login)."""
+        for after_id in self.timers.values():
+            self.root.after_cancel(after_id)
+        self.timers.clear()
+        self.cancel_feedback_render()
+        self.queries.shutdown()
+        live_search.log_stats()
 
     def show_page(self, page):
-        """Clears the content frame and displays the selected page."""
+        """Displays the selected page, reusing it if it was built before."""
         # Reset all buttons to default style
         for item, btn in self.menu_buttons.items():
             if item == page:
@@ -333,13 +362,21 @@ class AdminDashboard:
                 # Set inactive buttons to blue with white text
                 btn.config(style="CustomBlue.TButton")
         
+        # A feedback list still filling in is not finished in the background; it reloads on return
+        if self.current_page == "Feedback" and page != "Feedback" and self.cancel_feedback_render():
+            self.pages.invalidate("Feedback")
+        
         # Update current page tracker
         self.current_page = page
-        
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        ttk.Label(self.content_frame, text=page, font=("Arial", 24, "bold")).pack(pady=20)
+        self.pages.show(page)
+
+    def set_content_frame(self, frame):
+        """Point the page methods at the frame of the page being built or shown."""
+        self.content_frame = frame
+
+    def build_page(self, page, frame):
+        """Build a page into its (new) frame."""
+        ttk.Label(frame, text=page, font=("Arial", 24, "bold")).pack(pady=20)
         
         # Display page content
         if page == "Dashboard":
@@ -366,17 +403,51 @@ class AdminDashboard:
         stats_container.columnconfigure(2, weight=1)
         stats_container.columnconfigure(3, weight=1)
 
-        # Fetch Dashboard Statistics
-        places_count = DatabaseManager.get_count('places')
-        events_count = DatabaseManager.get_count('events')
-        reviews_count = DatabaseManager.get_count('reviews')
-        users_count = DatabaseManager.get_count('user_accounts')
+        # Create Statistic Cards in a grid layout; the numbers are filled in once the statistics arrive
+        self.stat_cards = {
+            "places": self.create_stat_card(stats_container, "TOTAL PLACES", "…", "🏢", self.colors['places'], 0, 0),
+            "events": self.create_stat_card(stats_container, "TOTAL EVENTS", "…", "📅", self.colors['events'], 0, 1),
+            "reviews": self.create_stat_card(stats_container, "TOTAL REVIEWS", "…", "⭐", self.colors['reviews'], 0, 2),
+            "users": self.create_stat_card(stats_container, "TOTAL USERS", "…", "👥", self.colors['users'], 0, 3),
+        }
+        self.load_dashboard_stats()
+
+    def load_dashboard_stats(self):
+        # Fetch Dashboard Statistics: free when cached, otherwise one aggregate query in the background
+        stats = dashboard_stats.cached_stats()
+        if stats is not None:
+            self.show_dashboard_stats(stats)
+        else:
+            self.queries.submit(dashboard_stats.get_stats, on_success=self.show_dashboard_stats,
+                                on_error=lambda e: messagebox.showerror("Database Error", str(e)),
+                                tag="dashboard_stats")
+
+    def show_dashboard_stats(self, stats):
+        """Fill the statistic cards with totals and their status breakdown"""
+        for entity, (value_label, detail_label) in self.stat_cards.items():
+            if not value_label.winfo_exists():
+                return
+            counts = stats[entity]
+            value_label.configure(text=str(counts["total"]))
+            detail_label.configure(text=" · ".join(
+                f"{counts[status]} {status}" for status in dashboard_stats.STATUS_ORDER[entity] if counts.get(status)
+            ))
+
+    def data_changed(self, table, row_id=None):
+        """Forget cached counts after rows of a table were added, deleted or changed status.
 
-        # Create Statistic Cards in a grid layout
-        self.create_stat_card(stats_container, "TOTAL PLACES", places_count, "🏢", self.colors['places'], 0, 0)
-        self.create_stat_card(stats_container, "TOTAL EVENTS", events_count, "📅", self.colors['events'], 0, 1)
-        self.create_stat_card(stats_container, "TOTAL REVIEWS", reviews_count, "⭐", self.colors['reviews'], 0, 2)
-        self.create_stat_card(stats_container, "TOTAL USERS", users_count, "👥", self.colors['users'], 0, 3)
+        row_id is the place/event written; it goes straight into the search suggestions
+        and the fuzzy name index instead of waiting for their next refresh.
+        """
+        invalidate_counts(table)
+        dashboard_stats.invalidate()
+        self.pages.invalidate("Dashboard")
+        if row_id is None or table not in ("places", "events"):
+            return
+        on_error = lambda e: logging.error(f"❌ Error updating the search indexes: {e}")
+        self.queries.submit(autocomplete.apply_row, table, row_id, on_error=on_error)
+        if table == "places":
+            self.queries.submit(fuzzy.apply_row, row_id, on_error=on_error)
 
     def create_stat_card(self, parent, title, value, icon, color, row, col):
         # Card frame with colored background
@@ -393,13 +464,14 @@ class AdminDashboard:
         ).pack(side=tk.TOP, pady=(0, 10))
         
         # Value with larger font for emphasis
-        ttk.Label(
+        value_label = ttk.Label(
             card,
             text=str(value),
             font=("Arial", 32, "bold"),
             bootstyle=f"inverse-{color}",
             anchor="center"
-        ).pack(side=tk.TOP, pady=5)
+        )
+        value_label.pack(side=tk.TOP, pady=5)
         
         # Title with improved positioning
         ttk.Label(
@@ -409,6 +481,18 @@ class AdminDashboard:
             bootstyle=f"inverse-{color}",
             anchor="center"
         ).pack(side=tk.TOP)
+        
+        # Breakdown by status (e.g. "12 approved · 3 pending")
+        detail_label = ttk.Label(
+            card,
+            text="",
+            font=("Arial", 9),
+            bootstyle=f"inverse-{color}",
+            anchor="center"
+        )
+        detail_label.pack(side=tk.TOP, pady=(5, 0))
+        
+        return value_label, detail_label
 
     def manage_places_page(self):
         """Create the manage places page inside the content frame"""
@@ -427,8 +511,8 @@ class AdminDashboard:
         
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 10))
         
-        self.search_var = tk.StringVar()
-        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
+        self.place_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.place_search_var, width=30)
         search_entry.pack(side=tk.LEFT, padx=(0, 10))
         
         search_btn = ttk.Button(search_frame, text="Search", bootstyle="info",
@@ -436,21 +520,21 @@ class AdminDashboard:
         search_btn.pack(side=tk.LEFT)
         
         # Header buttons frame (right side)
-        self.header_buttons_frame = ttk.Frame(top_controls_frame)
-        self.header_buttons_frame.pack(side=tk.RIGHT)
+        self.place_header_buttons_frame = ttk.Frame(top_controls_frame)
+        self.place_header_buttons_frame.pack(side=tk.RIGHT)
         
         # Add Pending Places button (gray color)
-        self.pending_button = ttk.Button(
-            self.header_buttons_frame,
+        self.place_pending_button = ttk.Button(
+            self.place_header_buttons_frame,
             text="View Place Requests",
             style="secondary.TButton",  # Using secondary style for gray color
             command=self.show_pending_places_modal
         )
-        self.pending_button.pack(side=tk.LEFT, padx=5)
+        self.place_pending_button.pack(side=tk.LEFT, padx=5)
         
         # Add Place button (green color)
         add_btn = ttk.Button(
-            self.header_buttons_frame,
+            self.place_header_buttons_frame,
             text="Add New Place",
             bootstyle="success",
             command=self.open_add_place_modal
@@ -465,8 +549,8 @@ class AdminDashboard:
         category_frame = ttk.Frame(filter_frame)
         category_frame.pack(side=tk.LEFT)
         ttk.Label(category_frame, text="Category:").pack(side=tk.LEFT, padx=5)
-        self.category_filter_var = tk.StringVar()
-        self.category_filter = ttk.Combobox(category_frame, textvariable=self.category_filter_var, width=15)
+        self.place_category_var = tk.StringVar()
+        self.category_filter = ttk.Combobox(category_frame, textvariable=self.place_category_var, width=15)
         self.category_filter['values'] = ["All"] + self.categories
         self.category_filter.current(0)  # Set default to "All"
         self.category_filter['state'] = 'readonly'  # Make it non-editable
@@ -474,12 +558,12 @@ class AdminDashboard:
         # Bind the combobox to filter on selection
         self.category_filter.bind("<<ComboboxSelected>>", lambda event: self.filter_places_by_category())
         
-        self.table_frame = ttk.Frame(places_frame)
-        self.table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.places_table_frame = ttk.Frame(places_frame)
+        self.places_table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        scroll_y = ttk.Scrollbar(self.table_frame, orient=tk.VERTICAL)
+        scroll_y = ttk.Scrollbar(self.places_table_frame, orient=tk.VERTICAL)
         
-        self.places_table = ttk.Treeview(self.table_frame,
+        self.places_table = ttk.Treeview(self.places_table_frame,
                                       columns=("id", "name", "location", "category", "actions"),
                                       yscrollcommand=scroll_y.set, selectmode="browse")
         
@@ -501,6 +585,10 @@ class AdminDashboard:
         
         self.places_table.pack(fill=tk.BOTH, expand=True)
         
+        # Rows are fetched a page at a time as the table is scrolled
+        self.places_pager = TreePager(self.places_table, scroll_y, self.queries, self.format_place_row,
+                                      places_frame, "Failed to fetch places", tag="places_table")
+        
         self.load_places()
         
         search_entry.bind("<Return>", lambda event: self.search_places())
@@ -508,38 +596,14 @@ class AdminDashboard:
         
     def filter_places_by_category(self):
         """Filter places by selected category"""
-        selected_category = self.category_filter_var.get()
+        selected_category = self.place_category_var.get()
         
         # If "All" is selected, just load all places
         if selected_category == "All":
             self.load_places()
             return
         
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                cursor.execute("SELECT id, name, location, category FROM places WHERE category = %s AND date_deleted IS NULL",
-                             (selected_category,))
-                filtered_places = cursor.fetchall()
-                
-                for item in self.places_table.get_children():
-                    self.places_table.delete(item)
-                
-                for place in filtered_places:
-                    self.places_table.insert("", tk.END, values=(
-                        place[0],            
-                        place[1],            
-                        place[2],            
-                        place[3],            
-                        "Edit / Delete"      
-                    ))
-                
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to filter places: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()
+        self.places_pager.load(self.places_query(["category = %s"], [selected_category]))
         
     def handle_place_table_click(self, event):
         """Handle click events on the places table"""
@@ -550,7 +614,7 @@ class AdminDashboard:
             column_index = int(column[1:]) - 1
             
             selected_item = self.places_table.focus()
-            if not selected_item:
+            if not selected_item or "loading" in self.places_table.item(selected_item, "tags"):
                 return
                 
             item_values = self.places_table.item(selected_item, "values")
@@ -566,75 +630,49 @@ class AdminDashboard:
                 finally:
                     popup.grab_release()
 
+    def places_query(self, where=(), params=()):
+        """Keyset query over the places that aren't deleted, in id order"""
+        return KeysetQuery("id, name, location, category", "places",
+                           order=[("id", "ASC", 0)],
+                           where=["date_deleted IS NULL"] + list(where), params=params)
+
     def load_places(self):
         """Load places into the table"""
-        for item in self.places_table.get_children():
-            self.places_table.delete(item)
-        
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                cursor.execute("SELECT id, name, location, category FROM places WHERE date_deleted IS NULL")
-                places = cursor.fetchall()
-                
-                for place in places:
-                    self.places_table.insert("", tk.END, values=(
-                        place[0],            
-                        place[1],            
-                        place[2],            
-                        place[3],            
-                        "Edit / Delete"      
-                    ))
-                    
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to fetch places: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()  
+        self.places_pager.load(self.places_query())
 
     def search_places(self):
         """Search places by name"""
-        search_term = self.search_var.get().lower()
-        selected_category = self.category_filter_var.get()
+        search_term = self.place_search_var.get().lower()
+        selected_category = self.place_category_var.get()
         
         if search_term == "" and selected_category == "All":
             self.load_places()
             return
         
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                if selected_category == "All":
-                    # Search without category filter
-                    cursor.execute("SELECT id, name, location, category FROM places WHERE LOWER(name) LIKE %s AND date_deleted IS NULL",
-                                 (f"%{search_term}%",))
-                else:
-                    # Search with category filter
-                    cursor.execute("SELECT id, name, location, category FROM places WHERE LOWER(name) LIKE %s AND category = %s AND date_deleted IS NULL",
-                                 (f"%{search_term}%", selected_category))
-                    
-                filtered_places = cursor.fetchall()
-                
-                for item in self.places_table.get_children():
-                    self.places_table.delete(item)
-                
-                for place in filtered_places:
-                    self.places_table.insert("", tk.END, values=(
-                        place[0],            
-                        place[1],            
-                        place[2],            
-                        place[3],            
-                        "Edit / Delete"      
-                    ))
-                
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to search places: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()
+        where = ["date_deleted IS NULL"]
+        params = []
+        if selected_category != "All":
+            # Search with category filter
+            where.append("category = %s")
+            params.append(selected_category)
         
+        if search_term == "":
+            self.places_pager.load(self.places_query(where[1:], params))
+        else:
+            # Full-text search, best matches first; similarly spelled names when nothing matches
+            self.places_pager.load(FuzzyFallbackQuery(SearchQuery("places", "id, name, location, category",
+                                                                  search_term, where, params)))
+
+    def format_place_row(self, place):
+        """Treeview values for a places row"""
+        return (
+            place[0],            
+            place[1],            
+            place[2],            
+            place[3],            
+            "Edit / Delete"      
+        )
+
     def open_add_place_modal(self):
         """Open modal window for adding a new place"""
         self.add_window = tk.Toplevel(self.root)
@@ -733,9 +771,7 @@ class AdminDashboard:
                 continue
                 
             try:
-                img = Image.open(path)
-                img.thumbnail((80, 80))
-                photo_img = ImageTk.PhotoImage(img)
+                photo_img = image_cache.get_photo(path, (80, 80), fit=True)
                 
                 img_frame = ttk.Frame(preview_frame)
                 img_frame.pack(side=tk.LEFT, padx=5, pady=5)
@@ -808,8 +844,8 @@ class AdminDashboard:
             try:
                 # Modified to include status='approved' since this is an admin adding the place
                 sql = """INSERT INTO places (user_id, name, description, category, location, image, date_created, status)
-                         VALUES (%s, %s, %s, %s, %s, %s, %s, 'approved')"""
-                cursor.execute(sql, (self.current_user_id, name, description, category, location, image_path, datetime.now()))
+                         VALUES (%s, %s, %s, %s, %s, %s, NOW(), 'approved')"""
+                cursor.execute(sql, (self.current_user_id, name, description, category, location, image_path))
                 db.commit()
                 new_id = cursor.lastrowid
             except mysql.connector.Error as e:
@@ -822,8 +858,13 @@ class AdminDashboard:
         else:
             return
         
+        # Render the card/list sizes now so the first visitor doesn't pay for the full-size decode
+        if image_path:
+            thumbnails.prewarm_async(resource_path(image_path), thumbnails.PLACE_SIZES)
+        
         self.add_window.destroy()
-        self.load_places()
+        self.data_changed("places", new_id)
+        self.places_pager.reload()
         messagebox.showinfo("Success", "Place added successfully!")
    
     def open_edit_place_modal(self, place_id):
@@ -963,10 +1004,10 @@ class AdminDashboard:
             try:
                 sql = """UPDATE places
                          SET name = %s, description = %s, category = %s, location = %s,
-                         image = %s, date_modified = %s
+                         image = %s, date_modified = NOW()
                          WHERE id = %s"""
                 cursor.execute(sql, (name, description, category, location,
-                                   image_path, datetime.now(), self.edit_place_id))
+                                   image_path, self.edit_place_id))
                 db.commit()
             except mysql.connector.Error as e:
                 db.rollback()
@@ -978,8 +1019,12 @@ class AdminDashboard:
         else:
             return
         
+        if image_path:
+            thumbnails.prewarm_async(resource_path(image_path), thumbnails.PLACE_SIZES)
+        
         self.edit_window.destroy()
-        self.load_places()
+        self.data_changed("places", self.edit_place_id)
+        self.places_pager.reload()
         messagebox.showinfo("Success", "Place updated successfully!")
    
     def delete_place(self, place_id):
@@ -991,9 +1036,8 @@ class AdminDashboard:
             if db:
                 cursor = db.cursor()
                 try:
-                    sql = "UPDATE places SET status = 'rejected', date_deleted = %s WHERE id = %s"
-                    now = datetime.now()
-                    cursor.execute(sql, (now, place_id))
+                    sql = "UPDATE places SET status = 'rejected', date_deleted = NOW() WHERE id = %s"
+                    cursor.execute(sql, (place_id,))
                     db.commit()
                 except mysql.connector.Error as e:
                     db.rollback()
@@ -1005,7 +1049,8 @@ class AdminDashboard:
             else:
                 return
             
-            self.load_places()
+            self.data_changed("places", place_id)
+            self.places_pager.reload()
             messagebox.showinfo("Success", "Place deleted successfully!")
         
     def show_pending_places_modal(self):
@@ -1057,17 +1102,17 @@ class AdminDashboard:
             scrollbar.pack(side="right", fill="y")
             canvas.pack(side="left", fill="both", expand=True)
             
-            # Create a frame inside the canvas
+            # Create a frame inside the canvas; the scroll region follows it as cards are added
             content_frame = tk.Frame(canvas)
             canvas.create_window((0, 0), window=content_frame, anchor="nw")
+            content_frame.bind("<Configure>", lambda e: canvas.config(scrollregion=canvas.bbox("all")))
             
-            # Display pending places
-            for i, place in enumerate(pending_places):
-                self.create_pending_place_card(content_frame, place, i)
-            
-            # Update the canvas scroll region
-            content_frame.update_idletasks()
-            canvas.config(scrollregion=canvas.bbox("all"))
+            # Display pending places a batch at a time (building stops if the modal is closed)
+            ChunkedRenderer(content_frame, pending_places,
+                            lambda place, i: self.create_pending_place_card(content_frame, place, i),
+                            on_progress=lambda done, total: header_label.config(
+                                text=f"Pending Place Submissions ({done} of {total})" if done < total else "Pending Place Submissions")
+                            ).start()
             
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to fetch pending places: {str(e)}")
@@ -1205,9 +1250,9 @@ class AdminDashboard:
             cursor.execute("""
                 UPDATE places
                 SET status = 'approved',
-                    date_modified = %s
+                    date_modified = NOW()
                 WHERE id = %s
-            """, (datetime.now(), place_id))
+            """, (place_id,))
             
             db.commit()
             messagebox.showinfo("Success", "Place approved successfully!")
@@ -1215,7 +1260,8 @@ class AdminDashboard:
             # Close the modal and refresh the places list
             if hasattr(self, 'pending_places_modal') and self.pending_places_modal.winfo_exists():
                 self.pending_places_modal.destroy()
-            self.load_places()
+            self.data_changed("places", place_id)
+            self.places_pager.reload()
             
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to approve place: {str(e)}")
@@ -1239,9 +1285,9 @@ class AdminDashboard:
             cursor.execute("""
                 UPDATE places
                 SET status = 'rejected',
-                    date_deleted = %s
+                    date_deleted = NOW()
                 WHERE id = %s
-            """, (datetime.now(), place_id))
+            """, (place_id,))
             
             db.commit()
             messagebox.showinfo("Success", "Place rejected and deleted successfully!")
@@ -1249,7 +1295,8 @@ class AdminDashboard:
             # Close the modal and refresh the places list
             if hasattr(self, 'pending_places_modal') and self.pending_places_modal.winfo_exists():
                 self.pending_places_modal.destroy()
-            self.load_places()
+            self.data_changed("places", place_id)
+            self.places_pager.reload()
             
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to reject place: {str(e)}")
@@ -1272,8 +1319,8 @@ class AdminDashboard:
         
         ttk.Label(search_frame, text="Search").pack(side=tk.LEFT, padx=(0, 10))
         
-        self.search_var = tk.StringVar()
-        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=30)
+        self.event_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.event_search_var, width=30)
         search_entry.pack(side=tk.LEFT, padx=(0, 10))
         
         search_btn = ttk.Button(search_frame, text="Search", bootstyle="info",
@@ -1281,21 +1328,21 @@ class AdminDashboard:
         search_btn.pack(side=tk.LEFT)
         
         # Header buttons frame (right side)
-        self.header_buttons_frame = ttk.Frame(top_controls_frame)
-        self.header_buttons_frame.pack(side=tk.RIGHT)
+        self.event_header_buttons_frame = ttk.Frame(top_controls_frame)
+        self.event_header_buttons_frame.pack(side=tk.RIGHT)
         
         # Add Pending Events button (gray color)
-        self.pending_button = ttk.Button(
-            self.header_buttons_frame,
+        self.event_pending_button = ttk.Button(
+            self.event_header_buttons_frame,
             text="View Event Requests",
             style="secondary.TButton",  # Using secondary style for gray color
             command=self.show_pending_modal
         )
-        self.pending_button.pack(side=tk.LEFT, padx=5)
+        self.event_pending_button.pack(side=tk.LEFT, padx=5)
         
         # Add Event button (green color)
         add_btn = ttk.Button(
-            self.header_buttons_frame,
+            self.event_header_buttons_frame,
             text="Add New Event",
             bootstyle="success",
             command=self.open_add_modal
@@ -1324,8 +1371,8 @@ class AdminDashboard:
         category_frame.pack(side=tk.LEFT)
         
         ttk.Label(category_frame, text="Event Type:").pack(side=tk.LEFT, padx=(0, 5))
-        self.category_filter_var = tk.StringVar(value="All")
-        category_combo = ttk.Combobox(category_frame, textvariable=self.category_filter_var,
+        self.event_category_var = tk.StringVar(value="All")
+        category_combo = ttk.Combobox(category_frame, textvariable=self.event_category_var,
                                     values=["All", "Festival", "Concert", "Exhibition", "Sports", "Conference", "Workshop"],
                                     state="readonly", width=12)
         category_combo.pack(side=tk.LEFT, padx=(0, 10))
@@ -1336,13 +1383,13 @@ class AdminDashboard:
         apply_btn.pack(side=tk.LEFT)
         
         # Create table with correct column order
-        self.table_frame = ttk.Frame(events_frame)
-        self.table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.events_table_frame = ttk.Frame(events_frame)
+        self.events_table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        scroll_y = ttk.Scrollbar(self.table_frame, orient=tk.VERTICAL)
+        scroll_y = ttk.Scrollbar(self.events_table_frame, orient=tk.VERTICAL)
         
         # Updated column order: ID, Event Name, Category, Date, Time, Location, Actions
-        self.events_table = ttk.Treeview(self.table_frame, 
+        self.events_table = ttk.Treeview(self.events_table_frame, 
                                         columns=("id", "name", "category", "date", "time", "location", "actions"),
                                         yscrollcommand=scroll_y.set, selectmode="browse")
         
@@ -1371,6 +1418,10 @@ class AdminDashboard:
         
         self.events_table.pack(fill=tk.BOTH, expand=True)
         
+        # Rows are fetched a page at a time as the table is scrolled
+        self.events_pager = TreePager(self.events_table, scroll_y, self.queries, self.format_event_row,
+                                      events_frame, "Failed to fetch events", tag="events_table")
+        
         # Load events
         self.load_events()
         
@@ -1387,7 +1438,7 @@ class AdminDashboard:
             column_index = int(column[1:]) - 1
             
             selected_item = self.events_table.focus()
-            if not selected_item:
+            if not selected_item or "loading" in self.events_table.item(selected_item, "tags"):
                 return
                 
             item_values = self.events_table.item(selected_item, "values")
@@ -1403,114 +1454,35 @@ class AdminDashboard:
                 finally:
                     popup.grab_release()
 
+    def events_query(self, where=(), params=()):
+        """Keyset query over the events that aren't deleted, latest date first"""
+        return KeysetQuery("id, name, category, date, time, location", "events",
+                           order=[("date", "DESC", 3), ("time", "ASC", 4), ("id", "ASC", 0)],
+                           where=["date_deleted IS NULL"] + list(where), params=params)
+
     def load_events(self):
         """Load events into the table with the correct column order"""
-        # Clear existing items
-        for item in self.events_table.get_children():
-            self.events_table.delete(item)
-        
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                cursor.execute("""
-                    SELECT id, name, category, date, time, location 
-                    FROM events 
-                    WHERE date_deleted IS NULL
-                    ORDER BY date DESC, time ASC
-                """)
-                events = cursor.fetchall()
-                
-                for event in events:
-                    # Format date and time for display
-                    if event[3]:  # Check if date is not None
-                        event_date = datetime.strptime(str(event[3]), '%Y-%m-%d').strftime('%Y-%m-%d')
-                    else:
-                        event_date = "N/A"
-                    
-                    if event[4]:  # Check if time is not None
-                        event_time = datetime.strptime(str(event[4]), '%H:%M:%S').strftime('%I:%M %p')
-                    else:
-                        event_time = "N/A"
-                    
-                    # Insert with correct column order: ID, Event Name, Category, Date, Time, Location, Actions
-                    self.events_table.insert("", tk.END, values=(
-                        event[0],             # ID
-                        event[1],             # Name
-                        event[2],             # Category
-                        event_date,           # Date
-                        event_time,           # Time
-                        event[5],             # Location
-                        "Edit / Delete"       # Actions
-                    ))
-                    
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to fetch events: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()
+        self.events_pager.load(self.events_query())
 
     def search_events(self):
         """Search events by name"""
-        search_term = self.search_var.get().lower()
+        search_term = self.event_search_var.get().lower()
         
         if search_term == "":
             self.load_events()
             return
         
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                cursor.execute("""
-                    SELECT id, name, category, date, time, location 
-                    FROM events 
-                    WHERE LOWER(name) LIKE %s AND date_deleted IS NULL
-                    ORDER BY date DESC, time ASC
-                """, (f"%{search_term}%",))
-                
-                events = cursor.fetchall()
-                
-                # Clear existing items
-                for item in self.events_table.get_children():
-                    self.events_table.delete(item)
-                
-                for event in events:
-                    # Format date and time for display
-                    if event[3]:  # Check if date is not None
-                        event_date = datetime.strptime(str(event[3]), '%Y-%m-%d').strftime('%Y-%m-%d')
-                    else:
-                        event_date = "N/A"
-                    
-                    if event[4]:  # Check if time is not None
-                        event_time = datetime.strptime(str(event[4]), '%H:%M:%S').strftime('%I:%M %p')
-                    else:
-                        event_time = "N/A"
-                    
-                    # Insert with correct column order
-                    self.events_table.insert("", tk.END, values=(
-                        event[0],             # ID
-                        event[1],             # Name
-                        event[2],             # Category
-                        event_date,           # Date
-                        event_time,           # Time
-                        event[5],             # Location
-                        "Edit / Delete"       # Actions
-                    ))
-                
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to search events: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()
+        # Full-text search, best matches first
+        self.events_pager.load(SearchQuery("events", "id, name, category, date, time, location", search_term,
+                                           where=["date_deleted IS NULL"]))
 
     def filter_events(self):
         """Filter events by date and category"""
         selected_date = self.filter_date.get_date()
-        selected_category = self.category_filter_var.get()
+        selected_category = self.event_category_var.get()
         
         # Build WHERE clause based on filters
-        where_clauses = ["date_deleted IS NULL"]
+        where_clauses = []
         params = []
         
         if selected_date:
@@ -1521,54 +1493,31 @@ class AdminDashboard:
             where_clauses.append("category = %s")
             params.append(selected_category)
         
-        where_clause = " AND ".join(where_clauses) if where_clauses else "1"
+        self.events_pager.load(self.events_query(where_clauses, params))
+
+    def format_event_row(self, event):
+        """Treeview values for an events row"""
+        # Format date and time for display
+        if event[3]:  # Check if date is not None
+            event_date = datetime.strptime(str(event[3]), '%Y-%m-%d').strftime('%Y-%m-%d')
+        else:
+            event_date = "N/A"
         
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                query = f"""
-                    SELECT id, name, category, date, time, location 
-                    FROM events 
-                    WHERE {where_clause}
-                    ORDER BY date DESC, time ASC
-                """
-                cursor.execute(query, tuple(params))
-                
-                events = cursor.fetchall()
-                
-                # Clear existing items
-                for item in self.events_table.get_children():
-                    self.events_table.delete(item)
-                
-                for event in events:
-                    # Format date and time for display
-                    if event[3]:  # Check if date is not None
-                        event_date = datetime.strptime(str(event[3]), '%Y-%m-%d').strftime('%Y-%m-%d')
-                    else:
-                        event_date = "N/A"
-                    
-                    if event[4]:  # Check if time is not None
-                        event_time = datetime.strptime(str(event[4]), '%H:%M:%S').strftime('%I:%M %p')
-                    else:
-                        event_time = "N/A"
-                    
-                    # Insert with correct column order
-                    self.events_table.insert("", tk.END, values=(
-                        event[0],             # ID
-                        event[1],             # Name
-                        event[2],             # Category
-                        event_date,           # Date
-                        event_time,           # Time
-                        event[5],             # Location
-                        "Edit / Delete"       # Actions
-                    ))
-                
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to filter events: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()
+        if event[4]:  # Check if time is not None
+            event_time = datetime.strptime(str(event[4]), '%H:%M:%S').strftime('%I:%M %p')
+        else:
+            event_time = "N/A"
+        
+        # Correct column order: ID, Event Name, Category, Date, Time, Location, Actions
+        return (
+            event[0],             # ID
+            event[1],             # Name
+            event[2],             # Category
+            event_date,           # Date
+            event_time,           # Time
+            event[5],             # Location
+            "Edit / Delete"       # Actions
+        )
 
     def open_add_modal(self):
         """Open modal window for adding a new event"""
@@ -1729,9 +1678,7 @@ class AdminDashboard:
                 continue
                 
             try:
-                img = Image.open(path)
-                img.thumbnail((80, 80))
-                photo_img = ImageTk.PhotoImage(img)
+                photo_img = image_cache.get_photo(path, (80, 80), fit=True)
                 
                 img_frame = ttk.Frame(preview_frame)
                 img_frame.pack(side=tk.LEFT, padx=5, pady=5)
@@ -1825,7 +1772,7 @@ class AdminDashboard:
                 cursor.execute("""
                     INSERT INTO events (user_id, name, description, location, date, time, image, 
                                       category, is_free, date_created, status)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, 'approved')
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), 'approved')
                 """, (
                     self.current_user_id,
                     event_name,
@@ -1835,14 +1782,18 @@ class AdminDashboard:
                     event_time,
                     image_path,
                     event_category,
-                    is_free,
-                    datetime.now()
+                    is_free
                 ))
                 
                 db.commit()
+                # Render the card/detail sizes now so the first visitor doesn't pay for the full-size decode
+                if image_path:
+                    thumbnails.prewarm_async(os.path.join(os.path.dirname(os.path.abspath(__file__)), image_path),
+                                             thumbnails.EVENT_SIZES)
                 messagebox.showinfo("Success", "Event added successfully!")
                 self.add_window.destroy()
-                self.load_events()
+                self.data_changed("events", cursor.lastrowid)
+                self.events_pager.reload()
                 
             except mysql.connector.Error as e:
                 messagebox.showerror("Database Error", f"Failed to save event: {str(e)}")
@@ -2095,7 +2046,7 @@ class AdminDashboard:
                         image = %s,
                         category = %s,
                         is_free = %s,
-                        date_modified = %s
+                        date_modified = NOW()
                     WHERE id = %s
                 """, (
                     event_name,
@@ -2106,14 +2057,17 @@ class AdminDashboard:
                     image_path,
                     event_category,
                     is_free,
-                    datetime.now(),
                     self.edit_id
                 ))
                 
                 db.commit()
+                if image_path:
+                    thumbnails.prewarm_async(os.path.join(os.path.dirname(os.path.abspath(__file__)), image_path),
+                                             thumbnails.EVENT_SIZES)
                 messagebox.showinfo("Success", "Event updated successfully!")
                 self.edit_window.destroy()
-                self.load_events()
+                self.data_changed("events", self.edit_id)
+                self.events_pager.reload()
                 
             except mysql.connector.Error as e:
                 messagebox.showerror("Database Error", f"Failed to update event: {str(e)}")
@@ -2131,16 +2085,16 @@ class AdminDashboard:
         if db:
             cursor = db.cursor()
             try:
-                now = datetime.now()
                 cursor.execute("""
                     UPDATE events 
-                    SET status = 'rejected', date_deleted = %s
+                    SET status = 'rejected', date_deleted = NOW()
                     WHERE id = %s
-                """, (now, event_id))
+                """, (event_id,))
         
                 db.commit()
                 messagebox.showinfo("Success", "Event deleted successfully!")
-                self.load_events()
+                self.data_changed("events", event_id)
+                self.events_pager.reload()
         
             except mysql.connector.Error as e:
                 messagebox.showerror("Database Error", f"Failed to delete event: {str(e)}")
@@ -2197,17 +2151,17 @@ class AdminDashboard:
             scrollbar.pack(side="right", fill="y")
             canvas.pack(side="left", fill="both", expand=True)
             
-            # Create a frame inside the canvas
+            # Create a frame inside the canvas; the scroll region follows it as cards are added
             content_frame = tk.Frame(canvas)
             canvas.create_window((0, 0), window=content_frame, anchor="nw")
+            content_frame.bind("<Configure>", lambda e: canvas.config(scrollregion=canvas.bbox("all")))
             
-            # Display pending events
-            for i, event in enumerate(pending_events):
-                self.create_pending_event_card(content_frame, event, i)
-            
-            # Update the canvas scroll region
-            content_frame.update_idletasks()
-            canvas.config(scrollregion=canvas.bbox("all"))
+            # Display pending events a batch at a time (building stops if the modal is closed)
+            ChunkedRenderer(content_frame, pending_events,
+                            lambda event, i: self.create_pending_event_card(content_frame, event, i),
+                            on_progress=lambda done, total: header_label.config(
+                                text=f"Pending Event Submissions ({done} of {total})" if done < total else "Pending Event Submissions")
+                            ).start()
             
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to fetch pending events: {str(e)}")
@@ -2351,9 +2305,9 @@ class AdminDashboard:
             cursor.execute("""
                 UPDATE events 
                 SET status = 'approved', 
-                    date_modified = %s
+                    date_modified = NOW()
                 WHERE id = %s
-            """, (datetime.now(), event_id))
+            """, (event_id,))
             
             db.commit()
             messagebox.showinfo("Success", "Event approved successfully!")
@@ -2361,7 +2315,8 @@ class AdminDashboard:
             # Close the modal and refresh the events list
             if hasattr(self, 'pending_modal') and self.pending_modal.winfo_exists():
                 self.pending_modal.destroy()
-            self.load_events()
+            self.data_changed("events", event_id)
+            self.events_pager.reload()
             
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to approve event: {str(e)}")
@@ -2385,9 +2340,9 @@ class AdminDashboard:
             cursor.execute("""
                 UPDATE events 
                 SET status = 'rejected',
-                    date_deleted = %s
+                    date_deleted = NOW()
                 WHERE id = %s
-            """, (datetime.now(), event_id))
+            """, (event_id,))
             
             db.commit()
             messagebox.showinfo("Success", "Event rejected and deleted successfully!")
@@ -2395,7 +2350,8 @@ class AdminDashboard:
             # Close the modal and refresh the events list
             if hasattr(self, 'pending_modal') and self.pending_modal.winfo_exists():
                 self.pending_modal.destroy()
-            self.load_events()
+            self.data_changed("events", event_id)
+            self.events_pager.reload()
             
         except mysql.connector.Error as e:
             messagebox.showerror("Database Error", f"Failed to reject event: {str(e)}")
@@ -2440,16 +2396,16 @@ class AdminDashboard:
                           values=self.roles, width=15, state="readonly")
         role_combo.pack(side=tk.LEFT, padx=5)
         
-        self.table_frame = ttk.Frame(users_frame)
-        self.table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+        self.users_table_frame = ttk.Frame(users_frame)
+        self.users_table_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
         # Vertical Scrollbar
-        scroll_y = ttk.Scrollbar(self.table_frame, orient=tk.VERTICAL)
+        scroll_y = ttk.Scrollbar(self.users_table_frame, orient=tk.VERTICAL)
         
         # Horizontal Scrollbar
-        scroll_x = ttk.Scrollbar(self.table_frame, orient=tk.HORIZONTAL)
+        scroll_x = ttk.Scrollbar(self.users_table_frame, orient=tk.HORIZONTAL)
         
-        self.users_table = ttk.Treeview(self.table_frame, 
+        self.users_table = ttk.Treeview(self.users_table_frame, 
                                  columns=("id", "username", "address", "email", "phone", "role", "status", "last_login", "actions"),
                                  yscrollcommand=scroll_y.set, xscrollcommand=scroll_x.set, selectmode="browse")
         
@@ -2483,8 +2439,15 @@ class AdminDashboard:
         
         self.users_table.pack(fill=tk.BOTH, expand=True)
         
+        # Rows are fetched a page at a time as the table is scrolled
+        self.users_pager = TreePager(self.users_table, scroll_y, self.queries, self.format_user_row,
+                                     users_frame, "Failed to fetch users", tag="users_table")
+        
         self.load_users()
         
+        # The table follows the search box while typing; a grown term narrows the loaded rows
+        self.user_search = LiveSearch(search_entry, self.user_search_var, self.run_user_search,
+                                      refine=self.narrow_user_results, name="users")
         search_entry.bind("<Return>", lambda event: self.search_users())
         role_combo.bind("<<ComboboxSelected>>", lambda event: self.search_users())
         self.users_table.bind("<ButtonRelease-1>", self.handle_user_table_click)
@@ -2498,7 +2461,7 @@ class AdminDashboard:
             column_index = int(column[1:]) - 1
             
             selected_item = self.users_table.focus()
-            if not selected_item:
+            if not selected_item or "loading" in self.users_table.item(selected_item, "tags"):
                 return
                 
             item_values = self.users_table.item(selected_item, "values")
@@ -2514,98 +2477,66 @@ class AdminDashboard:
                 finally:
                     popup.grab_release()
 
+    def users_query(self, where=(), params=()):
+        """Keyset query over the user accounts that aren't deleted, in id order"""
+        return KeysetQuery("id, username, address, email, phone, role, status, last_activity", "user_accounts",
+                           order=[("id", "ASC", 0)],
+                           where=["date_deleted IS NULL"] + list(where), params=params)
+
     def load_users(self):
         """Load users into the table"""
-        for item in self.users_table.get_children():
-            self.users_table.delete(item)
-        
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                cursor.execute("""
-                    SELECT id, username, address, email, phone, role, status, last_activity 
-                    FROM user_accounts 
-                    WHERE date_deleted IS NULL
-                    ORDER BY id ASC
-                """)
-                users = cursor.fetchall()
-                
-                for user in users:
-                    # Format the last login date if it exists
-                    last_login = user[7].strftime("%Y-%m-%d %H:%M:%S") if user[7] else "-"
-                    
-                    self.users_table.insert("", tk.END, values=(
-                        user[0],             # ID
-                        user[1],             # Username
-                        user[2],             # Address
-                        user[3],             # Email
-                        user[4],             # Phone
-                        user[5].title(),     # Role (capitalize for display)
-                        user[6].title(),     # Status
-                        last_login,          # Last Login
-                        "Edit / Delete"      # Actions
-                    ))
-                    
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to fetch users: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()
+        self.users_pager.load(self.users_query())
 
     def search_users(self):
         """Search users by username or email and filter by role"""
-        search_term = self.user_search_var.get().lower()
+        self.user_search.search_now()
+
+    def user_search_query(self, search_term):
+        """Keyset query for users whose username or email contains search_term, in the selected role"""
+        search_term = search_term.lower()
         role_filter = self.role_filter_var.get()
         
-        # Clear the current table
-        for item in self.users_table.get_children():
-            self.users_table.delete(item)
+        # Case-insensitive through the column collation, so no LOWER() around indexed columns
+        where = ["username LIKE %s OR email LIKE %s"]
+        params = [f"%{search_term}%", f"%{search_term}%"]
         
-        db = connect_db()
-        if db:
-            cursor = db.cursor()
-            try:
-                query = """
-                    SELECT id, username, address, email, phone, role, status, last_activity 
-                    FROM user_accounts 
-                    WHERE date_deleted IS NULL 
-                    AND (LOWER(username) LIKE %s OR LOWER(email) LIKE %s)
-                """
-                
-                params = (f"%{search_term}%", f"%{search_term}%")
-                
-                # Add role filter if not "All"
-                if role_filter != "All":
-                    query += " AND LOWER(role) = %s"
-                    params = (f"%{search_term}%", f"%{search_term}%", role_filter.lower())
-                    
-                query += " ORDER BY id ASC"
-                
-                cursor.execute(query, params)
-                users = cursor.fetchall()
-                
-                for user in users:
-                    # Format the last login date if it exists
-                    last_login = user[7].strftime("%Y-%m-%d %H:%M:%S") if user[7] else "-"
-                    
-                    self.users_table.insert("", tk.END, values=(
-                        user[0],             # ID
-                        user[1],             # Username
-                        user[2],             # Address
-                        user[3],             # Email
-                        user[4],             # Phone
-                        user[5].title(),     # Role
-                        user[6].title(),     # Status
-                        last_login,          # Last Login
-                        "Edit / Delete"      # Actions
-                    ))
-                    
-            except mysql.connector.Error as e:
-                messagebox.showerror("Database Error", f"Failed to search users: {str(e)}")
-            finally:
-                cursor.close()
-                db.close()
+        # Add role filter if not "All"
+        if role_filter != "All":
+            where.append("role = %s")
+            params.append(role_filter.lower())
+        
+        return self.users_query(where, params)
+
+    def run_user_search(self, search_term):
+        """Load the first page of users matching search_term (superseding any search in flight)"""
+        self.users_pager.load(self.user_search_query(search_term),
+                              on_first_page=lambda: self.user_search.done(search_term))
+
+    def narrow_user_results(self, previous, search_term):
+        """Filter the loaded users for a longer search term when all matches are already loaded"""
+        term = search_term.lower()
+        # LIKE wildcards typed into the box don't mean the same thing in Python
+        if "%" in term or "_" in term:
+            return False
+        return self.users_pager.narrow(self.user_search_query(search_term),
+                                       lambda user: term in (user[1] or "").lower() or term in (user[3] or "").lower())
+
+    def format_user_row(self, user):
+        """Treeview values for a user_accounts row"""
+        # Format the last login date if it exists
+        last_login = user[7].strftime("%Y-%m-%d %H:%M:%S") if user[7] else "-"
+        
+        return (
+            user[0],             # ID
+            user[1],             # Username
+            user[2],             # Address
+            user[3],             # Email
+            user[4],             # Phone
+            user[5].title(),     # Role (capitalize for display)
+            user[6].title(),     # Status
+            last_login,          # Last Login
+            "Edit / Delete"      # Actions
+        )
 
     def open_add_user_modal(self):
         """Open modal window for adding a new user"""
@@ -2885,7 +2816,8 @@ class AdminDashboard:
 
             # Close the window and refresh the user list
             self.add_user_window.destroy()
-            self.load_users()
+            self.data_changed("user_accounts")
+            self.users_pager.reload()
 
         except mysql.connector.Error as e:
             db.rollback()
@@ -3332,7 +3264,8 @@ class AdminDashboard:
             
             # Close the window and refresh the user list
             self.edit_user_window.destroy()
-            self.load_users()
+            self.data_changed("user_accounts")
+            self.users_pager.reload()
             
         except mysql.connector.Error as e:
             db.rollback()
@@ -3361,7 +3294,8 @@ class AdminDashboard:
                 messagebox.showinfo("Success", "User deleted successfully")
                 
                 # Refresh the user list
-                self.load_users()
+                self.data_changed("user_accounts")
+                self.users_pager.reload()
                 
             except mysql.connector.Error as e:
                 db.rollback()
@@ -3404,10 +3338,11 @@ class AdminDashboard:
         rating_label = ttk.Label(filter_frame, text="Rating:")
         rating_label.grid(row=0, column=5, padx=(10, 5), pady=5)
         
-        # Rating dropdown
+        # Rating dropdown (review counts per star are filled in from the rating aggregates)
         self.rating_var = tk.StringVar(value="All")
-        rating_dropdown = ttk.Combobox(filter_frame, textvariable=self.rating_var, values=["All", "5", "4", "3", "2", "1"], width=5, state="readonly")
-        rating_dropdown.grid(row=0, column=6, padx=5, pady=5)
+        self.rating_dropdown = ttk.Combobox(filter_frame, textvariable=self.rating_var, values=["All", "5", "4", "3", "2", "1"], width=10, state="readonly")
+        self.rating_dropdown.grid(row=0, column=6, padx=5, pady=5)
+        self.load_rating_histogram()
         
         # Apply filters button
         apply_button = ttk.Button(filter_frame, text="Apply Filters", command=self.apply_filters, bootstyle="success")
@@ -3454,6 +3389,26 @@ class AdminDashboard:
         """Scroll the canvas with the mousewheel."""
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
+    def load_rating_histogram(self):
+        """Fetch the reviews per star for the rating filter in the background."""
+        self.queries.submit(ratings.rating_histogram, on_success=self.show_rating_histogram,
+                            on_error=lambda e: logging.error(f"❌ Error loading rating histogram: {e}"),
+                            tag="rating_histogram")
+
+    def show_rating_histogram(self, histogram):
+        """Show the review count next to each star in the rating filter"""
+        if not self.rating_dropdown.winfo_exists():
+            return
+        self.rating_dropdown.configure(values=["All"] + [f"{star} ({histogram[star]})" for star in range(5, 0, -1)])
+        selected = self.rating_var.get().split()[0]
+        if selected != "All":
+            self.rating_var.set(f"{selected} ({histogram[int(selected)]})")
+
+    def refresh_feedback(self):
+        """Reload the feedback list and rating counts with the current filters."""
+        self.load_rating_histogram()
+        self.apply_filters()
+
     def clear_date_filter(self):
         """Clear the date picker selections."""
         self.date_picker.clear()
@@ -3461,16 +3416,18 @@ class AdminDashboard:
     def load_feedback(self, date_filter=None, rating_filter="All"):
         """Load feedback from the database with optional filters."""
         # Clear existing feedback
+        self.cancel_feedback_render()
         for widget in self.feedback_container.winfo_children():
             widget.destroy()
             
         # Build query based on filters
-        query = """
+        query = f"""
         SELECT r.id, ua.username, p.name as place_name, r.rating, r.comment, r.date_created,
-               (SELECT COUNT(*) FROM review_replies WHERE review_id = r.id) as reply_count
+               COALESCE(rc.reply_count, 0) as reply_count
         FROM reviews r
         JOIN user_accounts ua ON r.user_id = ua.id
         JOIN places p ON r.place_id = p.id
+        LEFT JOIN ({REPLY_COUNTS_QUERY}) rc ON rc.review_id = r.id
         WHERE r.date_deleted IS NULL
         """
         
@@ -3481,8 +3438,9 @@ class AdminDashboard:
             try:
                 # Parse date
                 date_obj = datetime.strptime(date_filter, "%Y-%m-%d")
-                query += " AND DATE(r.date_created) = %s"
-                params.append(date_obj.strftime("%Y-%m-%d"))
+                # A range on the bare column (not DATE(r.date_created)) can use the index
+                query += " AND r.date_created >= %s AND r.date_created < %s"
+                params.extend([date_obj, date_obj + timedelta(days=1)])
             except ValueError:
                 messagebox.showwarning("Invalid Date", "Please enter a valid date in YYYY-MM-DD format.")
                 return
@@ -3490,18 +3448,47 @@ class AdminDashboard:
         # Rating filter
         if rating_filter and rating_filter != "All":
             query += " AND r.rating = %s"
-            params.append(int(rating_filter))
+            # Dropdown values carry the review count, e.g. "5 (123)"
+            params.append(int(rating_filter.split()[0]))
         
         # Order by date
         query += " ORDER BY r.date_created DESC"
         
-        # Execute query
-        result = DatabaseManager.execute_query(query, params if params else None)
+        # Execute query in the background; show a placeholder until it returns
+        loading_label = ttk.Label(self.feedback_container, text="Loading reviews...", font=("Arial", 12, "italic"))
+        loading_label.pack(pady=20)
+        
+        def on_error(e):
+            messagebox.showerror("Database Error", str(e))
+            self.render_feedback(None)
+        
+        self.queries.fetch_all(query, params, dictionary=True, on_success=self.render_feedback,
+                               on_error=on_error, tag="feedback")
+    
+    def cancel_feedback_render(self):
+        """Stop building feedback cards; returns True if some were still to be built."""
+        renderer = self.feedback_renderer
+        self.feedback_renderer = None
+        if renderer is not None and renderer.running:
+            renderer.cancel()
+            return True
+        return False
+
+    def render_feedback(self, result):
+        """Display feedback cards for a finished feedback query."""
+        if not self.feedback_container.winfo_exists():
+            return
+        self.cancel_feedback_render()
+        for widget in self.feedback_container.winfo_children():
+            widget.destroy()
         
         if result:
-            # Display feedback from database
-            for feedback in result:
-                self.create_feedback_card(
+            # Display feedback from database a batch at a time, with progress at the top
+            progress_label = ttk.Label(self.feedback_container, font=("Arial", 10, "italic"))
+            progress_label.pack(pady=(0, 5))
+            self.feedback_renderer = ChunkedRenderer(
+                self.feedback_container, result,
+                lambda feedback, i: self.create_feedback_card(
                     feedback['id'], 
                     feedback['username'], 
                     feedback['place_name'], 
@@ -3509,7 +3496,10 @@ class AdminDashboard:
                     feedback['comment'], 
                     feedback['date_created'],
                     feedback['reply_count']
-                )
+                ),
+                on_progress=lambda done, total: progress_label.config(text=f"Showing {done} of {total} reviews..."),
+                on_done=progress_label.destroy
+            ).start()
         else:
             # Show a message if no reviews match the filters
             no_data_label = ttk.Label(self.feedback_container, text="No reviews match the selected filters", font=("Arial", 12))
@@ -3888,24 +3878,15 @@ class AdminDashboard:
         """Delete a review (soft delete)."""
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this review?"):
             try:
-                db = connect_db()
-                cursor = db.cursor()
-                
-                # Soft delete the review
-                cursor.execute(
-                    "UPDATE reviews SET date_deleted = NOW() WHERE id = %s",
-                    (review_id,)
-                )
-                
-                db.commit()
+                # Soft delete the review and take it out of the place's rating aggregates
+                ratings.soft_delete_review(review_id)
+                self.data_changed("reviews")
                 messagebox.showinfo("Success", "Review deleted successfully!")
                 self.load_feedback()
+                self.load_rating_histogram()
                 
             except mysql.connector.Error as err:
                 messagebox.showerror("Database Error", f"Error deleting review: {err}")
-            finally:
-                cursor.close()
-                db.close()
 
     def apply_filters(self):
         """Apply the selected filters to the feedback list."""
@@ -4414,11 +4395,14 @@ class AdminDashboard:
         """Handle user logout."""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
             logging.info(f"User ID {self.current_user_id} logged out")
-            self.root.destroy()
-            # Here you would typically redirect to login screen
-            # For demonstration, just show a message
-            messagebox.showinfo("Logged Out", "You have been logged out successfully.")
-            # In a real app, you would launch the login window here
+            delete_session()
+            if self.router is not None:
+                # Same window and process: the pool and caches are reused by the next login
+                self.router.show_login()
+            else:
+                self.close()
+                self.root.destroy()
+                messagebox.showinfo("Logged Out", "You have been logged out successfully.")
 
 # Run Admin Dashboard
 if __name__ == "__main__":
@@ -4427,5 +4411,5 @@ if __name__ == "__main__":
         sys.exit(1)
     user_id = int(sys.argv[1])
     root = tk.Tk()
-    app = AdminDashboard(root, user_id)
+    ScreenRouter(root).show_dashboard("admin", user_id)
     root.mainloop()
\ No newline at end of file
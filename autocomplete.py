@@ -0,0 +1,273 @@
+"""Autocomplete suggestions for place names, event names and locations.
+
+Every suggestion is indexed under its whole text and under each later word
+("Lake Holon" under "lake holon" and "holon"). The keys are kept in one sorted
+list, so a lookup is a bisect plus a short scan. The index starts from the
+approved places and events. refresh() then applies only the rows created,
+modified or deleted since the previous refresh, so newly approved places and
+events appear without a rebuild. The refresh compares those columns with the
+database clock, so every write to them must use NOW(). A session that writes a
+place or event calls apply_row() so its own change shows up right away.
+"""
+import re
+import threading
+import tkinter as tk
+from bisect import bisect_left, insort
+
+import database
+
+# Kinds of suggestion
+PLACE = "place"
+EVENT = "event"
+LOCATION = "location"
+
+# Suggestions shown under an entry
+MAX_SUGGESTIONS = 8
+# Index entries examined per lookup (short prefixes match many; the best are ranked among these)
+MAX_SCAN = 256
+# Seconds between incremental refreshes
+REFRESH_INTERVAL = 60
+
+SOURCES = {
+    "places": ("SELECT id, name, location, status, date_deleted FROM places", PLACE),
+    "events": ("SELECT id, name, location, status, date_deleted FROM events", EVENT),
+}
+CHANGED_SINCE = " WHERE date_created >= %s OR date_modified >= %s OR date_deleted >= %s"
+INITIAL = " WHERE status = 'approved' AND date_deleted IS NULL"
+
+
+def _keys(text):
+    """Lowercased index keys of a suggestion: the text from the start of each word."""
+    lowered = text.lower()
+    return [lowered[match.start():] for match in re.finditer(r"\w+", lowered)]
+
+
+def _terms(kind, name, location):
+    """(text, kind) suggestions contributed by one place or event."""
+    terms = [(name.strip(), kind)] if name and name.strip() else []
+    # "Glan, Sarangani Province, Philippines" suggests each part
+    for part in (location or "").split(","):
+        if part.strip():
+            terms.append((part.strip(), LOCATION))
+    return terms
+
+
+class AutocompleteIndex:
+    """Sorted (key, text, kind) entries with reference counts per suggestion.
+
+    A suggestion shared by several rows (a town many places are in) is stored
+    once. Its count is used for ranking and to know when it can be removed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries = []
+        self.counts = {}
+        self.sources = {}
+        self.refreshed_at = None
+
+    def build(self, rows_by_table):
+        """Index {table: [(id, name, location, ...)]} from scratch."""
+        counts, sources = {}, {}
+        for table, rows in rows_by_table.items():
+            kind = SOURCES[table][1]
+            for row in rows:
+                terms = _terms(kind, row[1], row[2])
+                sources[(table, row[0])] = terms
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+        entries = sorted((key, text, kind) for text, kind in counts for key in _keys(text))
+        with self._lock:
+            self.entries, self.counts, self.sources = entries, counts, sources
+
+    def update(self, table, row_id, name=None, location=None, visible=True):
+        """Replace the suggestions of one place/event (visible=False removes them)."""
+        terms = _terms(SOURCES[table][1], name, location) if visible else []
+        with self._lock:
+            for term in self.sources.pop((table, row_id), []):
+                self._release(term)
+            if terms:
+                self.sources[(table, row_id)] = terms
+            for term in terms:
+                self._acquire(term)
+
+    def _acquire(self, term):
+        self.counts[term] = self.counts.get(term, 0) + 1
+        if self.counts[term] == 1:
+            for key in _keys(term[0]):
+                insort(self.entries, (key,) + term)
+
+    def _release(self, term):
+        self.counts[term] -= 1
+        if self.counts[term] == 0:
+            del self.counts[term]
+            for key in _keys(term[0]):
+                entry = (key,) + term
+                position = bisect_left(self.entries, entry)
+                if position < len(self.entries) and self.entries[position] == entry:
+                    del self.entries[position]
+
+    def suggest(self, prefix, kinds=(PLACE, EVENT, LOCATION), limit=MAX_SUGGESTIONS):
+        """Best [(text, kind)] starting with prefix (at the start or at a later word).
+
+        Ranked by: matches at the start of the text first, then more places/events
+        sharing the suggestion, then shorter text.
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        matches = {}
+        with self._lock:
+            start = bisect_left(self.entries, (prefix,))
+            for key, text, kind in self.entries[start:start + MAX_SCAN]:
+                if not key.startswith(prefix):
+                    break
+                if kind in kinds:
+                    at_start = text.lower().startswith(prefix)
+                    rank = (not at_start, -self.counts[(text, kind)], len(text), text)
+                    matches[(text, kind)] = min(rank, matches.get((text, kind), rank))
+        return sorted(matches, key=matches.get)[:limit]
+
+
+_index = AutocompleteIndex()
+_refresh_lock = threading.Lock()
+
+
+def get_index():
+    return _index
+
+
+def refresh():
+    """Load the index the first time, then apply the changes since the last refresh.
+
+    Runs queries, so call it from a worker thread. Returns the number of rows applied.
+    """
+    with _refresh_lock:
+        # The database clock, so rows written by other machines aren't missed
+        now = database.fetch_one("SELECT NOW()")[0]
+        since = _index.refreshed_at
+        if since is None:
+            _index.build({table: database.fetch_all(query + INITIAL) for table, (query, _) in SOURCES.items()})
+            applied = len(_index.sources)
+        else:
+            applied = 0
+            for table, (query, _) in SOURCES.items():
+                for row_id, name, location, status, date_deleted in database.fetch_all(query + CHANGED_SINCE,
+                                                                                       (since, since, since)):
+                    _index.update(table, row_id, name, location, status == "approved" and date_deleted is None)
+                    applied += 1
+        _index.refreshed_at = now
+        return applied
+
+
+def apply_row(table, row_id):
+    """Apply one place/event that this session just wrote, without waiting for refresh().
+
+    Runs a query, so call it from a worker thread. Before the first refresh there is
+    nothing to update (the first load will include the row).
+    """
+    with _refresh_lock:
+        if _index.refreshed_at is None:
+            return
+        row = database.fetch_one(SOURCES[table][0] + " WHERE id = %s", (row_id,))
+        if row is None:
+            _index.update(table, row_id, visible=False)
+        else:
+            _, name, location, status, date_deleted = row
+            _index.update(table, row_id, name, location, status == "approved" and date_deleted is None)
+
+
+class SuggestionBox:
+    """Dropdown of suggestions under an entry.
+
+    suggest(text) returns [(text, kind)]. Up/Down move through the list;
+    Return or a click picks a suggestion. Picking puts the text in variable and
+    calls on_select(text).
+    """
+
+    def __init__(self, entry, variable, suggest, on_select=None):
+        self.entry = entry
+        self.variable = variable
+        self.suggest = suggest
+        self.on_select = on_select
+        self.popup = None
+        self.listbox = None
+        self.suggestions = []
+
+        entry.bind("<KeyRelease>", self._on_key, add="+")
+        entry.bind("<Down>", lambda e: self._move(1), add="+")
+        entry.bind("<Up>", lambda e: self._move(-1), add="+")
+        entry.bind("<Return>", self._on_return, add="+")
+        entry.bind("<Escape>", lambda e: self.hide(), add="+")
+        entry.bind("<FocusOut>", lambda e: entry.after(150, self._hide_unless_focused), add="+")
+        entry.bind("<Destroy>", lambda e: self.hide(), add="+")
+
+    def _on_key(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        self.suggestions = self.suggest(self.variable.get())
+        if self.suggestions:
+            self._show()
+        else:
+            self.hide()
+
+    def _show(self):
+        if self.popup is None:
+            self.popup = tk.Toplevel(self.entry)
+            self.popup.overrideredirect(True)
+            self.listbox = tk.Listbox(self.popup, activestyle="dotbox", exportselection=False)
+            self.listbox.pack(fill=tk.BOTH, expand=True)
+            self.listbox.bind("<ButtonRelease-1>", lambda e: self._pick())
+        self.listbox.delete(0, tk.END)
+        for text, kind in self.suggestions:
+            self.listbox.insert(tk.END, f"{text}  ·  {kind}")
+        self.listbox.configure(height=len(self.suggestions))
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.popup.geometry(f"{max(self.entry.winfo_width(), 250)}x{self.listbox.winfo_reqheight()}+{x}+{y}")
+        self.popup.lift()
+
+    def hide(self):
+        if self.popup is not None:
+            try:
+                self.popup.destroy()
+            except tk.TclError:
+                pass
+            self.popup = None
+            self.listbox = None
+
+    def _hide_unless_focused(self):
+        try:
+            focused = self.entry.focus_get()
+        except (KeyError, tk.TclError):
+            focused = None
+        if focused is not self.listbox:
+            self.hide()
+
+    def _move(self, step):
+        if self.listbox is None:
+            return
+        selection = self.listbox.curselection()
+        index = (selection[0] + step) if selection else (0 if step > 0 else len(self.suggestions) - 1)
+        index = max(0, min(len(self.suggestions) - 1, index))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return "break"
+
+    def _on_return(self, event):
+        if self.listbox is not None and self.listbox.curselection():
+            self._pick()
+            return "break"
+        self.hide()
+
+    def _pick(self):
+        selection = self.listbox.curselection() if self.listbox is not None else ()
+        if not selection:
+            return
+        text = self.suggestions[selection[0]][0]
+        self.hide()
+        self.variable.set(text)
+        self.entry.icursor(tk.END)
+        if self.on_select:
+            self.on_select(text)
@@ -0,0 +1,101 @@
+"""Size of the ttk style database after repeated event grid refreshes.
+
+Simulates filter changes on the Events page: every change fills the visible
+cards of a grid with a different slice of events. The old cards configured
+Category{index}.TLabel and Fee{index}.TLabel for every card they showed; the
+cards now pick one of the styles in card_styles, registered once. Prints the
+number of styles and the time per refresh for both, and exits with status 1
+if refreshing the grid still adds styles.
+Needs a display (Tk is started); no database is used.
+
+    python benchmarks/bench_card_styles.py [filter changes]
+"""
+import os
+import random
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import card_styles
+
+EVENTS = 600
+VISIBLE_CARDS = 12
+CATEGORIES = ["festival", "concert", "exhibition", "sports", "conference", "workshop"]
+
+
+def style_count(style):
+    """Styles the theme knows about (`ttk::style theme styles`, Tk 8.6.9+)."""
+    try:
+        return len(style.tk.splitlist(style.tk.call("ttk::style", "theme", "styles")))
+    except tk.TclError:
+        return None
+
+
+def old_update(style, label, fee_label, event, index):
+    # The per-card styles update_event_card used to configure
+    category_style = f"Category{index}.TLabel"
+    style.configure(category_style, background=card_styles.CATEGORY_COLOR, foreground="white")
+    label.configure(text=event["category"].title(), style=category_style)
+    fee_style = f"Fee{index}.TLabel"
+    style.configure(fee_style, background=card_styles.FREE_COLOR if event["is_free"] else card_styles.PAID_COLOR,
+                    foreground="white")
+    fee_label.configure(text="Free" if event["is_free"] else "Paid", style=fee_style)
+
+
+def new_update(style, label, fee_label, event, index):
+    label.configure(text=event["category"].title(), style=card_styles.CATEGORY_STYLE)
+    fee_label.configure(text="Free" if event["is_free"] else "Paid", style=card_styles.fee_style(event["is_free"]))
+
+
+def run(root, update, changes, events):
+    style = ttk.Style(root)
+    cards = [(ttk.Label(root), ttk.Label(root)) for _ in range(VISIBLE_CARDS)]
+    random.seed(3)
+    before = style_count(style)
+    seen = set()
+    start = time.perf_counter()
+    for _ in range(changes):
+        # A filter change shows some matching events; cards take the event's position in the results
+        matching = random.sample(range(len(events)), random.randint(VISIBLE_CARDS, len(events)))
+        first = random.randint(0, len(matching) - VISIBLE_CARDS)
+        for (label, fee_label), index in zip(cards, range(first, first + VISIBLE_CARDS)):
+            update(style, label, fee_label, events[matching[index]], index)
+            seen.add(str(label.cget("style")))
+            seen.add(str(fee_label.cget("style")))
+        root.update_idletasks()
+    elapsed = (time.perf_counter() - start) * 1000 / changes
+    after = style_count(style)
+    for label, fee_label in cards:
+        label.destroy()
+        fee_label.destroy()
+    return before, after, len(seen), elapsed
+
+
+def main():
+    changes = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    events = [{"category": random.choice(CATEGORIES), "is_free": random.random() < 0.5} for _ in range(EVENTS)]
+    root = tk.Tk()
+    root.withdraw()
+    card_styles.register(ttk.Style(root))
+
+    print(f"{changes} filter changes, {VISIBLE_CARDS} visible cards, {EVENTS} events\n")
+    print(f"{'cards':<12} {'styles before':>13} {'after':>7} {'badge styles used':>18} {'ms/refresh':>11}")
+    results = {}
+    for name, update in (("per-index", old_update), ("palette", new_update)):
+        before, after, used, ms = run(root, update, changes, events)
+        results[name] = (before, after, used)
+        print(f"{name:<12} {before if before is not None else '?':>13} {after if after is not None else '?':>7} "
+              f"{used:18d} {ms:11.3f}")
+    root.destroy()
+
+    before, after, used = results["palette"]
+    grew = after != before if before is not None else used > len(card_styles.PALETTE)
+    print("\nFAIL: refreshing the grid added styles" if grew else "\nOK: the style database did not grow")
+    sys.exit(1 if grew else 0)
+
+
+if __name__ == "__main__":
+    main()
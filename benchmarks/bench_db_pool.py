@@ -0,0 +1,83 @@
+"""Page-open latency: a fresh connection per query vs. the shared pool.
+
+Simulates what opening the admin dashboard does (four COUNT(*) queries plus the
+last_activity update) and prints timings for both strategies.
+Requires the tourism_db schema on the local XAMPP MySQL server.
+
+    python benchmarks/bench_db_pool.py [rounds]
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mysql.connector
+import database
+
+PAGE_QUERIES = [
+    ("SELECT COUNT(*) FROM places", None),
+    ("SELECT COUNT(*) FROM events", None),
+    ("SELECT COUNT(*) FROM user_accounts", None),
+    ("SELECT COUNT(*) FROM reviews", None),
+]
+ACTIVITY_UPDATE = "UPDATE user_accounts SET last_activity = NOW() WHERE id = %s"
+
+
+def open_page_direct(user_id):
+    """Old behaviour: one brand-new connection per query."""
+    for query, params in PAGE_QUERIES:
+        db = mysql.connector.connect(**database.DB_CONFIG)
+        cursor = db.cursor()
+        cursor.execute(query, params or ())
+        cursor.fetchone()
+        cursor.close()
+        db.close()
+    db = mysql.connector.connect(**database.DB_CONFIG)
+    cursor = db.cursor()
+    cursor.execute(ACTIVITY_UPDATE, (user_id,))
+    db.commit()
+    cursor.close()
+    db.close()
+
+
+def open_page_pooled(user_id):
+    """New behaviour: every query borrows a warm pooled connection."""
+    for query, params in PAGE_QUERIES:
+        database.fetch_one(query, params)
+    database.execute(ACTIVITY_UPDATE, (user_id,))
+
+
+def measure(func, rounds, user_id):
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(user_id)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:<10} mean {statistics.mean(timings):8.2f} ms   "
+          f"median {statistics.median(timings):8.2f} ms   "
+          f"max {max(timings):8.2f} ms")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    row = database.fetch_one("SELECT id FROM user_accounts ORDER BY id LIMIT 1")
+    user_id = row[0] if row else 0
+
+    direct = measure(open_page_direct, rounds, user_id)
+    pooled = measure(open_page_pooled, rounds, user_id)
+
+    print(f"Dashboard page open, {rounds} rounds")
+    report("direct", direct)
+    report("pooled", pooled)
+    print(f"speed-up  x{statistics.median(direct) / statistics.median(pooled):.1f} (median)")
+    database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Trigram index lookups on a large synthetic set of place names.
+
+Builds fuzzy.TrigramIndex over N random two-word names plus a few real local
+names. It then times misspelled lookups, which must stay fast and find the
+real name however many rows there are. No database is needed.
+
+    python benchmarks/bench_fuzzy.py [rows]
+"""
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fuzzy
+
+REAL_NAMES = ["Lake Sebu", "Kalilangan Hot Spring", "Tnalak Festival Grounds", "Lake Mofong", "Lake Holon"]
+MISSPELLINGS = ["lake sebo", "kalilangn", "tinalak", "mofung", "lake holn", "sebu falls"]
+
+
+def random_word():
+    return "".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(4, 9))).title()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    random.seed(42)
+    names = {i: f"{random_word()} {random_word()}" for i in range(1, rows + 1)}
+    names.update({rows + i: name for i, name in enumerate(REAL_NAMES, 1)})
+
+    start = time.perf_counter()
+    index = fuzzy.TrigramIndex(names)
+    print(f"Indexed {len(names):,} names in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    for text in MISSPELLINGS:
+        start = time.perf_counter()
+        matches = index.lookup(text, limit=3)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = ", ".join(f"{names[row_id]} ({score:.2f})" for row_id, score in matches) or "-"
+        print(f"{text!r:<14} {elapsed:7.2f} ms   {best}")
+
+
+if __name__ == "__main__":
+    main()
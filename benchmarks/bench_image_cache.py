@@ -0,0 +1,73 @@
+"""Memory of the image cache while scrolling through many card images.
+
+Puts a stream of PhotoImages through an image_cache.ImageCache whose budget holds
+a few dozen of them, showing each one in a card label as it arrives. Every image
+is also kept in a list, like a reference left in a callback or a hidden row would
+be, so only deleting evicted images in Tk (not just dropping the cache's
+reference) frees them. After every image, checks that
+- the cache's current_bytes is within its budget, and
+- the number of live Tk images (root.image_names()) is within the images the
+  budget holds, plus the ones the cards show.
+Exits with status 1 on the first check that fails.
+Needs a display (Tk is started); no database or image files are used.
+
+    python benchmarks/bench_image_cache.py [images]
+"""
+import os
+import sys
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import image_cache
+
+IMAGE_SIZE = (200, 150)
+CACHED_IMAGES = 40
+VISIBLE_CARDS = 6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    image_bytes = IMAGE_SIZE[0] * IMAGE_SIZE[1] * image_cache.BYTES_PER_PIXEL
+    cache = image_cache.ImageCache(max_bytes=CACHED_IMAGES * image_bytes)
+
+    root = tk.Tk()
+    root.withdraw()
+    cards = [tk.Label(root) for _ in range(VISIBLE_CARDS)]
+    for card in cards:
+        card.pack()
+    baseline = len(root.image_names())
+    image_limit = baseline + CACHED_IMAGES + VISIBLE_CARDS
+    handed_out = []
+
+    most_bytes = most_images = 0
+    for i in range(count):
+        photo = tk.PhotoImage(width=IMAGE_SIZE[0], height=IMAGE_SIZE[1])
+        photo.put("#%06x" % (i * 2654435761 % 0xFFFFFF), to=(0, 0, IMAGE_SIZE[0], IMAGE_SIZE[1]))
+        cache.put(("image", i), photo)
+        handed_out.append(photo)
+        card = cards[i % VISIBLE_CARDS]
+        card.configure(image=photo)
+        card.image = photo
+
+        images = len(root.image_names())
+        most_bytes = max(most_bytes, cache.current_bytes)
+        most_images = max(most_images, images)
+        if cache.current_bytes > cache.max_bytes or images > image_limit:
+            print(f"FAIL after {i + 1} images: {cache.current_bytes // 1024} KiB cached "
+                  f"(budget {cache.max_bytes // 1024} KiB), {images} Tk images (limit {image_limit})")
+            root.destroy()
+            sys.exit(1)
+
+    stats = cache.stats()
+    print(f"{count:,} images of {IMAGE_SIZE[0]}x{IMAGE_SIZE[1]}, {len(handed_out):,} still referenced\n")
+    print(f"cache:     at most {most_bytes // 1024:,} KiB of {cache.max_bytes // 1024:,} KiB, "
+          f"{stats['evictions']:,} evictions")
+    print(f"Tk images: at most {most_images} live (limit {image_limit}: {baseline} at start, "
+          f"{CACHED_IMAGES} cached, {VISIBLE_CARDS} shown)")
+    root.destroy()
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
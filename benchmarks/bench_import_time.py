@@ -0,0 +1,79 @@
+"""Import cost of a dashboard module, measured with `python -X importtime`.
+
+Imports the module in a fresh interpreter (best of a few runs, so .pyc files are
+warm) and prints its cumulative import time and the slowest modules it pulls
+in. Fails (exit status 1) when
+- the import takes longer than the budget,
+- a module that must stay lazy or unused (cv2, ffpyplayer, requests) is imported,
+- importing opened the database pool.
+Needs the app's dependencies installed; no database server is used.
+
+    python benchmarks/bench_import_time.py [module] [budget ms]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_MS = 800
+RUNS = 3
+SLOWEST = 15
+# Top-level packages that must not be loaded just by importing the dashboards
+FORBIDDEN = ("cv2", "ffpyplayer", "requests")
+
+# Exits with 3 if the import left a database pool behind
+PROBE = "import {module}, database, sys; sys.exit(3 if database._pool is not None else 0)"
+
+
+def measure(module):
+    """(cumulative ms of module, {imported module: cumulative ms}, exit status) of one fresh import."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE.format(module=module)],
+                            cwd=ROOT, capture_output=True, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        times[name.strip()] = int(cumulative_us) / 1000
+    if result.returncode not in (0, 3):
+        print(result.stderr[-2000:])
+    return times.get(module), times, result.returncode
+
+
+def main():
+    module = sys.argv[1] if len(sys.argv) > 1 else "user_dashboard"
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else IMPORT_BUDGET_MS
+
+    runs = [measure(module) for _ in range(RUNS)]
+    if any(total is None for total, _, _ in runs):
+        print(f"FAIL: could not import {module}")
+        sys.exit(1)
+    total, times, status = min(runs, key=lambda run: run[0])
+
+    print(f"import {module}: {total:.0f} ms (best of {RUNS}, budget {budget:.0f} ms)\n")
+    print(f"{'cumulative ms':>13}  module")
+    top_level = sorted(((ms, name) for name, ms in times.items() if "." not in name and name != module), reverse=True)
+    for ms, name in top_level[:SLOWEST]:
+        print(f"{ms:13.1f}  {name}")
+
+    failures = []
+    if total > budget:
+        failures.append(f"import took {total:.0f} ms, over the {budget:.0f} ms budget")
+    loaded = sorted({name.split(".")[0] for name in times} & set(FORBIDDEN))
+    if loaded:
+        failures.append(f"imported {', '.join(loaded)} (should be lazy or unused)")
+    if status == 3:
+        failures.append("importing opened the database pool")
+
+    print()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
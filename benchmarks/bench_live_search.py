@@ -0,0 +1,84 @@
+"""Per-keystroke cost of search-as-you-type against the frame budget.
+
+Types a query one character at a time, like live_search.LiveSearch does, and
+prints for every keystroke:
+- how the Explore Places search would answer it: narrowing the previous complete
+  results on the Tk thread, or a full-text query on a worker thread;
+- the time the in-memory events index takes to match the same text.
+Work done on the Tk thread (narrowing, the events index) has to stay within
+live_search.FRAME_BUDGET_MS. Queries run off the Tk thread and only need to
+beat the debounce. Requires the tourism_db schema on the local XAMPP MySQL
+server. Seed it with many places and events to see realistic numbers.
+
+    python benchmarks/bench_live_search.py ["query text"]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+import search
+from event_index import EventIndex
+from live_search import DEBOUNCE_MS, FRAME_BUDGET_MS
+
+# Same limit and columns as the Explore Places search in user_dashboard.py
+SEARCH_RESULT_LIMIT = 200
+PLACE_COLUMNS = "id, name, category, description, image, location"
+
+EVENTS_QUERY = """
+    SELECT id, name, description, category, location, date, time, image, is_free
+    FROM events
+    WHERE status = 'approved' AND date_deleted IS NULL
+    ORDER BY date ASC
+"""
+
+
+def load_event_index():
+    keys = ("id", "name", "description", "category", "location", "date", "time", "image", "is_free")
+    events = [dict(zip(keys, row)) for row in database.fetch_all(EVENTS_QUERY)]
+    start = time.perf_counter()
+    index = EventIndex(events)
+    print(f"Events index: {len(events)} events built in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return index
+
+
+def main():
+    text = sys.argv[1] if len(sys.argv) > 1 else "beach resort"
+    index = load_event_index()
+    print(f"Frame budget {FRAME_BUDGET_MS:.1f} ms, debounce {DEBOUNCE_MS} ms\n")
+    print(f"{'typed':<20} {'places':<8} {'rows':>5} {'ms':>8}   {'events ms':>9}")
+
+    previous, results = None, None
+    over_budget = 0
+    for end in range(1, len(text) + 1):
+        typed = text[:end].strip()
+        if not typed or typed == previous:
+            continue
+        start = time.perf_counter()
+        if (results is not None and len(results) < SEARCH_RESULT_LIMIT
+                and search.can_narrow(previous, typed)):
+            how = "narrow"
+            results = [row for row in results if search.matches(typed, row[1:4] + row[5:6])]
+            place_ms = (time.perf_counter() - start) * 1000
+            over_budget += place_ms > FRAME_BUDGET_MS
+        else:
+            how = "query"
+            results = search.search_places(typed, PLACE_COLUMNS, where=["status = 'approved'"],
+                                           limit=SEARCH_RESULT_LIMIT)
+            place_ms = (time.perf_counter() - start) * 1000
+        previous = typed
+
+        start = time.perf_counter()
+        index.select(index.text_mask(typed))
+        event_ms = (time.perf_counter() - start) * 1000
+        over_budget += event_ms > FRAME_BUDGET_MS
+        print(f"{typed!r:<20} {how:<8} {len(results):5d} {place_ms:8.2f}   {event_ms:9.2f}")
+
+    print(f"\n{over_budget} Tk-thread step(s) over the frame budget")
+    database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
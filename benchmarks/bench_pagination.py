@@ -0,0 +1,69 @@
+"""Cost of reaching deep pages of the admin events table: LIMIT/OFFSET vs keyset seek.
+
+Walks the whole events table page by page with both strategies and prints the
+time taken by the first, middle and last page. OFFSET gets slower the deeper it
+goes; the keyset seek stays flat.
+Requires the tourism_db schema on the local XAMPP MySQL server (seed it with
+plenty of events to see the difference).
+
+    python benchmarks/bench_pagination.py [page_size]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from pagination import KeysetQuery
+
+OFFSET_QUERY = """
+    SELECT id, name, category, date, time, location
+    FROM events
+    WHERE date_deleted IS NULL
+    ORDER BY date DESC, time ASC, id ASC
+    LIMIT %s OFFSET %s
+"""
+
+
+def walk_offset(page_size):
+    timings = []
+    offset = 0
+    while True:
+        start = time.perf_counter()
+        rows = database.fetch_all(OFFSET_QUERY, (page_size, offset))
+        timings.append((time.perf_counter() - start) * 1000)
+        if len(rows) < page_size:
+            return timings
+        offset += page_size
+
+
+def walk_keyset(page_size):
+    query = KeysetQuery("id, name, category, date, time, location", "events",
+                        order=[("date", "DESC", 3), ("time", "ASC", 4), ("id", "ASC", 0)])
+    timings = []
+    after = None
+    while True:
+        start = time.perf_counter()
+        rows, after = query.fetch_page(after, page_size)
+        timings.append((time.perf_counter() - start) * 1000)
+        if after is None:
+            return timings
+
+
+def report(label, timings):
+    middle = timings[len(timings) // 2]
+    print(f"{label:<8} {len(timings):5d} pages   first {timings[0]:8.2f} ms   "
+          f"middle {middle:8.2f} ms   last {timings[-1]:8.2f} ms   total {sum(timings):9.1f} ms")
+
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f"Events table, {page_size} rows per page")
+    report("offset", walk_offset(page_size))
+    report("keyset", walk_keyset(page_size))
+    database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Admin feedback list: per-row reply COUNT(*) subquery vs. one grouped join.
+
+Seeds a scratch copy of the schema with 100k reviews (and replies to about a third
+of them), then times the old and new load_feedback queries, unfiltered and
+filtered to a single day.
+Requires a local MySQL/MariaDB server that the DB_CONFIG user can create databases on.
+
+    python benchmarks/bench_reply_count.py [reviews] [rounds]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import migrations
+from check_query_plans import create_scratch_database, drop_scratch_database
+
+SCRATCH_DB = "tourism_db_bench_replies"
+USERS = 2000
+PLACES = 500
+
+OLD_QUERY = """
+    SELECT r.id, ua.username, p.name as place_name, r.rating, r.comment, r.date_created,
+           (SELECT COUNT(*) FROM review_replies WHERE review_id = r.id) as reply_count
+    FROM reviews r
+    JOIN user_accounts ua ON r.user_id = ua.id
+    JOIN places p ON r.place_id = p.id
+    WHERE r.date_deleted IS NULL
+"""
+
+# Same shape as AdminDashboard.load_feedback (REPLY_COUNTS_QUERY in admin_dashboard.py)
+NEW_QUERY = """
+    SELECT r.id, ua.username, p.name as place_name, r.rating, r.comment, r.date_created,
+           COALESCE(rc.reply_count, 0) as reply_count
+    FROM reviews r
+    JOIN user_accounts ua ON r.user_id = ua.id
+    JOIN places p ON r.place_id = p.id
+    LEFT JOIN (
+        SELECT review_id, COUNT(*) AS reply_count
+        FROM review_replies
+        WHERE date_deleted IS NULL
+        GROUP BY review_id
+    ) rc ON rc.review_id = r.id
+    WHERE r.date_deleted IS NULL
+"""
+
+DAY_FILTER = " AND r.date_created >= %s AND r.date_created < %s"
+ORDER = " ORDER BY r.date_created DESC"
+
+
+def seed(conn, reviews):
+    random.seed(7)
+    now = datetime.now()
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO user_accounts (id, username, email, password_hash, role) VALUES (%s, %s, %s, %s, %s)",
+        [(i, f"user{i}", f"user{i}@example.com", "x", "admin" if i == 1 else "user") for i in range(1, USERS + 1)])
+    cursor.executemany(
+        "INSERT INTO places (id, name, status) VALUES (%s, %s, 'approved')",
+        [(i, f"Place {i}") for i in range(1, PLACES + 1)])
+    for start in range(1, reviews + 1, 10000):
+        cursor.executemany(
+            "INSERT INTO reviews (id, place_id, user_id, rating, comment, date_created) VALUES (%s, %s, %s, %s, %s, %s)",
+            [(i, random.randint(1, PLACES), random.randint(1, USERS), random.randint(1, 5), "Comment",
+              now - timedelta(minutes=random.randint(0, 60 * 24 * 365)))
+             for i in range(start, min(start + 10000, reviews + 1))])
+    replies = [(random.randint(1, reviews), 1, "Thanks!") for _ in range(reviews // 3)]
+    for start in range(0, len(replies), 10000):
+        cursor.executemany("INSERT INTO review_replies (review_id, admin_id, reply_text) VALUES (%s, %s, %s)",
+                           replies[start:start + 10000])
+    conn.commit()
+    for table in ("user_accounts", "places", "reviews", "review_replies"):
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+    cursor.close()
+
+
+def measure(conn, query, params, rounds):
+    cursor = conn.cursor()
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        cursor.execute(query, params)
+        cursor.fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    cursor.close()
+    return statistics.median(timings)
+
+
+def main():
+    reviews = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    conn = create_scratch_database(SCRATCH_DB)
+    try:
+        migrations.migrate(conn)
+        seed(conn, reviews)
+        day = datetime.combine(datetime.now().date() - timedelta(days=30), datetime.min.time())
+        print(f"{reviews:,} reviews, median of {rounds} rounds")
+        for label, suffix, params in (("all reviews", ORDER, ()),
+                                      ("one day", DAY_FILTER + ORDER, (day, day + timedelta(days=1)))):
+            old = measure(conn, OLD_QUERY + suffix, params, rounds)
+            new = measure(conn, NEW_QUERY + suffix, params, rounds)
+            print(f"{label:<12} subquery {old:9.1f} ms   grouped join {new:9.1f} ms   x{old / new:.1f}")
+    finally:
+        drop_scratch_database(conn, SCRATCH_DB)
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Screen transition latency: router swap in one Tk root vs. relaunching the app.
+
+Cycles the screen router through login -> registration -> login -> forgot password
+-> login and reports the time of each kind of transition. With a role and user id,
+it also logs in to that dashboard and back (as logout does), which needs the
+database; the screens alone don't touch it. The old flow started a new Python
+process and a new Tk root for every screen (os.system("python login.py")), so that
+is timed too: a fresh interpreter that imports the app and shows the login.
+Exits with status 1 if the slowest in-process transition (median) is over budget.
+Needs a display and the app's dependencies.
+
+    python benchmarks/bench_screen_transitions.py [cycles] [admin|user user_id]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tkinter as tk
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from screen_router import ScreenRouter
+
+TRANSITION_BUDGET_MS = 150
+RELAUNCHES = 3
+
+# What a screen change cost before: a new interpreter, the imports and a new Tk root
+RELAUNCH = ("import tkinter as tk\n"
+            "from screen_router import ScreenRouter\n"
+            "root = tk.Tk()\n"
+            "ScreenRouter(root).show_login()\n"
+            "root.update()\n"
+            "root.destroy()\n")
+
+
+def relaunch_ms():
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", RELAUNCH], cwd=ROOT, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    role, user_id = (sys.argv[2], int(sys.argv[3])) if len(sys.argv) > 3 else (None, None)
+
+    root = tk.Tk()
+    router = ScreenRouter(root)
+    router.show_login()
+    root.update()
+    # The first visit of each screen imports its module; time the warm transitions
+    router.show_registration()
+    router.show_forgot_password()
+    if role:
+        router.show_dashboard(role, user_id)
+    router.show_login()
+    root.update()
+    router.transitions.clear()
+
+    for _ in range(cycles):
+        router.show_registration()
+        router.show_login()
+        router.show_forgot_password()
+        router.show_login()
+        if role:
+            router.show_dashboard(role, user_id)
+            root.update()
+            router.show_login()
+        root.update()
+
+    by_kind = {}
+    for previous, name, ms in router.transitions:
+        by_kind.setdefault(f"{previous} -> {name}", []).append(ms)
+    relaunches = [relaunch_ms() for _ in range(RELAUNCHES)]
+
+    print(f"{cycles} cycles in one Tk root\n")
+    print(f"{'median ms':>9} {'max ms':>8}  transition")
+    for kind, times in sorted(by_kind.items()):
+        print(f"{statistics.median(times):9.1f} {max(times):8.1f}  {kind}")
+    print(f"\nrelaunch (new process + Tk root + login): {statistics.median(relaunches):.0f} ms "
+          f"(median of {RELAUNCHES})")
+
+    slowest = max(statistics.median(times) for times in by_kind.values())
+    router.quit()  # also closes the database pool
+    if slowest > TRANSITION_BUDGET_MS:
+        print(f"\nFAIL: slowest transition {slowest:.0f} ms, over the {TRANSITION_BUDGET_MS} ms budget")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Refreshing a large admin table after one edit: rebuild vs. keyed diff.
+
+Fills a Treeview with 10k rows through tree_pager.TreePager, changes one row
+(as approve_place or update_user would) and reloads. The old pager deleted every
+item and inserted every row again; the pager now diffs the new rows against the
+items by id. Then one row is moved further down the order (as editing an event's
+date does) and reloaded again. Prints the time of each and how many items the
+diffs touched, and exits with status 1 if a single edit or move touches more
+than one row.
+Needs a display (Tk is started); rows come from memory instead of MySQL.
+
+    python benchmarks/bench_tree_diff.py [rows]
+"""
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+import ttkbootstrap  # adds the bootstyle option TreePager's widgets use
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tree_pager import TreePager
+
+
+class ListQuery:
+    """KeysetQuery interface over a list of rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetch_page(self, after=None, page_size=50):
+        start = after or 0
+        end = start + page_size
+        return self.rows[start:end], end if end < len(self.rows) else None
+
+    def count(self):
+        return len(self.rows)
+
+
+class InlineQueries:
+    """Runs a QueryService request right away on the calling thread."""
+
+    def submit(self, fn, *args, on_success=None, on_error=None, tag=None):
+        on_success(fn(*args))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rows = [(i, f"Place {i}", "General Santos City", "Beach") for i in range(1, count + 1)]
+
+    root = tk.Tk()
+    root.withdraw()
+    table = ttk.Treeview(root, columns=("ID", "Name", "Location", "Category"), show="headings")
+    scrollbar = ttk.Scrollbar(root, command=table.yview)
+    pager = TreePager(table, scrollbar, InlineQueries(), lambda row: row, root, "Error", page_size=count)
+
+    query = ListQuery(rows)
+    pager.load(query)
+    root.update_idletasks()
+    table.selection_set(str(count // 2))
+    table.yview_moveto(0.5)
+
+    # Old refresh: every item deleted and every row inserted again
+    start = time.perf_counter()
+    table.delete(*table.get_children())
+    for row in rows:
+        table.insert("", tk.END, iid=str(row[0]), values=row)
+    root.update_idletasks()
+    rebuild_ms = (time.perf_counter() - start) * 1000
+    pager.rows = {str(row[0]): row for row in rows}
+    table.selection_set(str(count // 2))
+    table.yview_moveto(0.5)
+    top = table.yview()[0]
+
+    # One edit, then the diffed reload
+    rows[count // 3] = rows[count // 3][:3] + ("Mountains",)
+    start = time.perf_counter()
+    pager.reload()
+    root.update_idletasks()
+    diff_ms = (time.perf_counter() - start) * 1000
+    edit_touched = pager.touched
+    edit_kept = table.selection() == (str(count // 2),), abs(table.yview()[0] - top) < 1e-6
+
+    # One row moving later in the order shifts every row in between by one place
+    rows.insert(count * 3 // 4, rows.pop(count // 4))
+    start = time.perf_counter()
+    pager.reload()
+    root.update_idletasks()
+    move_ms = (time.perf_counter() - start) * 1000
+    in_order = list(table.get_children()) == [str(row[0]) for row in rows]
+
+    print(f"{count:,} rows\n")
+    print(f"delete all + insert all: {rebuild_ms:9.1f} ms, {count:,} items rebuilt")
+    print(f"diff, one row changed:   {diff_ms:9.1f} ms, {edit_touched} item(s) touched")
+    print(f"diff, one row moved:     {move_ms:9.1f} ms, {pager.touched} item(s) touched, in order: {in_order}")
+    print(f"selection kept: {edit_kept[0]}, scroll kept: {edit_kept[1]}")
+    root.destroy()
+    sys.exit(0 if edit_touched == 1 and pager.touched == 1 and in_order else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""EXPLAIN check: fail if a hot dashboard query has to scan a whole table.
+
+Builds a scratch copy of the schema from tourism_db.sql, applies every migration,
+seeds it with a few thousand rows per table, then EXPLAINs the queries the
+dashboards run most. The check fails (exit status 1) when any of them reads a
+table with a full scan (type ALL), unless that table and query are listed in
+KNOWN_FULL_SCANS with the reason the scan is expected.
+Requires a local MySQL/MariaDB server that the DB_CONFIG user can create databases on.
+
+    python benchmarks/check_query_plans.py [--keep]
+"""
+import os
+import random
+import sys
+from datetime import date, datetime, time, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import mysql.connector
+
+import database
+import migrations
+import autocomplete
+import ratings
+from pagination import KeysetQuery
+from search import SearchQuery
+
+SCRATCH_DB = "tourism_db_plancheck"
+SCHEMA_FILE = os.path.join(ROOT, "tourism_db.sql")
+
+SEED_USERS = 5000
+SEED_PLACES = 5000
+SEED_EVENTS = 20000
+SEED_REVIEWS = 50000
+SEED_REPLIES = 10000
+
+PLACE_CATEGORIES = ["Beach", "Mountains", "Museum", "Camping", "Hiking", "Farm", "Waterfalls", "Golf"]
+EVENT_CATEGORIES = ["Festival", "Concert", "Exhibition", "Sports", "Conference", "Workshop"]
+
+# Full scans that are expected: (query label, table) -> reason
+KNOWN_FULL_SCANS = {
+    ("user: explore places", "places"):
+        "returns every approved place (most of the table); reading it whole beats the status index",
+    ("user: events grid", "events"):
+        "returns every approved, live event (most of the table); reading it whole beats the status index",
+}
+
+
+def schema_statements():
+    """CREATE TABLE / key definitions from the dump, without data or foreign keys."""
+    with open(SCHEMA_FILE, "r", encoding="utf-8") as f:
+        statements = migrations.split_statements(f.read())
+    return [statement for statement in statements
+            if statement.startswith(("CREATE TABLE", "ALTER TABLE")) and "CONSTRAINT" not in statement]
+
+
+def create_scratch_database(name=SCRATCH_DB):
+    """Connection to a freshly created, empty copy of the schema (without migrations)."""
+    config = {key: value for key, value in database.DB_CONFIG.items() if key != "database"}
+    conn = mysql.connector.connect(**config)
+    cursor = conn.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {name}")
+    cursor.execute(f"CREATE DATABASE {name} CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci")
+    cursor.execute(f"USE {name}")
+    for statement in schema_statements():
+        cursor.execute(statement)
+    cursor.close()
+    conn.database = name
+    return conn
+
+
+def drop_scratch_database(conn, name=SCRATCH_DB):
+    cursor = conn.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {name}")
+    cursor.close()
+
+
+def random_datetime(days_back=730):
+    return datetime.now() - timedelta(days=random.randint(0, days_back), seconds=random.randint(0, 86399))
+
+
+def maybe_deleted(share=0.05):
+    return random_datetime() if random.random() < share else None
+
+
+def seed(conn):
+    random.seed(42)
+    cursor = conn.cursor()
+    cursor.executemany(
+        "INSERT INTO user_accounts (id, username, address, email, phone, password_hash, role, status, date_deleted, last_activity) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        [(i, f"user{i}", f"Street {i}", f"user{i}@example.com", "09170000000", "x",
+          "admin" if i % 50 == 0 else "user", "active", maybe_deleted(), random_datetime())
+         for i in range(1, SEED_USERS + 1)])
+    cursor.executemany(
+        "INSERT INTO places (id, user_id, image, name, description, category, location, status, date_deleted) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        [(i, random.randint(1, SEED_USERS), f"uploads/place{i}.jpg", f"Place {i}", "Description",
+          random.choice(PLACE_CATEGORIES), f"Town {i % 200}",
+          random.choices(["approved", "pending", "rejected"], [0.6, 0.3, 0.1])[0], maybe_deleted())
+         for i in range(1, SEED_PLACES + 1)])
+    cursor.executemany(
+        "INSERT INTO events (id, image, name, description, location, time, date, category, is_free, status, user_id, date_deleted) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        [(i, f"uploads/event{i}.jpg", f"Event {i}", "Description", f"Town {i % 200}",
+          time(random.randint(6, 22), random.choice([0, 30])), date.today() + timedelta(days=random.randint(-365, 365)),
+          random.choice(EVENT_CATEGORIES), random.randint(0, 1),
+          random.choices(["approved", "pending", "rejected"], [0.6, 0.3, 0.1])[0],
+          random.randint(1, SEED_USERS), maybe_deleted())
+         for i in range(1, SEED_EVENTS + 1)])
+    cursor.executemany(
+        "INSERT INTO reviews (id, place_id, user_id, rating, comment, date_created, date_deleted) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+        [(i, random.randint(1, SEED_PLACES), random.randint(1, SEED_USERS), random.randint(1, 5), "Comment",
+          random_datetime(), maybe_deleted())
+         for i in range(1, SEED_REVIEWS + 1)])
+    cursor.executemany(
+        "INSERT INTO review_replies (id, review_id, admin_id, reply_text, date_created) VALUES (%s, %s, %s, %s, %s)",
+        [(i, random.randint(1, SEED_REVIEWS), 50, "Thanks!", random_datetime()) for i in range(1, SEED_REPLIES + 1)])
+    cursor.executemany(
+        "INSERT IGNORE INTO saved_places (user_id, place_id) VALUES (%s, %s)",
+        [(random.randint(1, SEED_USERS), random.randint(1, SEED_PLACES)) for _ in range(20000)])
+    # Migration 005 backfilled the aggregates before there were reviews
+    cursor.execute(ratings.REBUILD_QUERY)
+    conn.commit()
+    for table in ("user_accounts", "places", "events", "reviews", "review_replies", "saved_places",
+                  "place_rating_stats"):
+        cursor.execute(f"ANALYZE TABLE {table}")
+        cursor.fetchall()
+    cursor.close()
+
+
+def middle_key(conn, query):
+    """Sort key of a row halfway through the query's results, for a deep keyset page."""
+    cursor = conn.cursor()
+    sql, params = query.page_sql(None, 10 ** 9)
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return query.key_of(rows[len(rows) // 2])
+
+
+def hot_queries(conn):
+    """(label, sql, params, paged) for the queries the dashboards run most."""
+    admin_events = KeysetQuery("id, name, category, date, time, location", "events",
+                               order=[("date", "DESC", 3), ("time", "ASC", 4), ("id", "ASC", 0)])
+    admin_places = KeysetQuery("id, name, location, category", "places", order=[("id", "ASC", 0)])
+    admin_users = KeysetQuery("id, username, address, email, phone, role, status, last_activity",
+                              "user_accounts", order=[("id", "ASC", 0)])
+    events_by_category = KeysetQuery("id, name, category, date, time, location", "events",
+                                     order=admin_events.order,
+                                     where=["date_deleted IS NULL", "category = %s"], params=["Concert"])
+    events_by_date = KeysetQuery("id, name, category, date, time, location", "events",
+                                 order=admin_events.order,
+                                 where=["date_deleted IS NULL", "date = %s"], params=[date.today()])
+    users_by_role = KeysetQuery(admin_users.columns, "user_accounts", order=admin_users.order,
+                                where=["date_deleted IS NULL", "role = %s"], params=["admin"])
+    # Same shape as UserDashboard.reviews_query (All Reviews popup)
+    review_columns = "r.id, r.user_id, u.username, p.name AS place_name, r.rating, r.comment, r.date_created"
+    review_tables = "reviews r JOIN user_accounts u ON r.user_id = u.id JOIN places p ON r.place_id = p.id"
+    review_order = [("r.date_created", "DESC", 6), ("r.id", "DESC", 0)]
+    all_reviews = KeysetQuery(review_columns, review_tables, order=review_order, where=["r.date_deleted IS NULL"])
+    place_reviews = KeysetQuery(review_columns, review_tables, order=review_order,
+                                where=["r.date_deleted IS NULL", "r.place_id = %s"], params=[42])
+    my_reviews = KeysetQuery(review_columns, review_tables, order=review_order,
+                             where=["r.date_deleted IS NULL", "r.user_id = %s"], params=[7])
+    today = datetime.combine(date.today(), time())
+    # Same shape as the Explore Places cards in user_dashboard.py
+    card_columns = ("places.id, places.name, places.category, places.description, places.image, "
+                    "places.location, place_rating_stats.avg_rating, place_rating_stats.rating_count")
+    card_tables = "places LEFT JOIN place_rating_stats ON place_rating_stats.place_id = places.id"
+
+    queries = [
+        ("user: explore places",
+         f"SELECT {card_columns} FROM {card_tables} WHERE places.status = 'approved'", (), False),
+        ("user: explore places by category",
+         f"SELECT {card_columns} FROM {card_tables} "
+         "WHERE places.status = 'approved' AND places.category = %s", ("Beach",), False),
+        ("user: explore places, top rated",
+         f"SELECT STRAIGHT_JOIN {card_columns} "
+         "FROM place_rating_stats JOIN places ON places.id = place_rating_stats.place_id "
+         "WHERE place_rating_stats.avg_rating IS NOT NULL AND (places.status = 'approved') "
+         "ORDER BY place_rating_stats.avg_rating DESC, place_rating_stats.rating_count DESC", (), False),
+        ("user: saved places",
+         f"SELECT {card_columns} FROM saved_places JOIN places ON saved_places.place_id = places.id "
+         "LEFT JOIN place_rating_stats ON place_rating_stats.place_id = places.id "
+         "WHERE saved_places.user_id = %s", (7,), False),
+        ("user: review form places by category",
+         "SELECT id, name, description, category, location, image FROM places WHERE category = %s", ("Museum",), False),
+        ("user: events grid",
+         "SELECT id, name, description, category, location, date, time, image, is_free FROM events "
+         "WHERE status = 'approved' AND date_deleted IS NULL ORDER BY date ASC", (), False),
+        ("admin: pending places",
+         "SELECT p.*, u.username, u.email FROM places p LEFT JOIN user_accounts u ON p.user_id = u.id "
+         "WHERE p.status = 'pending' AND p.date_deleted IS NULL", (), False),
+        ("admin: pending events",
+         "SELECT e.*, u.username, u.email FROM events e LEFT JOIN user_accounts u ON e.user_id = u.id "
+         "WHERE e.status = 'pending' AND e.date_deleted IS NULL", (), False),
+        ("admin: feedback for a day",
+         "SELECT r.id, ua.username, p.name, r.rating, r.comment, r.date_created FROM reviews r "
+         "JOIN user_accounts ua ON r.user_id = ua.id JOIN places p ON r.place_id = p.id "
+         "WHERE r.date_deleted IS NULL AND r.date_created >= %s AND r.date_created < %s "
+         "ORDER BY r.date_created DESC", (today - timedelta(days=30), today - timedelta(days=29)), False),
+        ("admin: replies of a review",
+         "SELECT rr.id, rr.review_id, ua.username, rr.reply_text FROM review_replies rr "
+         "JOIN user_accounts ua ON rr.admin_id = ua.id WHERE rr.review_id = %s AND rr.date_deleted IS NULL "
+         "ORDER BY rr.date_created DESC", (123,), False),
+        ("user: autocomplete refresh, places",
+         autocomplete.SOURCES["places"][0] + autocomplete.CHANGED_SINCE, (today, today, today), False),
+        ("user: autocomplete refresh, events",
+         autocomplete.SOURCES["events"][0] + autocomplete.CHANGED_SINCE, (today, today, today), False),
+        ("login: user by username",
+         "SELECT id, password_hash, role FROM user_accounts WHERE username = %s", ("user10",), False),
+    ]
+    for label, query in (("admin: events table", admin_events),
+                         ("admin: places table", admin_places),
+                         ("admin: users table", admin_users),
+                         ("admin: events by category", events_by_category),
+                         ("admin: events on a date", events_by_date),
+                         ("admin: users by role", users_by_role),
+                         ("user: all reviews popup", all_reviews),
+                         ("user: reviews of a place", place_reviews),
+                         ("user: my reviews", my_reviews)):
+        queries.append((f"{label} (first page)",) + query.page_sql(None, 101) + (True,))
+        queries.append((f"{label} (deep page)",) + query.page_sql(middle_key(conn, query), 101) + (True,))
+    for label, query in (
+            ("user: explore places search",
+             SearchQuery(card_tables, card_columns, "town 12", where=["places.status = 'approved'"])),
+            ("user: review form place search",
+             SearchQuery("places", "id, name, description, category, location, image", "place 12")),
+            ("user: events search",
+             SearchQuery("events", "id", "concert town", where=["status = 'approved'", "date_deleted IS NULL"])),
+            ("admin: places search", SearchQuery("places", "id, name, location, category", "museum",
+                                                 where=["date_deleted IS NULL"])),
+            ("admin: events search", SearchQuery("events", "id, name, category, date, time, location", "festival",
+                                                 where=["date_deleted IS NULL"])),
+            ("admin: places search, short word", SearchQuery("places", "id, name, location, category", "pl",
+                                                             where=["date_deleted IS NULL"]))):
+        queries.append((label,) + query.page_sql(None, 101) + (True,))
+    return queries
+
+
+def check_plan(conn, label, sql, params, paged):
+    """Print the plan and return a list of problems found in it."""
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute("EXPLAIN " + sql, params)
+    plan = cursor.fetchall()
+    cursor.close()
+
+    problems = []
+    print(label)
+    for row in plan:
+        print(f"    {row['table'] or '-':<15} type={row['type'] or '-':<7} key={row['key'] or '-':<28} "
+              f"rows={row['rows'] or 0:<7} {row['Extra'] or ''}")
+        if row["type"] != "ALL":
+            continue
+        reason = KNOWN_FULL_SCANS.get((label, row["table"]))
+        if reason:
+            print(f"    (allowed full scan of {row['table']}: {reason})")
+        elif not row["possible_keys"]:
+            problems.append(f"full scan of {row['table']}: no index matches the query")
+        elif paged:
+            problems.append(f"paged query scans all of {row['table']}")
+        else:
+            problems.append(f"full scan of {row['table']}: the optimizer skipped {row['possible_keys']}")
+    return problems
+
+
+def main():
+    keep = "--keep" in sys.argv[1:]
+    conn = create_scratch_database()
+    try:
+        applied = migrations.migrate(conn)
+        print(f"Applied migrations: {', '.join(f'{version:03d}' for version in applied) or 'none'}")
+        seed(conn)
+
+        failures = []
+        for label, sql, params, paged in hot_queries(conn):
+            problems = check_plan(conn, label, sql, params, paged)
+            failures.extend(f"{label}: {problem}" for problem in problems)
+    finally:
+        if not keep:
+            drop_scratch_database(conn)
+        conn.close()
+
+    if failures:
+        print("\nFAILED")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nOK: no hot query scans a whole table (except the known full scans)")
+
+
+if __name__ == "__main__":
+    main()
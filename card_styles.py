@@ -0,0 +1,31 @@
+"""Fixed ttk styles for the badges on event cards.
+
+Every style is configured once by register() at startup. Cards only pick one of
+these names, so refreshing the event grid never adds styles to the ttk style
+database or triggers theme work.
+"""
+# Badge colors
+CATEGORY_COLOR = "#1e88e5"
+FREE_COLOR = "#4caf50"
+PAID_COLOR = "#f44336"
+
+CATEGORY_STYLE = "EventCategory.TLabel"
+FREE_STYLE = "EventFree.TLabel"
+PAID_STYLE = "EventPaid.TLabel"
+
+# Style name -> background color of every badge style
+PALETTE = {
+    CATEGORY_STYLE: CATEGORY_COLOR,
+    FREE_STYLE: FREE_COLOR,
+    PAID_STYLE: PAID_COLOR,
+}
+
+
+def register(style):
+    """Configure the badge styles on a ttk/ttkbootstrap Style (once, at startup)."""
+    for name, color in PALETTE.items():
+        style.configure(name, background=color, foreground="white")
+
+
+def fee_style(is_free):
+    return FREE_STYLE if is_free else PAID_STYLE
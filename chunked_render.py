@@ -0,0 +1,84 @@
+"""Builds long lists of widgets a slice at a time so the window stays responsive.
+
+ChunkedRenderer calls build(item, index) for as many items as fit in one frame
+budget, then yields to Tk (`after idle` followed by `after 0`, so pending input
+and redraws run) before building the next slice. It reports progress after
+every slice, and stops when cancelled or when its widget is destroyed. An item
+whose build raises is logged and skipped, so one bad row can't stop the list.
+"""
+import logging
+import time
+import tkinter as tk
+
+from live_search import FRAME_BUDGET_MS
+
+
+class ChunkedRenderer:
+    """Build widgets for items in time-boxed batches on the Tk thread.
+
+    on_progress(done, total) runs after every batch and on_done() once every item
+    is built (not after cancel()). `failed` counts the items whose build raised.
+    """
+
+    def __init__(self, widget, items, build, on_progress=None, on_done=None, budget_ms=FRAME_BUDGET_MS):
+        self.widget = widget
+        self.items = items
+        self.build = build
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.budget = budget_ms / 1000
+        self.done = 0
+        self.failed = 0
+        self.total = len(items)
+        self.running = False
+        self._after_id = None
+
+    def start(self):
+        """Build the first batch now and the rest in later slices; returns self."""
+        self.running = True
+        self._step()
+        return self
+
+    def cancel(self):
+        """Stop building (the cards built so far stay)."""
+        self.running = False
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _yield(self):
+        # after idle lets Tk redraw first; after 0 then waits behind pending input events
+        self._after_id = self.widget.after_idle(self._after_input)
+
+    def _after_input(self):
+        self._after_id = self.widget.after(0, self._step)
+
+    def _step(self):
+        self._after_id = None
+        if not self.running:
+            return
+        if not self.widget.winfo_exists():
+            self.running = False
+            return
+        deadline = time.perf_counter() + self.budget
+        # At least one item per slice, however slow it is to build
+        while self.done < self.total:
+            try:
+                self.build(self.items[self.done], self.done)
+            except Exception as e:
+                self.failed += 1
+                logging.error(f"❌ Error building item {self.done}: {e}")
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+        if self.on_progress is not None:
+            self.on_progress(self.done, self.total)
+        if self.done < self.total:
+            self._yield()
+            return
+        self.running = False
+        if self.on_done is not None:
+            self.on_done()
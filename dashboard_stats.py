@@ -0,0 +1,72 @@
+import threading
+import time
+
+import database
+
+# Seconds the admin dashboard statistics are reused before they are recounted
+STATS_CACHE_TTL = 30
+
+# Every count in one round trip; soft-deleted rows are left out
+STATS_QUERY = """
+    SELECT 'places' AS entity, status, COUNT(*) FROM places WHERE date_deleted IS NULL GROUP BY status
+    UNION ALL
+    SELECT 'events', status, COUNT(*) FROM events WHERE date_deleted IS NULL GROUP BY status
+    UNION ALL
+    SELECT 'reviews', NULL, COUNT(*) FROM reviews WHERE date_deleted IS NULL
+    UNION ALL
+    SELECT 'users', status, COUNT(*) FROM user_accounts WHERE date_deleted IS NULL GROUP BY status
+"""
+
+ENTITIES = ("places", "events", "reviews", "users")
+# Status breakdown shown under each total, in display order
+STATUS_ORDER = {
+    "places": ("approved", "pending", "rejected"),
+    "events": ("approved", "pending", "rejected"),
+    "reviews": (),
+    "users": ("active", "inactive"),
+}
+
+_lock = threading.Lock()
+_stats = None
+_computed_at = 0.0
+
+
+def fetch_stats():
+    """Run the aggregate query: {entity: {"total": n, <status>: n, ...}}."""
+    stats = {entity: {"total": 0} for entity in ENTITIES}
+    for entity, status, count in database.fetch_all(STATS_QUERY):
+        stats[entity]["total"] += count
+        if status is not None:
+            stats[entity][status] = stats[entity].get(status, 0) + count
+    return stats
+
+
+def cached_stats():
+    """The cached statistics if they are still fresh, else None (never queries)."""
+    with _lock:
+        if _stats is not None and time.monotonic() - _computed_at < STATS_CACHE_TTL:
+            return _stats
+    return None
+
+
+def get_stats():
+    """Statistics from the cache, or from one aggregate query when the cache is stale."""
+    global _stats, _computed_at
+    stats = cached_stats()
+    if stats is not None:
+        return stats
+    started = time.monotonic()
+    stats = fetch_stats()
+    with _lock:
+        # Don't cache a result that an invalidate() during the query made stale
+        if _computed_at <= started:
+            _stats, _computed_at = stats, time.monotonic()
+    return stats
+
+
+def invalidate():
+    """Drop the cached statistics (after a write that changes a count or status)."""
+    global _stats, _computed_at
+    with _lock:
+        _stats = None
+        _computed_at = time.monotonic()
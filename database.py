@@ -0,0 +1,271 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import mysql.connector
+from mysql.connector import errors
+
+# Database connection settings (XAMPP MySQL)
+DB_CONFIG = {
+    "host": "localhost",
+    "user": "root",
+    "password": "",
+    "database": "tourism_db"
+}
+
+# Pool tuning
+POOL_MAX_SIZE = 5            # Hard upper bound on open connections
+POOL_ACQUIRE_TIMEOUT = 10    # Seconds to wait for a free connection before giving up
+POOL_IDLE_TIMEOUT = 300      # Idle connections older than this are closed by the reaper
+POOL_HEALTH_CHECK_AFTER = 30 # Idle connections older than this are pinged before reuse
+
+# Error codes that mean the server connection itself is gone
+CONNECTION_LOST_ERRNOS = {2006, 2013, 2055}
+
+
+class PooledConnection:
+    """Wrapper around a MySQL connection that returns it to the pool on close()."""
+
+    def __init__(self, pool, conn):
+        self._pool = pool
+        self._conn = conn
+
+    def __getattr__(self, name):
+        # Delegate cursor(), commit(), rollback(), etc. to the real connection
+        return getattr(self._conn, name)
+
+    def is_connected(self):
+        return self._conn is not None and self._conn.is_connected()
+
+    def close(self):
+        """Give the connection back to the pool instead of closing the socket."""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool.release(conn)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ConnectionPool:
+    """Bounded, thread-safe MySQL connection pool with health checks and idle reaping."""
+
+    def __init__(self, config, max_size=POOL_MAX_SIZE, acquire_timeout=POOL_ACQUIRE_TIMEOUT,
+                 idle_timeout=POOL_IDLE_TIMEOUT, health_check_after=POOL_HEALTH_CHECK_AFTER):
+        self.config = dict(config)
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+
+        self._idle = []     # (connection, last_used) pairs, most recently used last
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._reaper = None
+
+    def _connect(self):
+        conn = mysql.connector.connect(**self.config)
+        logging.info("✅ Connected to MySQL successfully.")
+        return conn
+
+    def _close_quietly(self, conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _ensure_healthy(self, conn):
+        """Ping a connection that sat idle; replace it if the server dropped it."""
+        try:
+            conn.ping(reconnect=True, attempts=2, delay=0)
+            return conn
+        except errors.Error as e:
+            logging.warning(f"Discarding stale pooled connection: {e}")
+            self._close_quietly(conn)
+            return self._connect()
+
+    def _start_reaper(self):
+        if self._reaper is None:
+            self._reaper = threading.Thread(target=self._reap_loop, name="db-pool-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self):
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                self._cond.wait(self.idle_timeout / 2)
+                expired = self._take_expired_locked()
+            for conn in expired:
+                self._close_quietly(conn)
+
+    def _take_expired_locked(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        expired = [conn for conn, last_used in self._idle if last_used < cutoff]
+        if expired:
+            self._idle = [(conn, last_used) for conn, last_used in self._idle if last_used >= cutoff]
+        return expired
+
+    def acquire(self):
+        """Borrow a connection, waiting up to acquire_timeout when the pool is exhausted."""
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._cond:
+            if self._closed:
+                raise errors.PoolError("Connection pool is closed")
+            while True:
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._in_use < self.max_size:
+                    conn, last_used = None, None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise errors.PoolError("Timed out waiting for a database connection")
+                self._cond.wait(remaining)
+            self._in_use += 1
+            self._start_reaper()
+
+        try:
+            if conn is None:
+                conn = self._connect()
+            elif time.monotonic() - last_used > self.health_check_after:
+                conn = self._ensure_healthy(conn)
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        return PooledConnection(self, conn)
+
+    def release(self, conn):
+        """Return a connection to the pool, dropping it if it is no longer usable."""
+        reusable = False
+        try:
+            if conn.is_connected():
+                # Never hand out a connection with a half-finished transaction or
+                # an old REPEATABLE READ snapshot
+                if conn.in_transaction:
+                    conn.rollback()
+                reusable = True
+        except errors.Error as e:
+            logging.warning(f"Dropping pooled connection on release: {e}")
+
+        with self._cond:
+            self._in_use -= 1
+            if reusable and not self._closed:
+                self._idle.append((conn, time.monotonic()))
+                conn = None
+            self._cond.notify()
+        if conn is not None:
+            self._close_quietly(conn)
+
+    def close(self):
+        """Close every idle connection and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+        logging.info("✅ Database connection closed.")
+
+    def stats(self):
+        with self._cond:
+            return {"idle": len(self._idle), "in_use": self._in_use, "max_size": self.max_size}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = ConnectionPool(DB_CONFIG)
+        return _pool
+
+
+def get_connection():
+    """Borrow a pooled connection. Call close() on it to give it back."""
+    return get_pool().acquire()
+
+
+def prewarm(count):
+    """Open up to `count` pooled connections ahead of their first use (during the splash screen)."""
+    pool = get_pool()
+    connections = []
+    try:
+        # Borrowing them all at once forces new connections; closing returns them to the idle list
+        for _ in range(min(count, pool.max_size)):
+            connections.append(pool.acquire())
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+def close_pool():
+    """Close the shared pool (used on application exit)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+@contextmanager
+def cursor(dictionary=False):
+    """Yield a cursor on a pooled connection; commits on success, rolls back on error."""
+    conn = get_connection()
+    cur = conn.cursor(dictionary=dictionary, buffered=True)
+    try:
+        yield cur
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except errors.Error:
+            pass
+        raise
+    finally:
+        try:
+            cur.close()
+        finally:
+            conn.close()
+
+
+def _run_read(query, params, dictionary, fetch):
+    # Reads are safe to retry once if the server dropped the connection mid-query
+    for attempt in range(2):
+        try:
+            with cursor(dictionary=dictionary) as cur:
+                cur.execute(query, params or ())
+                return fetch(cur)
+        except (errors.OperationalError, errors.InterfaceError) as e:
+            if attempt or getattr(e, "errno", None) not in CONNECTION_LOST_ERRNOS:
+                raise
+            logging.warning(f"Lost database connection, retrying query: {e}")
+
+
+def fetch_all(query, params=None, dictionary=False):
+    """Run a SELECT and return all rows."""
+    return _run_read(query, params, dictionary, lambda cur: cur.fetchall())
+
+
+def fetch_one(query, params=None, dictionary=False):
+    """Run a SELECT and return the first row (or None)."""
+    return _run_read(query, params, dictionary, lambda cur: cur.fetchone())
+
+
+def execute(query, params=None):
+    """Run an INSERT/UPDATE/DELETE, commit it and return the cursor's lastrowid."""
+    with cursor() as cur:
+        cur.execute(query, params or ())
+        return cur.lastrowid
@@ -0,0 +1,107 @@
+"""In-memory index of the loaded events for the user events page.
+
+Built once when the events arrive. Every facet value (category, location, fee,
+month, year) and every lowercased word maps to a bitset of event positions, kept
+as a Python int, so combined filters are `&` of a few ints instead of passes over
+the event list, and facet counts are popcounts of the same masks.
+"""
+from bisect import bisect_left
+
+from search import search_words
+
+FACETS = ("category", "location", "fee", "month", "year")
+
+
+def _mask(positions, size):
+    """Bitset with the given positions set."""
+    bits = bytearray((size + 7) // 8)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+def count(mask):
+    return bin(mask).count("1")
+
+
+class EventIndex:
+    """Inverted word index and per-facet bitsets over a list of event dicts.
+
+    locations are the area names of the location filter; an event belongs to every
+    area its location mentions (e.g. "Lagao, General Santos City").
+    """
+
+    def __init__(self, events, locations=()):
+        self.events = list(events)
+        self.all = (1 << len(self.events)) - 1
+        locations = [location.lower() for location in locations]
+
+        word_positions = {}
+        facet_positions = {facet: {} for facet in FACETS}
+        for position, event in enumerate(self.events):
+            text = " ".join(str(event.get(field) or "") for field in ("name", "description", "category", "location"))
+            for word in set(search_words(text)):
+                word_positions.setdefault(word, []).append(position)
+
+            values = {"category": [(event.get("category") or "").lower()],
+                      "fee": ["free" if event.get("is_free", True) else "paid"],
+                      "location": [location for location in locations
+                                   if location in (event.get("location") or "").lower()]}
+            if event.get("date"):
+                values["month"] = [event["date"].month]
+                values["year"] = [event["date"].year]
+            for facet, facet_values in values.items():
+                for value in facet_values:
+                    facet_positions[facet].setdefault(value, []).append(position)
+
+        size = len(self.events)
+        self.words = {word: _mask(positions, size) for word, positions in word_positions.items()}
+        self.sorted_words = sorted(self.words)
+        self.facets = {facet: {value: _mask(positions, size) for value, positions in values.items()}
+                       for facet, values in facet_positions.items()}
+
+    def facet_mask(self, facet, value):
+        """Events with the given facet value (lowercased strings, month/year numbers)."""
+        return self.facets[facet].get(value, 0)
+
+    def text_mask(self, text):
+        """Events containing every word of text, each as a word prefix ("conc" finds "concert")."""
+        mask = self.all
+        for word in search_words(text):
+            matches = 0
+            # Words sharing the prefix are adjacent in sorted order
+            start = bisect_left(self.sorted_words, word)
+            for candidate in self.sorted_words[start:]:
+                if not candidate.startswith(word):
+                    break
+                matches |= self.words[candidate]
+            mask &= matches
+            if not mask:
+                break
+        return mask
+
+    def filter_mask(self, selection, text=""):
+        """Events matching every selected facet value ({facet: value}) and the text."""
+        mask = self.text_mask(text) if text else self.all
+        for facet, value in selection.items():
+            mask &= self.facet_mask(facet, value)
+        return mask
+
+    def select(self, mask):
+        """The events in mask, in their original order."""
+        # Bit i of the mask is character i of the reversed binary string
+        bits = bin(mask)[:1:-1]
+        return [self.events[position] for position, bit in enumerate(bits) if bit == "1"]
+
+    def facet_counts(self, selection, text=""):
+        """{facet: {value: n}}: events each value would leave, given the other selections.
+
+        A facet's own selection is ignored for its counts, so a dropdown shows what
+        choosing each of its values would give ("Free" concerts in May: 4).
+        """
+        counts = {}
+        for facet in FACETS:
+            others = {other: value for other, value in selection.items() if other != facet}
+            base = self.filter_mask(others, text)
+            counts[facet] = {value: count(base & mask) for value, mask in self.facets[facet].items()}
+        return counts
@@ -7,14 +7,19 @@ import bcrypt
 from dotenv import load_dotenv
 import os
 import sys
+import database
+from screen_router import ScreenRouter
 
-class Forgot(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Forgot Password")
-        self.geometry("400x530")
-        self.configure(bg="#000000")
-        self.resizable(False, False)
+class Forgot(tk.Frame):
+    def __init__(self, root, router):
+        super().__init__(root, bg="#000000")
+        self.root = root
+        self.router = router
+        self.root.title("Forgot Password")
+        self.root.geometry("400x530")
+        self.root.configure(bg="#000000")
+        self.root.resizable(False, False)
+        self.pack(fill="both", expand=True)
         
         # Load environment variables with PyInstaller compatibility
         try:
@@ -38,7 +43,8 @@ class Forgot(tk.Tk):
             messagebox.showerror("Configuration Error", 
                                f"Failed to load configuration: {str(e)}\n"
                                f"Please ensure .env file exists with required variables.")
-            self.destroy()
+            # Back to the login once this screen has been put up
+            self.root.after_idle(self.router.show_login)
             return
         
         # SMTP Configuration
@@ -48,20 +54,6 @@ class Forgot(tk.Tk):
         # Store verification codes
         self.verification_codes = {}
         
-        # Database Connection
-        try:
-            self.db = mysql.connector.connect(
-                host="localhost",
-                user="root",
-                password="",
-                database="tourism_db"
-            )
-            self.cursor = self.db.cursor()
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Failed to connect: {err}")
-            self.destroy()
-            return
-        
         # Widgets
         self.entry_email = None
         self.entry_code = None
@@ -219,12 +211,12 @@ class Forgot(tk.Tk):
     
     def center_window(self):
         """Center the window on screen"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f'{width}x{height}+{x}+{y}')
+        self.root.update_idletasks()
+        width = self.root.winfo_width()
+        height = self.root.winfo_height()
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f'{width}x{height}+{x}+{y}')
     
     def send_email(self, to_email, subject, message):
         """Send email using Brevo API"""
@@ -263,8 +255,7 @@ class Forgot(tk.Tk):
             return
 
         try:
-            self.cursor.execute("SELECT `email` FROM `user_accounts` WHERE `email` = %s", (email,))
-            user = self.cursor.fetchone()
+            user = database.fetch_one("SELECT `email` FROM `user_accounts` WHERE `email` = %s", (email,))
             if not user:
                 messagebox.showerror("Error", "Email not found in our records.")
                 return
@@ -298,9 +289,8 @@ class Forgot(tk.Tk):
             if email in self.verification_codes and self.verification_codes[email] == entered_code:
                 hashed_password = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
 
-                self.cursor.execute("UPDATE `user_accounts` SET `password_hash` = %s WHERE `email` = %s", 
-                                  (hashed_password, email))
-                self.db.commit()
+                database.execute("UPDATE `user_accounts` SET `password_hash` = %s WHERE `email` = %s", 
+                                 (hashed_password, email))
                 messagebox.showinfo("Success", "Password has been reset successfully!")
                 self.go_to_login()
             else:
@@ -321,20 +311,9 @@ class Forgot(tk.Tk):
     
     def go_to_login(self):
         """Return to login window"""
-        if hasattr(self, 'db') and self.db.is_connected():
-            self.cursor.close()
-            self.db.close()
-        self.destroy()
-        from login import LoginApp
-        login_app = LoginApp()
-        login_app.mainloop()
-    
-    def __del__(self):
-        """Clean up resources when object is destroyed"""
-        if hasattr(self, 'db') and self.db.is_connected():
-            self.cursor.close()
-            self.db.close()
+        self.router.show_login()
 
 if __name__ == "__main__":
-    app = Forgot()
-    app.mainloop()
\ No newline at end of file
+    root = tk.Tk()
+    ScreenRouter(root).show_forgot_password()
+    root.mainloop()
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""Typo-tolerant place name search with a trigram index.
+
+Full-text search only finds words that are spelled right ("Lake Seb" finds
+"Lake Sebu", "lake sebo" finds nothing). When a search has no full-text
+matches, FuzzyFallbackQuery asks the trigram index for names that look alike.
+Place names are split into words, and each word is indexed by its
+three-letter pieces ("sebu" -> "  s", " se", "seb", "ebu", "bu "). Candidates
+are the names sharing the most trigrams with the query, and only a bounded
+number of postings is read. They are then ranked by how well each query word
+matches its closest name word.
+
+The index lives in the process. It is built from the places table on first
+use and then refreshed with the rows changed since (see autocomplete.py for
+the same approach); apply_row() indexes a place this session just wrote.
+"""
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+
+import database
+from pagination import DEFAULT_PAGE_SIZE
+
+# Names whose similarity to the query is below this are not suggested (0..1)
+MIN_SIMILARITY = 0.3
+# Most postings read per lookup, rarest trigrams first (bounds the work on 100k+ rows)
+MAX_POSTINGS = 50000
+# Candidates scored exactly, by number of shared trigrams
+MAX_CANDIDATES = 500
+# Most fuzzy matches returned for one search
+MAX_RESULTS = 100
+# Seconds between incremental refreshes of the index
+REFRESH_INTERVAL = 60
+# Rebuild instead of patching once this share of the rows has changed
+REBUILD_RATIO = 0.2
+
+NAMES_QUERY = "SELECT id, name FROM places WHERE date_deleted IS NULL"
+CHANGED_QUERY = ("SELECT id, name, date_deleted FROM places "
+                 "WHERE date_created >= %s OR date_modified >= %s OR date_deleted >= %s")
+
+
+def words(text):
+    return [word for word in re.split(r"[\W_]+", (text or "").lower()) if word]
+
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def word_similarity(query_words, name):
+    """Mean, over the query words, of the best trigram Jaccard similarity with a name word."""
+    name_grams = [trigrams(word) for word in words(name)]
+    if not query_words or not name_grams:
+        return 0.0
+    total = 0.0
+    for word in query_words:
+        grams = trigrams(word)
+        total += max(len(grams & other) / len(grams | other) for other in name_grams)
+    return total / len(query_words)
+
+
+class TrigramIndex:
+    """Trigram postings (compact int arrays) over {id: name}.
+
+    Updates append to the postings and leave old entries behind; lookups check
+    candidates against the current names, and the owner rebuilds once enough
+    rows have changed.
+    """
+
+    def __init__(self, names=None):
+        self._lock = threading.Lock()
+        self.names = {}
+        self.postings = {}
+        self.changes = 0
+        self.refreshed_at = None
+        self.checked_at = 0.0
+        self.build(names or {})
+
+    def build(self, names):
+        postings = {}
+        for row_id, name in names.items():
+            for gram in {gram for word in words(name) for gram in trigrams(word)}:
+                postings.setdefault(gram, array("i")).append(row_id)
+        with self._lock:
+            self.names, self.postings, self.changes = dict(names), postings, 0
+
+    def update(self, row_id, name):
+        """Index a new or renamed row; name None removes it."""
+        with self._lock:
+            old = self.names.pop(row_id, None)
+            self.changes += 1
+            if name is None:
+                return
+            self.names[row_id] = name
+            present = {gram for word in words(old) for gram in trigrams(word)}
+            for gram in {gram for word in words(name) for gram in trigrams(word)} - present:
+                self.postings.setdefault(gram, array("i")).append(row_id)
+
+    def needs_rebuild(self):
+        return self.changes > REBUILD_RATIO * max(len(self.names), 100)
+
+    def lookup(self, text, limit=MAX_RESULTS, min_similarity=MIN_SIMILARITY):
+        """[(id, similarity)] of the names most like text, best first."""
+        query_words = words(text)
+        grams = {gram for word in query_words for gram in trigrams(word)}
+        with self._lock:
+            # Rare trigrams say the most and cost the least; stop after MAX_POSTINGS ids
+            lists = sorted((self.postings[gram] for gram in grams if gram in self.postings), key=len)
+            shared = Counter()
+            read = 0
+            for ids in lists:
+                if read + len(ids) > MAX_POSTINGS and read:
+                    break
+                shared.update(ids)
+                read += len(ids)
+            candidates = [(row_id, self.names[row_id]) for row_id, _ in shared.most_common(MAX_CANDIDATES)
+                          if row_id in self.names]
+        scored = [(row_id, word_similarity(query_words, name)) for row_id, name in candidates]
+        scored = [(row_id, score) for row_id, score in scored if score >= min_similarity]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored[:limit]
+
+
+_index = TrigramIndex()
+_refresh_lock = threading.Lock()
+
+
+def get_index():
+    """The place name index, brought up to date if it is older than REFRESH_INTERVAL.
+
+    Runs queries, so call it from a worker thread.
+    """
+    with _refresh_lock:
+        if time.monotonic() - _index.checked_at >= REFRESH_INTERVAL:
+            now = database.fetch_one("SELECT NOW()")[0]
+            if _index.refreshed_at is None or _index.needs_rebuild():
+                _index.build(dict(database.fetch_all(NAMES_QUERY)))
+            else:
+                since = _index.refreshed_at
+                for row_id, name, date_deleted in database.fetch_all(CHANGED_QUERY, (since, since, since)):
+                    _index.update(row_id, None if date_deleted is not None else name)
+            _index.refreshed_at = now
+            _index.checked_at = time.monotonic()
+    return _index
+
+
+def apply_row(row_id):
+    """Index one place that this session just wrote, without waiting for the next refresh.
+
+    Runs a query, so call it from a worker thread. Does nothing before the index is built.
+    """
+    with _refresh_lock:
+        if _index.refreshed_at is None:
+            return
+        row = database.fetch_one("SELECT name, date_deleted FROM places WHERE id = %s", (row_id,))
+        _index.update(row_id, row[0] if row is not None and row[1] is None else None)
+
+
+class FuzzyFallbackQuery:
+    """A search.SearchQuery over places that falls back to similar names when nothing matches.
+
+    Same interface as SearchQuery (fetch_page / fetch_all / count). Fuzzy rows carry
+    their similarity in the last column where SearchQuery has the relevance, and
+    `fuzzy` tells whether the results are approximate.
+    """
+
+    def __init__(self, search_query):
+        self.search_query = search_query
+        self.fuzzy = False
+        self._matches = None
+
+    def _similar(self):
+        """[(row, similarity)] of the similar names that pass the search's filters."""
+        if self._matches is None:
+            scores = dict(get_index().lookup(self.search_query.text))
+            rows = []
+            if scores:
+                query = self.search_query
+                placeholders = ", ".join(["%s"] * len(scores))
+                where = " AND ".join([f"{query.base_table}.id IN ({placeholders})"] +
+                                     [f"({clause})" for clause in query.where])
+                rows = database.fetch_all(f"SELECT {query.columns} FROM {query.table} WHERE {where}",
+                                          tuple(scores) + query.params)
+            # Columns start with the id, as in every place query
+            self._matches = sorted(((row + (scores[row[0]],)) for row in rows), key=lambda row: -row[-1])
+        return self._matches
+
+    def fetch_page(self, after=None, page_size=DEFAULT_PAGE_SIZE):
+        """Return (rows, key of the next page or None); keys are ("search", offset) or ("fuzzy", offset)."""
+        if after is None or after[0] == "search":
+            rows, next_offset = self.search_query.fetch_page(after and after[1], page_size)
+            if rows or after is not None:
+                return rows, ("search", next_offset) if next_offset is not None else None
+        self.fuzzy = True
+        offset = after[1] if after is not None else 0
+        matches = self._similar()
+        rows = matches[offset:offset + page_size]
+        return rows, ("fuzzy", offset + page_size) if offset + page_size < len(matches) else None
+
+    def fetch_all(self, limit=DEFAULT_PAGE_SIZE):
+        return self.fetch_page(None, limit)[0]
+
+    def count(self):
+        total = self.search_query.count()
+        return total if total else len(self._similar())
@@ -0,0 +1,142 @@
+import logging
+import os
+import threading
+import tkinter as tk
+from collections import OrderedDict
+
+from PIL import Image, ImageTk
+
+import thumbnails
+
+# Memory ceiling for decoded images kept alive between page visits
+IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Decoded PhotoImages are stored as 32-bit RGBA by Tk
+BYTES_PER_PIXEL = 4
+
+
+class ImageCache:
+    """LRU cache of Tk PhotoImages with a byte budget."""
+
+    def __init__(self, max_bytes=IMAGE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()   # key -> (photo, size in bytes, owning Tk root)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached PhotoImage for key (marking it most recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not tk._default_root:
+                # Created for a window that has since been destroyed (e.g. after logout)
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, photo):
+        """Cache a PhotoImage, evicting the least recently used ones to stay within budget."""
+        nbytes = photo.width() * photo.height() * BYTES_PER_PIXEL
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if nbytes > self.max_bytes:
+                return photo
+            # PhotoImages are created on the default root; they die with it
+            self._entries[key] = (photo, nbytes, tk._default_root)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return photo
+
+    def set_max_bytes(self, max_bytes):
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._entries and self.current_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key):
+        photo, nbytes, root = self._entries.pop(key)
+        self.current_bytes -= nbytes
+        # Tk keeps the pixels until the image is deleted, and any other Python reference
+        # (a closure, a hidden row) would keep the PhotoImage from doing it. Delete the
+        # image now unless a widget still shows it; that widget's reference frees it later.
+        try:
+            if not photo.tk.getboolean(photo.tk.call("image", "inuse", str(photo))):
+                photo.tk.call("image", "delete", str(photo))
+        except tk.TclError:
+            # Its window (and the image with it) is already gone
+            pass
+
+
+_cache = ImageCache()
+
+
+def get_cache():
+    """Return the process-wide image cache."""
+    return _cache
+
+
+def cache_key(path, size, fit=False):
+    # The mtime keeps a replaced file from being served from the cache
+    return (os.path.abspath(path), tuple(size), fit, os.stat(path).st_mtime_ns)
+
+
+def load_image(path, size, fit=False):
+    """Decode and resize an image file to a PIL image (no Tk objects; safe off the UI thread).
+
+    fit=False resizes to exactly `size` via the on-disk thumbnail cache; fit=True keeps the
+    aspect ratio inside `size`, as the admin preview thumbnails do.
+    """
+    if not fit:
+        return thumbnails.get_thumbnail(path, size)
+    image = Image.open(path)
+    # thumbnail() already uses JPEG draft mode to decode at reduced scale
+    image.thumbnail(tuple(size))
+    return image
+
+
+def get_photo(path, size, fit=False):
+    """Return a PhotoImage of `path` at `size`, reusing a cached one when possible."""
+    key = cache_key(path, size, fit)
+    photo = _cache.get(key)
+    if photo is None:
+        photo = _cache.put(key, ImageTk.PhotoImage(load_image(path, size, fit)))
+    return photo
+
+
+def log_stats():
+    stats = _cache.stats()
+    logging.info(
+        f"Image cache: {stats['entries']} images, {stats['bytes'] // 1024} KiB / "
+        f"{stats['max_bytes'] // 1024} KiB, hit rate {stats['hit_rate']:.0%} "
+        f"({stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions)"
+    )
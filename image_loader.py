@@ -0,0 +1,87 @@
+import logging
+import os
+import tkinter as tk
+
+from PIL import ImageTk
+
+import image_cache
+from query_service import QueryService
+
+# Decoding is CPU-bound in PIL (which releases the GIL), so use a few threads regardless of the DB pool
+IMAGE_DECODE_WORKERS = min(4, os.cpu_count() or 1)
+PLACEHOLDER_COLOR = "#e0e0e0"
+
+
+class ImageLoader:
+    """Decodes images on worker threads and swaps them into labels on the Tk thread.
+
+    load_into() shows a cached image immediately, or a flat placeholder of the final
+    size while the real image is decoded in the background. Labels that are reused
+    for another item (virtual scroller rows) only ever receive their latest image.
+    """
+
+    def __init__(self, root, max_workers=IMAGE_DECODE_WORKERS):
+        self.root = root
+        self._worker = QueryService(root, max_workers=max_workers)
+        self._placeholders = {}
+
+    def load_into(self, label, path, size, fit=False, on_error=None):
+        """Show `path` resized to `size` in `label`, decoding off the UI thread when not cached."""
+        try:
+            key = image_cache.cache_key(path, size, fit)
+        except OSError as e:
+            self._fail(label, None, on_error, e)
+            return
+        label.image_key = key
+
+        photo = image_cache.get_cache().get(key)
+        if photo is not None:
+            label.configure(image=photo, text="")
+            label.image = photo
+            return
+
+        placeholder = self.placeholder(size)
+        label.configure(image=placeholder, text="")
+        label.image = placeholder
+
+        # One outstanding decode per label: a recycled label supersedes its previous request
+        self._worker.submit(
+            image_cache.load_image, path, size, fit,
+            on_success=lambda image, l=label, k=key: self._deliver(l, k, image),
+            on_error=lambda e, l=label, k=key: self._fail(l, k, on_error, e),
+            tag=str(label)
+        )
+
+    def placeholder(self, size):
+        """Flat grey image of the given size, so layouts don't jump when the real image arrives."""
+        size = tuple(size)
+        photo = self._placeholders.get(size)
+        if photo is None:
+            photo = tk.PhotoImage(master=self.root, width=size[0], height=size[1])
+            photo.put(PLACEHOLDER_COLOR, to=(0, 0, size[0], size[1]))
+            self._placeholders[size] = photo
+        return photo
+
+    def cancel_all(self):
+        """Drop pending decodes (their labels are about to be destroyed)."""
+        self._worker.cancel_all()
+
+    def shutdown(self):
+        self._worker.shutdown()
+
+    def _deliver(self, label, key, image):
+        # The label may be gone, or showing a different item by now
+        if not label.winfo_exists() or getattr(label, "image_key", None) != key:
+            return
+        photo = image_cache.get_cache().put(key, ImageTk.PhotoImage(image))
+        label.configure(image=photo)
+        label.image = photo
+
+    def _fail(self, label, key, on_error, error):
+        logging.error(f"Error loading image: {error}")
+        if key is not None and (not label.winfo_exists() or getattr(label, "image_key", None) != key):
+            return
+        label.configure(image="")
+        label.image = None
+        if on_error:
+            on_error(label, error)
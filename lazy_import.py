@@ -0,0 +1,30 @@
+"""Deferred imports for heavy modules that only a few code paths use.
+
+    requests = lazy_module("requests")
+
+binds a module object whose code runs the first time one of its attributes is
+used, so importing the dashboards doesn't pay for it up front.
+"""
+import importlib.util
+import sys
+
+
+def lazy_module(name):
+    """Return module `name`, executing it on first attribute access.
+
+    Only works for `module.attribute` use; `from module import x` needs the
+    module loaded and should stay a regular import. A module that is already
+    imported is returned as is.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,137 @@
+"""Search-as-you-type for the dashboard search boxes.
+
+Typing restarts a short debounce timer, and only the text present when it
+expires is searched. Searches go through QueryService with a fixed tag, so a
+newer search supersedes one still in flight. When the text only grew and the
+previous results were complete, a refine callback can narrow them locally
+instead of querying again.
+
+Every keystroke's time on the Tk thread is recorded, and so is the time until
+its results were shown. log_stats() reports them against the frame budget.
+"""
+import logging
+import threading
+import time
+from collections import deque
+
+# Pause in typing (ms) before a search is sent
+DEBOUNCE_MS = 250
+# Time (ms) the Tk thread may spend on one keystroke without dropping a frame at 60 Hz
+FRAME_BUDGET_MS = 1000 / 60
+# Latency samples kept per search box
+MAX_SAMPLES = 500
+
+_lock = threading.Lock()
+_samples = {}
+
+
+def _record(name, kind, ms):
+    with _lock:
+        _samples.setdefault((name, kind), deque(maxlen=MAX_SAMPLES)).append(ms)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def stats():
+    """{(name, kind): {"count", "p50", "p95", "max", "over_budget"}} in ms.
+
+    kind is "keystroke" (time spent in the key handler) or "results" (keystroke
+    until its results were shown, debounce included).
+    """
+    with _lock:
+        samples = {key: list(values) for key, values in _samples.items()}
+    return {key: {"count": len(values), "p50": _percentile(values, 0.5), "p95": _percentile(values, 0.95),
+                  "max": max(values), "over_budget": sum(1 for value in values if value > FRAME_BUDGET_MS)}
+            for key, values in samples.items() if values}
+
+
+def log_stats():
+    for (name, kind), summary in sorted(stats().items()):
+        # Only the key handler blocks the Tk thread; results latency includes the debounce
+        budget = (f" ({summary['over_budget']} over the {FRAME_BUDGET_MS:.1f} ms frame budget)"
+                  if kind == "keystroke" else "")
+        logging.info(
+            f"Live search {name} {kind}: p50 {summary['p50']:.1f} ms, p95 {summary['p95']:.1f} ms, "
+            f"max {summary['max']:.1f} ms over {summary['count']} samples{budget}"
+        )
+
+
+class LiveSearch:
+    """Runs a search while the user types into an entry bound to variable.
+
+    run(text) starts the search (normally through QueryService with a fixed tag)
+    and the owner calls done(text) once its results are on screen. refine(previous,
+    text), if given, may narrow the results shown for previous to text on the Tk
+    thread and return True, or return False to have text searched normally.
+    """
+
+    def __init__(self, widget, variable, run, refine=None, delay=DEBOUNCE_MS, name="search"):
+        self.widget = widget
+        self.variable = variable
+        self.run = run
+        self.refine = refine
+        self.delay = delay
+        self.name = name
+
+        self._after_id = None
+        self._typed_at = None
+        self._shown_text = None
+        self._trace = variable.trace_add("write", self._on_change)
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _on_change(self, *args):
+        started = time.perf_counter()
+        text = self.variable.get().strip()
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self._typed_at = started
+
+        previous = self._shown_text
+        if (self.refine is not None and previous and text != previous and text.startswith(previous)
+                and self.refine(previous, text)):
+            self._shown_text = text
+            _record(self.name, "results", (time.perf_counter() - started) * 1000)
+        elif text != previous:
+            self._after_id = self.widget.after(self.delay, self._fire)
+        _record(self.name, "keystroke", (time.perf_counter() - started) * 1000)
+
+    def _fire(self):
+        self._after_id = None
+        self.run(self.variable.get().strip())
+
+    def search_now(self):
+        """Search the current text without waiting (Enter or the Search button)."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+        self._fire()
+
+    def is_current(self, text):
+        """Whether text is still what the entry holds (older results should be dropped)."""
+        return text == self.variable.get().strip()
+
+    def done(self, text):
+        """The results for text are shown (call from the search's success callback)."""
+        self._shown_text = text
+        # Results of a search the user has already typed past don't close a keystroke
+        if self._typed_at is not None and self.is_current(text):
+            _record(self.name, "results", (time.perf_counter() - self._typed_at) * 1000)
+            self._typed_at = None
+
+    def reset(self):
+        """Forget the shown results (e.g. after another filter replaced them)."""
+        self._shown_text = None
+
+    def _on_destroy(self, event):
+        if event.widget is not self.widget:
+            return
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        try:
+            self.variable.trace_remove("write", self._trace)
+        except Exception:
+            pass
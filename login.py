@@ -3,26 +3,17 @@ from tkinter import messagebox, ttk
 import mysql.connector
 import bcrypt
 from datetime import datetime
-
-class LoginApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Login")
-        self.configure(bg="#2c3e50")
-        
-        # Database connection
-        try:
-            self.db = mysql.connector.connect(
-                host="localhost",
-                user="root",
-                password="",
-                database="tourism_db"
-            )
-            self.cursor = self.db.cursor()
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Failed to connect: {err}")
-            self.destroy()
-            return
+import database
+from screen_router import ScreenRouter
+
+class LoginApp(tk.Frame):
+    def __init__(self, root, router):
+        super().__init__(root, bg="#2c3e50")
+        self.root = root
+        self.router = router
+        self.root.title("Login")
+        self.root.configure(bg="#2c3e50")
+        self.pack(fill="both", expand=True)
         
         # UI variables
         self.entry_username = None
@@ -38,11 +29,11 @@ class LoginApp(tk.Tk):
         # Calculate center position
         window_width = 400
         window_height = 450
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
         center_x = int(screen_width/2 - window_width/2)
         center_y = int(screen_height/2 - window_height/2)
-        self.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
+        self.root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
 
         style = ttk.Style()
         style.configure("TCombobox", padding=5, relief="flat", background="white")
@@ -98,17 +89,15 @@ class LoginApp(tk.Tk):
         lbl_forgot.bind("<Leave>", lambda e: lbl_forgot.config(font=("Arial", 12)))
 
     def setup_bindings(self):
-        # Key bindings for arrow navigation and Enter to login
-        self.bind('<Down>', self.on_arrow_key)
-        self.bind('<Up>', self.on_arrow_key)
-        self.bind('<Return>', self.login)  # Enter key to login
+        # Key bindings for arrow navigation and Enter to login (the router removes them with the screen)
+        self.root.bind('<Down>', self.on_arrow_key)
+        self.root.bind('<Up>', self.on_arrow_key)
+        self.root.bind('<Return>', self.login)  # Enter key to login
         self.entry_username.bind('<Return>', lambda e: self.entry_password.focus())
         self.entry_password.bind('<Return>', lambda e: self.combo_role.focus())
         self.combo_role.bind('<Return>', lambda e: self.btn_login.focus())
         self.btn_login.bind('<Return>', self.login)  # Enter key on login button
 
-        self.protocol("WM_DELETE_WINDOW", self.on_close)
-
     def login(self, event=None):
         username = self.entry_username.get().strip()
         password = self.entry_password.get().strip()
@@ -116,8 +105,7 @@ class LoginApp(tk.Tk):
 
         try:
             # Fetch user data from the database
-            self.cursor.execute("SELECT id, password_hash, role FROM user_accounts WHERE username = %s", (username,))
-            result = self.cursor.fetchone()
+            result = database.fetch_one("SELECT id, password_hash, role FROM user_accounts WHERE username = %s", (username,))
 
             if result:
                 user_id, stored_hash, db_role = result
@@ -126,22 +114,13 @@ class LoginApp(tk.Tk):
                 # Check if password is correct and role matches
                 if bcrypt.checkpw(password.encode(), stored_hash.encode()) and db_role == selected_role:
                     # Update last_activity and is_online
-                    self.cursor.execute("UPDATE user_accounts SET last_activity = %s, is_online = 1 WHERE id = %s", 
-                                      (datetime.now(), user_id))
-                    self.db.commit()
+                    database.execute("UPDATE user_accounts SET last_activity = %s, is_online = 1 WHERE id = %s", 
+                                     (datetime.now(), user_id))
 
                     messagebox.showinfo("Login Successful", f"Welcome, {username} ({db_role.capitalize()})!")
-                    self.destroy()
-
-                    # Redirect to the appropriate dashboard
-                    if db_role == "admin":
-                        from admin_dashboard import AdminDashboard
-                        admin_window = AdminDashboard(tk.Tk(), user_id)
-                        admin_window.mainloop()
-                    else:
-                        from user_dashboard import UserDashboard
-                        user_window = UserDashboard(tk.Tk(), user_id)
-                        user_window.mainloop()
+
+                    # Redirect to the appropriate dashboard (in this window)
+                    self.router.show_dashboard(db_role, user_id)
                 elif not bcrypt.checkpw(password.encode(), stored_hash.encode()):
                     messagebox.showerror("Login Failed", "Incorrect password!")
                 else:
@@ -152,16 +131,10 @@ class LoginApp(tk.Tk):
             messagebox.showerror("Database Error", f"Error during login: {err}")
 
     def open_register(self):
-        self.destroy()
-        from registration import Registration
-        register_window = Registration()
-        register_window.mainloop()
+        self.router.show_registration()
 
     def open_forgot_password(self, event=None):
-        self.destroy()
-        from forgot import Forgot
-        forgot_window = Forgot()
-        forgot_window.mainloop()
+        self.router.show_forgot_password()
 
     def toggle_password_visibility(self):
         if self.entry_password.cget('show') == '':
@@ -197,12 +170,7 @@ class LoginApp(tk.Tk):
             elif event.widget == self.btn_login:
                 self.combo_role.focus()
 
-    def on_close(self):
-        if hasattr(self, 'db') and self.db.is_connected():
-            self.cursor.close()
-            self.db.close()
-        self.destroy()
-
 if __name__ == "__main__":
-    app = LoginApp()
-    app.mainloop()
\ No newline at end of file
+    root = tk.Tk()
+    ScreenRouter(root).show_login()
+    root.mainloop()
\ No newline at end of file
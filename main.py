@@ -1,27 +1,66 @@
 import tkinter as tk
+import logging
+import time
+import mysql.connector
 from newsplashscreen import SplashScreen
-from login import LoginApp
+from screen_router import ScreenRouter
+import migrations
+from warmup import Warmup
+
+# The splash stays at least this long (so it doesn't just flash), and at most this long
+# (the warm-up then finishes in the background)
+SPLASH_MIN_MS = 1500
+SPLASH_MAX_MS = 20000
+# How often the splash checks on the warm-up (and runs its next Tk-thread step)
+WARMUP_POLL_MS = 100
 
 def main():
-    # Create a hidden root window (for splash screen)
-    splash_root = tk.Tk()
-    splash_root.withdraw()  
+    started = time.perf_counter()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    # Bring the schema up to date (a single lookup once every migration is applied)
+    try:
+        migrations.migrate()
+    except mysql.connector.Error as e:
+        logging.error(f"❌ Could not apply database migrations: {e}")
+    logging.info(f"✅ Startup migrations: {(time.perf_counter() - started) * 1000:.0f} ms")
 
-    # Show splash screen (pass parent if required)
-    splash = SplashScreen(splash_root)  # or SplashScreen(parent=splash_root)
+    # The one window of the app: hidden behind the splash, then every screen is shown in it
+    root = tk.Tk()
+    root.withdraw()
 
-    # After 5 seconds, destroy splash and show login
-    splash.after(6000, lambda: open_login(splash_root))
+    # Show splash screen; it closes once the warm-up is done and opens the login
+    splash = SplashScreen(root, on_close=lambda: open_login(root, warmup, started))
+    splash_shown = time.perf_counter()
+    logging.info(f"✅ Startup splash shown: {(splash_shown - started) * 1000:.0f} ms")
+
+    # Open connections and load caches while the splash animates; the polls import the dashboards
+    warmup = Warmup().start()
+    poll_warmup(splash, warmup, splash_shown)
     
-    splash_root.mainloop()
+    root.mainloop()
+
+def poll_warmup(splash, warmup, splash_shown):
+    """Keep the loading bar in step with the warm-up and let it finish when the warm-up is done."""
+    if not splash.winfo_exists():
+        return
+    # Dashboard imports touch Tk, so they run here on the Tk thread, one per poll
+    warmup.step()
+    elapsed_ms = (time.perf_counter() - splash_shown) * 1000
+    if (warmup.done and elapsed_ms >= SPLASH_MIN_MS) or elapsed_ms >= SPLASH_MAX_MS:
+        splash.set_progress_limit(100)
+        return
+    splash.set_progress_limit(int(warmup.progress() * 99))
+    splash.after(WARMUP_POLL_MS, poll_warmup, splash, warmup, splash_shown)
 
-def open_login(splash_root):
-    # Destroy splash and its root
-    splash_root.destroy()  
+def open_login(root, warmup, started):
+    warmup.report()
 
-    # Create LoginApp (as a standalone window)
-    login_app = LoginApp()  # No parent if it's tk.Tk()
-    login_app.mainloop()
+    # Login, registration, dashboards and logout all swap screens in this root
+    router = ScreenRouter(root)
+    root.deiconify()
+    router.show_login()
+    logging.info(f"✅ Startup login shown: {(time.perf_counter() - started) * 1000:.0f} ms")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
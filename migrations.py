@@ -0,0 +1,108 @@
+"""Versioned schema migrations.
+
+Each file in migrations/ named NNN_description.sql is applied once, in version
+order, and recorded in the schema_migrations table. Run `python migrations.py`
+to apply pending migrations, or `python migrations.py --status` to list them.
+"""
+import logging
+import os
+import re
+import sys
+
+import mysql.connector
+
+import database
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+MIGRATION_FILE = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+CREATE_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version int(11) NOT NULL PRIMARY KEY,
+        name varchar(255) NOT NULL,
+        applied_at datetime NOT NULL DEFAULT current_timestamp()
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci
+"""
+
+
+def available_migrations(directory=MIGRATIONS_DIR):
+    """(version, name, path) of every migration file, oldest first."""
+    migrations = []
+    for filename in os.listdir(directory):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    return sorted(migrations)
+
+
+def split_statements(sql):
+    """Split a migration file into statements, dropping -- comment lines."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [statement.strip() for statement in "\n".join(lines).split(";") if statement.strip()]
+
+
+def applied_versions(cursor):
+    cursor.execute(CREATE_MIGRATIONS_TABLE)
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+
+def migrate(connection=None, directory=MIGRATIONS_DIR):
+    """Apply every pending migration and return the versions applied.
+
+    Uses a pooled connection unless one is given (the plan check passes its own
+    connection to a scratch database).
+    """
+    conn = connection or database.get_connection()
+    cursor = conn.cursor(buffered=True)
+    applied = []
+    try:
+        done = applied_versions(cursor)
+        for version, name, path in available_migrations(directory):
+            if version in done:
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                statements = split_statements(f.read())
+            # DDL commits implicitly in MySQL, so a migration is recorded only once all of it ran
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name))
+            conn.commit()
+            applied.append(version)
+            logging.info(f"✅ Applied migration {version:03d}_{name}")
+    except mysql.connector.Error as e:
+        logging.error(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        cursor.close()
+        if connection is None:
+            conn.close()
+    return applied
+
+
+def status(connection=None, directory=MIGRATIONS_DIR):
+    """[(version, name, applied?)] for every migration file."""
+    conn = connection or database.get_connection()
+    cursor = conn.cursor(buffered=True)
+    try:
+        done = applied_versions(cursor)
+    finally:
+        cursor.close()
+        if connection is None:
+            conn.close()
+    return [(version, name, version in done) for version, name, _ in available_migrations(directory)]
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if "--status" in sys.argv[1:]:
+        for version, name, applied in status():
+            print(f"{version:03d}_{name:<40} {'applied' if applied else 'pending'}")
+    else:
+        applied = migrate()
+        print(f"Applied {len(applied)} migration(s)" if applied else "Schema is up to date")
+    database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
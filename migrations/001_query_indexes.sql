@@ -0,0 +1,30 @@
+-- Secondary indexes matching the dashboards' real WHERE / ORDER BY patterns.
+-- InnoDB appends the primary key to every secondary index, so an index on
+-- (date_deleted) already returns live rows in id order for the keyset pages.
+
+-- Explore Places / Saved Places (status = 'approved'), admin places table
+-- (date_deleted IS NULL ORDER BY id) and the category filters of both
+ALTER TABLE places
+  ADD INDEX idx_places_status (status, date_deleted),
+  ADD INDEX idx_places_deleted (date_deleted),
+  ADD INDEX idx_places_category (category, date_deleted),
+  ADD INDEX idx_places_name (name);
+
+-- User events grid (status = 'approved' AND date_deleted IS NULL ORDER BY date)
+-- and admin events table (date_deleted IS NULL [AND date = / category =] ORDER BY date DESC, time)
+ALTER TABLE events
+  ADD INDEX idx_events_status_date (status, date_deleted, date),
+  ADD INDEX idx_events_deleted_date (date_deleted, date, time),
+  ADD INDEX idx_events_category_date (category, date_deleted, date);
+
+-- Admin feedback (date_deleted IS NULL [AND date range] ORDER BY date_created DESC),
+-- the all-reviews list (ORDER BY date_created DESC) and per-place reviews
+ALTER TABLE reviews
+  ADD INDEX idx_reviews_deleted_created (date_deleted, date_created),
+  ADD INDEX idx_reviews_created (date_created),
+  ADD INDEX idx_reviews_place_created (place_id, date_created);
+
+-- Admin user table (date_deleted IS NULL ORDER BY id) and its role filter
+ALTER TABLE user_accounts
+  ADD INDEX idx_user_accounts_deleted (date_deleted),
+  ADD INDEX idx_user_accounts_role (role, date_deleted);
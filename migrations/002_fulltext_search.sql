@@ -0,0 +1,8 @@
+-- Full-text indexes behind search.py. Category is included so that searching
+-- "beach" or "festival" still finds places/events of that type.
+-- InnoDB builds one FULLTEXT index per statement.
+ALTER TABLE places
+  ADD FULLTEXT INDEX ft_places_search (name, description, location, category);
+
+ALTER TABLE events
+  ADD FULLTEXT INDEX ft_events_search (name, description, location, category);
@@ -0,0 +1,4 @@
+-- Lets the grouped reply count in the admin feedback list read live replies
+-- straight from an index instead of touching every reply row
+ALTER TABLE review_replies
+  ADD INDEX idx_review_replies_review (review_id, date_deleted);
@@ -0,0 +1,3 @@
+-- "My reviews" filter of the All Reviews popup (user_id = ? ORDER BY date_created DESC, id DESC)
+ALTER TABLE reviews
+  ADD INDEX idx_reviews_user_created (user_id, date_created);
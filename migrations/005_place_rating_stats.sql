@@ -0,0 +1,24 @@
+-- Per-place rating aggregates maintained by ratings.py on every review write.
+-- avg_rating is a stored generated column so "top rated" sorts read an index.
+CREATE TABLE place_rating_stats (
+  place_id int(11) NOT NULL,
+  rating_count int(11) NOT NULL DEFAULT 0,
+  rating_sum int(11) NOT NULL DEFAULT 0,
+  stars_1 int(11) NOT NULL DEFAULT 0,
+  stars_2 int(11) NOT NULL DEFAULT 0,
+  stars_3 int(11) NOT NULL DEFAULT 0,
+  stars_4 int(11) NOT NULL DEFAULT 0,
+  stars_5 int(11) NOT NULL DEFAULT 0,
+  avg_rating decimal(3,2) AS (IF(rating_count > 0, ROUND(rating_sum / rating_count, 2), NULL)) STORED,
+  PRIMARY KEY (place_id),
+  KEY idx_place_rating_avg (avg_rating, rating_count),
+  CONSTRAINT place_rating_stats_ibfk_1 FOREIGN KEY (place_id) REFERENCES places (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- Backfill from the existing reviews
+INSERT INTO place_rating_stats (place_id, rating_count, rating_sum, stars_1, stars_2, stars_3, stars_4, stars_5)
+SELECT place_id, COUNT(*), SUM(rating),
+       SUM(rating = 1), SUM(rating = 2), SUM(rating = 3), SUM(rating = 4), SUM(rating = 5)
+FROM reviews
+WHERE date_deleted IS NULL AND rating IS NOT NULL
+GROUP BY place_id;
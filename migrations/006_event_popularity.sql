@@ -0,0 +1,11 @@
+-- Interaction counters and a time-decayed popularity score per event (see popularity.py).
+CREATE TABLE event_popularity (
+  event_id int(11) NOT NULL,
+  views int(11) NOT NULL DEFAULT 0,
+  detail_opens int(11) NOT NULL DEFAULT 0,
+  saves int(11) NOT NULL DEFAULT 0,
+  score double NOT NULL DEFAULT 0,
+  updated_at datetime NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (event_id),
+  CONSTRAINT event_popularity_ibfk_1 FOREIGN KEY (event_id) REFERENCES events (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
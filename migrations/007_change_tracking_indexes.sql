@@ -0,0 +1,10 @@
+-- Incremental autocomplete refresh (autocomplete.refresh): rows created, modified
+-- or deleted since the last refresh. With date_deleted already indexed, each OR
+-- branch has an index and the query becomes an index_merge union, not a scan.
+ALTER TABLE places
+  ADD INDEX idx_places_created (date_created),
+  ADD INDEX idx_places_modified (date_modified);
+
+ALTER TABLE events
+  ADD INDEX idx_events_created (date_created),
+  ADD INDEX idx_events_modified (date_modified);
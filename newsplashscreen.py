@@ -6,10 +6,14 @@ import math
 import sys
 import time
 
+import thumbnails
+
 class SplashScreen(tk.Toplevel):
-    def __init__(self, parent):
+    def __init__(self, parent, on_close=None):
         super().__init__(parent)
         self.parent = parent
+        # Called instead of showing the parent once the splash has faded out
+        self.on_close = on_close
         self.withdraw()  # Hide until fully initialized
         
         # Window setup
@@ -54,8 +58,9 @@ class SplashScreen(tk.Toplevel):
         self.subtitle_text = self.canvas.create_text(width_of_window / 2, 190, text="", 
                                                    fill="#29b6f6", font=('Montserrat', 18))
         
-        # Loading bar
+        # Loading bar; it never runs ahead of the startup work (see set_progress_limit)
         self.progress = 0
+        self.progress_limit = 100
         self.create_loading_bar(width_of_window, height_of_window)
         
         # Credits
@@ -165,9 +170,8 @@ class SplashScreen(tk.Toplevel):
             
             full_path = os.path.join(base_path, path)
             
-            # Try to load the image
-            img = Image.open(full_path)
-            img = img.resize(size)
+            # Try to load the image (resized once, then read from the thumbnail cache)
+            img = thumbnails.get_thumbnail(full_path, size)
             return ImageTk.PhotoImage(img)
             
         except Exception as e:
@@ -215,9 +219,16 @@ class SplashScreen(tk.Toplevel):
             self.subtitle_index += 1
             self.after(80, self.animate_subtitle)
 
+    def set_progress_limit(self, percent):
+        """Let the loading bar advance up to percent (100 lets it finish and close)."""
+        self.progress_limit = percent
+
     def update_loading(self):
         """Update the loading bar progress"""
-        if self.progress < 100 and self.animation_running:
+        if self.progress < 100 and self.animation_running and self.progress >= self.progress_limit:
+            # Wait for the startup work to catch up
+            self.after(50, self.update_loading)
+        elif self.progress < 100 and self.animation_running:
             self.progress += 1
             bar_width = 496 * (self.progress / 100)
             
@@ -241,8 +252,11 @@ class SplashScreen(tk.Toplevel):
                     self.bar_border, outline="#29b6f6"
                 ))
             
-            # Variable speed for more natural feel
-            delay = 30 if self.progress > 80 else (20 if self.progress > 50 else 40)
+            # Variable speed for more natural feel; quick once the startup work is done
+            if self.progress_limit >= 100:
+                delay = 5
+            else:
+                delay = 30 if self.progress > 80 else (20 if self.progress > 50 else 40)
             self.after(delay, self.update_loading)
         elif self.animation_running:
             self.canvas.itemconfig(
@@ -315,7 +329,10 @@ class SplashScreen(tk.Toplevel):
         """Clean up and close the splash screen"""
         self.animation_running = False
         self.destroy()
-        self.parent.deiconify()  # Show the parent window
+        if self.on_close is not None:
+            self.on_close()
+        else:
+            self.parent.deiconify()  # Show the parent window
 
     def force_close(self):
         """Force close the splash screen immediately"""
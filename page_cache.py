@@ -0,0 +1,102 @@
+"""Keeps built dashboard pages alive so switching pages doesn't rebuild them.
+
+Each page is built once into its own frame inside the content area. Switching
+pages hides the current frame (pack_forget) and shows the next one. A page
+older than its max age, or marked stale with invalidate(), gets its data
+reloaded by its refresh callback when it is shown again. Pages without a
+refresh callback are rebuilt. At most max_pages pages stay alive: the least
+recently shown one is destroyed when another is built.
+"""
+import time
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+
+# Pages kept alive at once (the rest are rebuilt when visited again)
+MAX_CACHED_PAGES = 4
+
+
+class CachedPage:
+    def __init__(self, frame):
+        self.frame = frame
+        self.loaded_at = time.monotonic()
+        self.stale = False
+
+
+class PageCache:
+    """LRU of built pages in container.
+
+    build(name, frame) fills a new page frame. policies maps a page name to
+    (max_age seconds or None, refresh callable or None). A page that isn't listed
+    is kept until evicted and never refreshed. set_frame(frame) is called before a
+    page is built, refreshed or shown, so the owner can point its content_frame at it.
+    """
+
+    def __init__(self, container, build, set_frame, policies=None, max_pages=MAX_CACHED_PAGES):
+        self.container = container
+        self.build = build
+        self.set_frame = set_frame
+        self.policies = policies or {}
+        self.max_pages = max_pages
+        self.pages = OrderedDict()
+        self.current = None
+
+    def show(self, name):
+        """Show page name, building, refreshing or reusing it as needed."""
+        if self.current is not None and self.current != name and self.current in self.pages:
+            self.pages[self.current].frame.pack_forget()
+
+        page = self.pages.get(name)
+        if page is not None and not page.frame.winfo_exists():
+            del self.pages[name]
+            page = None
+        max_age, refresh = self.policies.get(name, (None, None))
+        expired = page is not None and (page.stale or (max_age is not None and time.monotonic() - page.loaded_at > max_age))
+        if expired and refresh is None:
+            self.discard(name)
+            page = None
+
+        if page is None:
+            page = CachedPage(ttk.Frame(self.container))
+            self.pages[name] = page
+            self.current = name
+            self.set_frame(page.frame)
+            page.frame.pack(fill=tk.BOTH, expand=True)
+            self.build(name, page.frame)
+            self._evict()
+            return
+
+        self.pages.move_to_end(name)
+        self.current = name
+        self.set_frame(page.frame)
+        page.frame.pack(fill=tk.BOTH, expand=True)
+        if expired:
+            # Only the data is reloaded; the widgets stay as they are
+            page.loaded_at = time.monotonic()
+            page.stale = False
+            refresh()
+
+    def invalidate(self, name=None):
+        """Mark a page (or every page) stale: its data is reloaded the next time it's shown."""
+        for page_name, page in self.pages.items():
+            if name is None or page_name == name:
+                page.stale = True
+
+    def discard(self, name):
+        """Destroy a page so it is rebuilt the next time it's shown."""
+        page = self.pages.pop(name, None)
+        if page is not None:
+            page.frame.destroy()
+        if self.current == name:
+            self.current = None
+
+    def clear(self):
+        for name in list(self.pages):
+            self.discard(name)
+
+    def _evict(self):
+        while len(self.pages) > self.max_pages:
+            oldest = next(iter(self.pages))
+            if oldest == self.current:
+                break
+            self.discard(oldest)
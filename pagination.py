@@ -0,0 +1,108 @@
+import threading
+import time
+
+import database
+
+# Rows fetched per page, and the choices offered in the page-size controls
+DEFAULT_PAGE_SIZE = 100
+PAGE_SIZES = (50, 100, 250, 500)
+# Seconds a COUNT(*) result is reused before it is recomputed
+COUNT_CACHE_TTL = 60
+
+_count_lock = threading.Lock()
+_counts = {}   # (FROM clause, where sql, params) -> (count, time computed)
+
+
+class KeysetQuery:
+    """A SELECT that is read one page at a time by seeking past the last row's sort key.
+
+    Unlike LIMIT/OFFSET, every page costs the same no matter how deep the user has
+    scrolled, and rows inserted meanwhile don't shift later pages.
+
+    order is a sequence of (column, "ASC"/"DESC", index of that column in the selected
+    row) and must end with a unique column (the id) so the sort key is unique.
+    """
+
+    def __init__(self, columns, table, order, where=("date_deleted IS NULL",), params=()):
+        self.columns = columns
+        self.table = table
+        self.order = tuple(order)
+        self.where = tuple(where)
+        self.params = tuple(params)
+
+    def where_sql(self):
+        return " AND ".join(f"({clause})" for clause in self.where) or "1"
+
+    def key_of(self, row):
+        """Sort key of a fetched row; pass it as `after` to get the following page."""
+        return tuple(row[index] for _, _, index in self.order)
+
+    def _seek_clause(self, after):
+        # (a, b, c) past (x, y, z), honouring each column's direction:
+        # a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+        alternatives = []
+        params = []
+        for position, (column, direction, _) in enumerate(self.order):
+            op = "<" if direction.upper() == "DESC" else ">"
+            terms = [f"{prev} = %s" for prev, _, _ in self.order[:position]]
+            terms.append(f"{column} {op} %s")
+            alternatives.append("(" + " AND ".join(terms) + ")")
+            params.extend(after[:position + 1])
+        # The leading bound alone lets MySQL turn the seek into an index range scan
+        first_column, first_direction, _ = self.order[0]
+        bound = "<=" if first_direction.upper() == "DESC" else ">="
+        clause = f"{first_column} {bound} %s AND ({' OR '.join(alternatives)})"
+        return clause, [after[0]] + params
+
+    def page_sql(self, after=None, limit=DEFAULT_PAGE_SIZE):
+        """SQL and parameters for the page following the row whose key is `after`."""
+        where = self.where_sql()
+        params = list(self.params)
+        if after is not None:
+            seek, seek_params = self._seek_clause(after)
+            where = f"{where} AND {seek}"
+            params.extend(seek_params)
+        order_by = ", ".join(f"{column} {direction}" for column, direction, _ in self.order)
+        sql = f"SELECT {self.columns} FROM {self.table} WHERE {where} ORDER BY {order_by} LIMIT %s"
+        params.append(limit)
+        return sql, tuple(params)
+
+    def fetch_page(self, after=None, page_size=DEFAULT_PAGE_SIZE):
+        """Return (rows, key of the last row or None when there are no more pages)."""
+        # One extra row tells us whether another page exists without a COUNT
+        sql, params = self.page_sql(after, page_size + 1)
+        rows = database.fetch_all(sql, params)
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            return rows, self.key_of(rows[-1])
+        return rows, None
+
+    def count(self):
+        """Total rows matching the filter, served from the count cache when fresh."""
+        return cached_count(self.table, self.where_sql(), self.params)
+
+
+def cached_count(table, where, params=()):
+    """SELECT COUNT(*) with a short-lived cache, so paging and revisiting a page don't recount."""
+    key = (table, where, tuple(params))
+    now = time.monotonic()
+    with _count_lock:
+        entry = _counts.get(key)
+        if entry is not None and now - entry[1] < COUNT_CACHE_TTL:
+            return entry[0]
+
+    row = database.fetch_one(f"SELECT COUNT(*) FROM {table} WHERE {where}", params)
+    count = row[0] if row else 0
+    with _count_lock:
+        _counts[key] = (count, now)
+    return count
+
+
+def invalidate_counts(table=None):
+    """Forget cached counts for a table (or all tables) after rows are added or removed.
+
+    Counts over joins ("reviews r JOIN places p ...") belong to their first table.
+    """
+    with _count_lock:
+        for key in [key for key in _counts if table is None or key[0].split()[0] == table]:
+            del _counts[key]
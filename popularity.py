@@ -0,0 +1,109 @@
+"""Event popularity from views, detail opens and saves, with time decay.
+
+Interactions are counted in memory and written to event_popularity in batches
+(flush). Each row keeps a score that halves every HALF_LIFE_DAYS without new
+interactions. The top events are ranked in one query and the ranking is reused
+for RANKING_TTL seconds, so showing "Popular Events" never walks the events list.
+"""
+import logging
+import threading
+import time
+
+import mysql.connector
+
+import database
+
+# Score added per interaction
+VIEW = "views"
+DETAIL_OPEN = "detail_opens"
+SAVE = "saves"
+WEIGHTS = {VIEW: 1.0, DETAIL_OPEN: 5.0, SAVE: 10.0}
+
+# A score loses half its weight after this many days without interactions
+HALF_LIFE_DAYS = 7
+HALF_LIFE_SECONDS = HALF_LIFE_DAYS * 24 * 3600
+
+# Seconds between writes of the counted interactions
+FLUSH_INTERVAL = 60
+# Seconds the ranking is reused before it is recomputed
+RANKING_TTL = 300
+# Events kept in the precomputed ranking
+RANKING_SIZE = 20
+
+# Decay the stored score to now before adding; score is assigned before updated_at,
+# so it still sees the previous timestamp
+RECORD_QUERY = f"""
+    INSERT INTO event_popularity (event_id, views, detail_opens, saves, score, updated_at)
+    VALUES (%s, %s, %s, %s, %s, NOW())
+    ON DUPLICATE KEY UPDATE
+        views = views + VALUES(views),
+        detail_opens = detail_opens + VALUES(detail_opens),
+        saves = saves + VALUES(saves),
+        score = score * POW(0.5, TIMESTAMPDIFF(SECOND, updated_at, NOW()) / {HALF_LIFE_SECONDS}) + VALUES(score),
+        updated_at = NOW()
+"""
+
+RANKING_QUERY = f"""
+    SELECT p.event_id, p.score * POW(0.5, TIMESTAMPDIFF(SECOND, p.updated_at, NOW()) / {HALF_LIFE_SECONDS}) AS popularity
+    FROM event_popularity p
+    JOIN events e ON e.id = p.event_id
+    WHERE e.status = 'approved' AND e.date_deleted IS NULL
+    ORDER BY popularity DESC
+    LIMIT %s
+"""
+
+_lock = threading.Lock()
+_pending = {}
+_ranking = None
+_computed_at = 0.0
+
+
+def record(event_id, kind):
+    """Count one interaction with an event (written on the next flush)."""
+    with _lock:
+        counts = _pending.setdefault(event_id, {VIEW: 0, DETAIL_OPEN: 0, SAVE: 0})
+        counts[kind] += 1
+
+
+def flush():
+    """Write the pending interactions in one batch; returns the number of events updated."""
+    global _pending
+    with _lock:
+        pending, _pending = _pending, {}
+    if not pending:
+        return 0
+    rows = [(event_id, counts[VIEW], counts[DETAIL_OPEN], counts[SAVE],
+             sum(WEIGHTS[kind] * count for kind, count in counts.items()))
+            for event_id, counts in pending.items()]
+    try:
+        with database.cursor() as cur:
+            cur.executemany(RECORD_QUERY, rows)
+    except mysql.connector.Error:
+        # Keep the counts for the next flush rather than losing them
+        with _lock:
+            for event_id, counts in pending.items():
+                merged = _pending.setdefault(event_id, {VIEW: 0, DETAIL_OPEN: 0, SAVE: 0})
+                for kind, count in counts.items():
+                    merged[kind] += count
+        raise
+    return len(rows)
+
+
+def refresh_ranking():
+    """Flush pending interactions and recompute the ranking: [(event_id, popularity)]."""
+    global _ranking, _computed_at
+    flush()
+    ranking = [(event_id, float(score)) for event_id, score in database.fetch_all(RANKING_QUERY, (RANKING_SIZE,))]
+    with _lock:
+        _ranking, _computed_at = ranking, time.monotonic()
+    logging.info(f"✅ Ranked {len(ranking)} popular events")
+    return ranking
+
+
+def top_events(k=3):
+    """Ids of the k most popular events, from the ranking (recomputed when stale)."""
+    with _lock:
+        ranking = _ranking if _ranking is not None and time.monotonic() - _computed_at < RANKING_TTL else None
+    if ranking is None:
+        ranking = refresh_ranking()
+    return [event_id for event_id, _ in ranking[:k]]
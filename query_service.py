@@ -0,0 +1,153 @@
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import database
+
+# Worker threads; kept below the pool size so the UI thread can still borrow a connection
+QUERY_WORKERS = max(1, database.POOL_MAX_SIZE - 2)
+# How often (ms) the Tk thread checks for finished queries while work is outstanding
+POLL_INTERVAL = 30
+
+
+class QueryRequest:
+    """Handle for a submitted query; cancel() drops its result."""
+
+    def __init__(self, service, generation, tag):
+        self._service = service
+        self.generation = generation
+        self.tag = tag
+        self.future = None
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    def is_stale(self):
+        return self.cancelled or self._service.is_stale(self)
+
+
+class QueryService:
+    """Runs blocking work (database queries, image decoding) on background threads and delivers results on the Tk thread."""
+
+    def __init__(self, root, max_workers=QUERY_WORKERS, poll_interval=POLL_INTERVAL):
+        self.root = root
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-query")
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._latest_by_tag = {}
+        self._outstanding = 0
+        self._poll_id = None
+        self._closed = False
+
+    def submit(self, func, *args, on_success=None, on_error=None, tag=None):
+        """Run func(*args) in the background and call on_success(result) / on_error(exc) on the Tk thread.
+
+        A newer request with the same tag supersedes an older one that has not been delivered yet.
+        """
+        if self._closed:
+            return None
+        with self._lock:
+            request = QueryRequest(self, self._generation, tag)
+            if tag is not None:
+                previous = self._latest_by_tag.get(tag)
+                if previous is not None:
+                    previous.cancel()
+                self._latest_by_tag[tag] = request
+            self._outstanding += 1
+
+        request.future = self._executor.submit(self._run, request, func, args, on_success, on_error)
+        request.future.add_done_callback(lambda f, r=request: self._on_done(f, r))
+        self._schedule_poll()
+        return request
+
+    def fetch_all(self, query, params=None, on_success=None, on_error=None, tag=None, dictionary=False):
+        """Shortcut for database.fetch_all on a worker thread."""
+        return self.submit(database.fetch_all, query, params, dictionary,
+                           on_success=on_success, on_error=on_error, tag=tag)
+
+    def cancel_all(self):
+        """Discard every pending result (used when the user switches page)."""
+        with self._lock:
+            self._generation += 1
+            pending = list(self._latest_by_tag.values())
+            self._latest_by_tag.clear()
+        for request in pending:
+            request.cancel()
+
+    def is_stale(self, request):
+        with self._lock:
+            return request.generation != self._generation
+
+    def shutdown(self):
+        """Stop polling and let running queries finish without delivering results."""
+        self._closed = True
+        self.cancel_all()
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._executor.shutdown(wait=False)
+
+    def _run(self, request, func, args, on_success, on_error):
+        # Runs on a worker thread: never touch Tk widgets here
+        if request.is_stale():
+            self._results.put((request, None, None, None, None))
+            return
+        try:
+            result = func(*args)
+            self._results.put((request, on_success, result, None, None))
+        except Exception as e:
+            self._results.put((request, None, None, on_error, e))
+
+    def _on_done(self, future, request):
+        # A future cancelled before it started never reaches _run; report it so the poll can stop
+        if future.cancelled():
+            self._results.put((request, None, None, None, None))
+
+    def _schedule_poll(self):
+        if self._poll_id is None and not self._closed:
+            try:
+                self._poll_id = self.root.after(self.poll_interval, self._drain)
+            except Exception:
+                # Root window already destroyed
+                self._poll_id = None
+
+    def _drain(self):
+        """Deliver finished results on the Tk thread."""
+        self._poll_id = None
+        while True:
+            try:
+                request, on_success, result, on_error, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._lock:
+                self._outstanding -= 1
+                if request.tag is not None and self._latest_by_tag.get(request.tag) is request:
+                    del self._latest_by_tag[request.tag]
+
+            if request.is_stale():
+                continue
+            try:
+                if error is not None:
+                    if on_error:
+                        on_error(error)
+                    else:
+                        logging.error(f"❌ Background query failed: {error}")
+                elif on_success:
+                    on_success(result)
+            except Exception as e:
+                logging.error(f"❌ Error handling query result: {e}")
+
+        with self._lock:
+            waiting = self._outstanding
+        if waiting > 0:
+            self._schedule_poll()
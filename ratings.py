@@ -0,0 +1,149 @@
+"""Per-place rating aggregates (count, sum and 1-5 star histogram).
+
+place_rating_stats is updated in the same transaction as every review write, so
+reading a place's average never scans reviews. `python ratings.py --rebuild`
+recomputes the table from the reviews if it ever drifts.
+"""
+import logging
+import sys
+
+import mysql.connector
+
+import database
+
+STAR_COLUMNS = ("stars_1", "stars_2", "stars_3", "stars_4", "stars_5")
+
+# Add one review's contribution (or remove it, with negative deltas)
+APPLY_QUERY = f"""
+    INSERT INTO place_rating_stats (place_id, rating_count, rating_sum, {", ".join(STAR_COLUMNS)})
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        rating_count = rating_count + VALUES(rating_count),
+        rating_sum = rating_sum + VALUES(rating_sum),
+        {", ".join(f"{column} = {column} + VALUES({column})" for column in STAR_COLUMNS)}
+"""
+
+REBUILD_QUERY = f"""
+    INSERT INTO place_rating_stats (place_id, rating_count, rating_sum, {", ".join(STAR_COLUMNS)})
+    SELECT place_id, COUNT(*), SUM(rating), {", ".join(f"SUM(rating = {star})" for star in range(1, 6))}
+    FROM reviews
+    WHERE date_deleted IS NULL AND rating IS NOT NULL
+    GROUP BY place_id
+"""
+
+
+def _apply(cur, place_id, rating, delta):
+    if rating is None:
+        return
+    stars = [delta if star == rating else 0 for star in range(1, 6)]
+    cur.execute(APPLY_QUERY, (place_id, delta, delta * rating, *stars))
+
+
+def _locked_review(cur, review_id):
+    # Lock the row so concurrent edits of the same review apply their deltas in order
+    cur.execute("SELECT place_id, rating, date_deleted FROM reviews WHERE id = %s FOR UPDATE", (review_id,))
+    return cur.fetchone()
+
+
+def add_review(user_id, place_id, rating, comment):
+    """Insert a review and count it in its place's aggregates; returns the new id."""
+    with database.cursor() as cur:
+        cur.execute("INSERT INTO reviews (user_id, place_id, rating, comment) VALUES (%s, %s, %s, %s)",
+                    (user_id, place_id, rating, comment))
+        review_id = cur.lastrowid
+        _apply(cur, place_id, rating, 1)
+    return review_id
+
+
+def update_review(review_id, comment, rating):
+    """Change a review's comment and rating, moving its star in the histogram."""
+    with database.cursor() as cur:
+        review = _locked_review(cur, review_id)
+        cur.execute("UPDATE reviews SET comment = %s, rating = %s, date_modified = NOW() WHERE id = %s",
+                    (comment, rating, review_id))
+        if review and review[2] is None:
+            place_id, old_rating, _ = review
+            _apply(cur, place_id, old_rating, -1)
+            _apply(cur, place_id, rating, 1)
+
+
+def delete_review(review_id):
+    """Delete a review (as users do) and remove it from the aggregates."""
+    with database.cursor() as cur:
+        review = _locked_review(cur, review_id)
+        cur.execute("DELETE FROM reviews WHERE id = %s", (review_id,))
+        if review and review[2] is None:
+            _apply(cur, review[0], review[1], -1)
+
+
+def soft_delete_review(review_id):
+    """Soft delete a review (as admins do) and remove it from the aggregates."""
+    with database.cursor() as cur:
+        review = _locked_review(cur, review_id)
+        cur.execute("UPDATE reviews SET date_deleted = NOW() WHERE id = %s AND date_deleted IS NULL", (review_id,))
+        if review and review[2] is None:
+            _apply(cur, review[0], review[1], -1)
+
+
+def top_rated_places(columns, where=(), params=()):
+    """Places ordered by average rating (best first), then the ones without reviews.
+
+    columns/where may use the places and place_rating_stats tables. The rated places
+    are read in idx_place_rating_avg order, so the sort needs no scan or filesort.
+    """
+    conditions = " AND ".join(f"({clause})" for clause in where) or "1"
+    # STRAIGHT_JOIN keeps place_rating_stats (and its index order) as the driving table
+    rated = database.fetch_all(f"""
+        SELECT STRAIGHT_JOIN {columns}
+        FROM place_rating_stats JOIN places ON places.id = place_rating_stats.place_id
+        WHERE place_rating_stats.avg_rating IS NOT NULL AND {conditions}
+        ORDER BY place_rating_stats.avg_rating DESC, place_rating_stats.rating_count DESC
+        """, params)
+    unrated = database.fetch_all(f"""
+        SELECT {columns}
+        FROM places LEFT JOIN place_rating_stats ON place_rating_stats.place_id = places.id
+        WHERE place_rating_stats.avg_rating IS NULL AND {conditions}
+        """, params)
+    return rated + unrated
+
+
+def rating_histogram():
+    """Reviews per star over all places: {1: n, ..., 5: n}."""
+    row = database.fetch_one(
+        f"SELECT {', '.join(f'COALESCE(SUM({column}), 0)' for column in STAR_COLUMNS)} FROM place_rating_stats")
+    return {star: int(row[star - 1]) if row else 0 for star in range(1, 6)}
+
+
+def rebuild():
+    """Recompute every place's aggregates from the reviews table."""
+    with database.cursor() as cur:
+        cur.execute("DELETE FROM place_rating_stats")
+        cur.execute(REBUILD_QUERY)
+        rows = cur.rowcount
+    logging.info(f"✅ Rebuilt rating aggregates for {rows} places")
+    return rows
+
+
+def format_rating(avg_rating, rating_count):
+    """Short label for a place card, e.g. "★ 4.3 (12 reviews)"."""
+    if not rating_count:
+        return "☆ No reviews yet"
+    return f"★ {float(avg_rating):.1f} ({rating_count} review{'s' if rating_count != 1 else ''})"
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if "--rebuild" not in sys.argv[1:]:
+        print("usage: python ratings.py --rebuild")
+        return
+    try:
+        print(f"Rebuilt rating aggregates for {rebuild()} places")
+    except mysql.connector.Error as e:
+        logging.error(f"❌ Could not rebuild rating aggregates: {e}")
+        sys.exit(1)
+    finally:
+        database.close_pool()
+
+
+if __name__ == "__main__":
+    main()
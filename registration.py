@@ -2,17 +2,21 @@ import tkinter as tk
 from tkinter import messagebox
 import mysql.connector
 import bcrypt
-import os
 import sys
 import re
+import database
+from screen_router import ScreenRouter
 
-class Registration(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Create Account")
-        self.geometry("400x550")
-        self.configure(bg="#000000")
-        self.resizable(False, False)
+class Registration(tk.Frame):
+    def __init__(self, root, router):
+        super().__init__(root, bg="#000000")
+        self.root = root
+        self.router = router
+        self.root.title("Create Account")
+        self.root.geometry("400x550")
+        self.root.configure(bg="#000000")
+        self.root.resizable(False, False)
+        self.pack(fill="both", expand=True)
         
         # Widget variables
         self.entry_username = None
@@ -93,23 +97,17 @@ class Registration(tk.Tk):
     
     def center_window(self):
         """Center the window on screen"""
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f'{width}x{height}+{x}+{y}')
+        self.root.update_idletasks()
+        width = self.root.winfo_width()
+        height = self.root.winfo_height()
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f'{width}x{height}+{x}+{y}')
     
     def connect_db(self):
-        """Establish database connection"""
+        """Borrow a pooled database connection (close() returns it to the pool)"""
         try:
-            db = mysql.connector.connect(
-                host="localhost",
-                user="root",
-                password="",
-                database="tourism_db"
-            )
-            return db
+            return database.get_connection()
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Could not connect to database: {err}")
             sys.exit(1)
@@ -179,9 +177,8 @@ class Registration(tk.Tk):
             messagebox.showinfo("Registration Successful", 
                               "Your account has been created successfully! You can now login.")
             
-            # Close the registration window and reopen login
-            self.destroy()
-            os.system(f"{sys.executable} login.py")
+            # Back to the login screen
+            self.router.show_login()
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error creating account: {err}")
         finally:
@@ -189,9 +186,9 @@ class Registration(tk.Tk):
     
     def back_to_login(self):
         """Return to login window"""
-        self.destroy()
-        os.system(f"{sys.executable} login.py")
+        self.router.show_login()
 
 if __name__ == "__main__":
-    app = Registration()
-    app.mainloop()
\ No newline at end of file
+    root = tk.Tk()
+    ScreenRouter(root).show_registration()
+    root.mainloop()
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""Swaps the app's screens (login, registration, password reset, dashboards) in one Tk root.
+
+The root, the database pool and the module-level caches (images, thumbnails,
+search indexes, counts) live for the whole session. Logging out or going back to
+the login only replaces the widgets of the current screen. Every transition is
+timed and logged.
+"""
+import logging
+import time
+
+import database
+
+
+class ScreenRouter:
+    """Shows one screen at a time in root.
+
+    A screen is built by a factory(root, router). Before the next one is built,
+    the current screen's close() (if it has one) stops its timers and workers.
+    Then every widget in root is destroyed, and the root bindings and close
+    handler are reset.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.screen = None
+        self.name = None
+        # (from screen, to screen, milliseconds) of every transition
+        self.transitions = []
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+
+    def show(self, name, factory):
+        """Replace the current screen with factory(root, router); returns the new screen."""
+        started = time.perf_counter()
+        previous = self.name
+        self._close_current()
+        self.name = name
+        self.screen = factory(self.root, self)
+        # Count the first layout too: that's when the screen can be seen
+        self.root.update_idletasks()
+        ms = (time.perf_counter() - started) * 1000
+        self.transitions.append((previous, name, ms))
+        logging.info(f"✅ Screen {previous or 'start'} → {name}: {ms:.0f} ms")
+        return self.screen
+
+    def show_login(self):
+        from login import LoginApp
+        return self.show("login", LoginApp)
+
+    def show_registration(self):
+        from registration import Registration
+        return self.show("registration", Registration)
+
+    def show_forgot_password(self):
+        from forgot import Forgot
+        return self.show("forgot password", Forgot)
+
+    def show_dashboard(self, role, user_id):
+        """Open the admin or user dashboard for a logged-in user."""
+        if role == "admin":
+            from admin_dashboard import AdminDashboard
+            return self.show("admin dashboard", lambda root, router: AdminDashboard(root, user_id, router))
+        from user_dashboard import UserDashboard
+        return self.show("user dashboard", lambda root, router: UserDashboard(root, user_id, router))
+
+    def _close_current(self):
+        if self.screen is not None and hasattr(self.screen, "close"):
+            self.screen.close()
+        self.screen = None
+        for widget in self.root.winfo_children():
+            widget.destroy()
+        for sequence in self.root.bind():
+            self.root.unbind(sequence)
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+        self.root.resizable(True, True)
+
+    def quit(self):
+        """Close the current screen, the database pool and the window."""
+        if self.screen is not None and hasattr(self.screen, "close"):
+            self.screen.close()
+        self.screen = None
+        database.close_pool()
+        self.root.destroy()
@@ -0,0 +1,174 @@
+"""Full-text search over places and events, shared by the admin and user dashboards.
+
+Searches use the FULLTEXT indexes from migration 002. By default every word the
+user typed must appear (as a word prefix, so partial words match while typing),
+and results are ranked by natural-language relevance of the whole query.
+"""
+import re
+
+import database
+from pagination import DEFAULT_PAGE_SIZE, cached_count
+
+# Columns covered by the FULLTEXT index of each table (must match migration 002)
+SEARCH_COLUMNS = {
+    "places": ("name", "description", "location", "category"),
+    "events": ("name", "description", "location", "category"),
+}
+
+# Search modes
+BOOLEAN = "boolean"   # every word required, word prefixes match ("+beach* +res*")
+NATURAL = "natural"   # any word may match, ranked by relevance
+
+# Words shorter than innodb_ft_min_token_size are not indexed
+MIN_TOKEN_SIZE = 3
+# A word starting with a boolean-mode operator ("+beach", "-resort", "~hotel").
+# Hyphens inside words ("lake-sebu", "t-boli") are plain text.
+BOOLEAN_WORD = re.compile(r'(?:^|\s)[+\-~]\w')
+
+
+def search_words(text):
+    return [word for word in re.split(r"[\W_]+", text.lower()) if word]
+
+
+def _balanced(text, opening, closing):
+    depth = 0
+    for char in text:
+        if char == opening:
+            depth += 1
+        elif char == closing:
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0
+
+
+def uses_boolean_syntax(text):
+    """Whether text is written in boolean-mode syntax: a word starts with +, - or ~,
+    or it has (balanced) quotes or parentheses."""
+    if BOOLEAN_WORD.search(text):
+        return True
+    quotes = text.count('"')
+    if quotes and quotes % 2 == 0:
+        return True
+    return "(" in text and _balanced(text, "(", ")")
+
+
+def boolean_query(text):
+    """Turn free text into a boolean-mode query requiring every (prefix of a) word.
+
+    Text written in boolean syntax ("+beach -resort", "\"lake holon\"") is passed
+    through for users who know it. Anything else is split into words, so
+    "lake-sebu" requires both lake and sebu.
+    """
+    if uses_boolean_syntax(text):
+        return text
+    words = [word for word in search_words(text) if len(word) >= MIN_TOKEN_SIZE]
+    return " ".join(f"+{word}*" for word in words)
+
+
+def can_narrow(previous, text):
+    """Whether the matches of text are a subset of the matches of previous.
+
+    True when text extends previous and both are plain word searches: every word
+    constraint of previous is kept or tightened. Previous must have had an indexable
+    word (otherwise it was a name prefix match, which text may not narrow).
+    """
+    return (text.startswith(previous) and not uses_boolean_syntax(text)
+            and not uses_boolean_syntax(previous) and bool(boolean_query(previous)))
+
+
+def matches(text, values):
+    """Client-side check of the boolean-mode rule: every indexable word of text
+    starts some word of values (used to narrow already fetched results)."""
+    words = set(search_words(" ".join(str(value or "") for value in values)))
+    return all(any(word.startswith(term) for word in words)
+               for term in search_words(text) if len(term) >= MIN_TOKEN_SIZE)
+
+
+class SearchQuery:
+    """Relevance-ranked full-text search with the same interface as pagination.KeysetQuery.
+
+    Rows are the requested columns followed by the relevance score. When the text
+    has no indexable word (e.g. "la"), it falls back to a name prefix match.
+    table may also be a join starting with the searched table ("places LEFT JOIN ...")
+    as long as that table isn't aliased.
+    """
+
+    def __init__(self, table, columns, text, where=(), params=(), mode=BOOLEAN):
+        self.table = table
+        self.base_table = table.split()[0]
+        self.columns = columns
+        self.text = text.strip()
+        self.where = tuple(where)
+        self.params = tuple(params)
+        self.mode = mode
+
+    def _match(self, mode):
+        columns = ", ".join(f"{self.base_table}.{column}" for column in SEARCH_COLUMNS[self.base_table])
+        modifier = "IN BOOLEAN MODE" if mode == BOOLEAN else "IN NATURAL LANGUAGE MODE"
+        return f"MATCH({columns}) AGAINST (%s {modifier})"
+
+    def _filter(self):
+        """WHERE clause and parameters, without the relevance ordering."""
+        clauses = list(self.where)
+        params = list(self.params)
+        terms = boolean_query(self.text)
+        if self.mode == NATURAL:
+            clauses.append(self._match(NATURAL))
+            params.append(self.text)
+        elif terms:
+            clauses.append(self._match(BOOLEAN))
+            params.append(terms)
+        else:
+            # Nothing indexable: a prefix match on the bare column can still use its index
+            clauses.append(f"{self.base_table}.name LIKE %s")
+            params.append(self.text.replace("%", r"\%").replace("_", r"\_") + "%")
+        return " AND ".join(f"({clause})" for clause in clauses), params
+
+    def where_sql(self):
+        return self._filter()[0]
+
+    def page_sql(self, offset=None, limit=DEFAULT_PAGE_SIZE):
+        where, params = self._filter()
+        if self.mode == NATURAL or boolean_query(self.text):
+            # Rank by natural-language relevance of the whole text (weights rare words higher)
+            relevance = self._match(NATURAL)
+            params = [self.text] + params
+        else:
+            relevance = "0"
+        sql = (f"SELECT {self.columns}, {relevance} AS relevance FROM {self.table} "
+               f"WHERE {where} ORDER BY relevance DESC, {self.base_table}.id ASC LIMIT %s OFFSET %s")
+        return sql, tuple(params) + (limit, offset or 0)
+
+    def fetch_page(self, after=None, page_size=DEFAULT_PAGE_SIZE):
+        """Return (rows, offset of the next page or None).
+
+        Ranked results are paged by offset: relevance isn't a stable seek key, and
+        people rarely page far into search results.
+        """
+        offset = after or 0
+        sql, params = self.page_sql(offset, page_size + 1)
+        rows = database.fetch_all(sql, params)
+        if len(rows) > page_size:
+            return rows[:page_size], offset + page_size
+        return rows, None
+
+    def fetch_all(self, limit=DEFAULT_PAGE_SIZE):
+        """The `limit` best matches."""
+        return self.fetch_page(None, limit)[0]
+
+    def count(self):
+        where, params = self._filter()
+        return cached_count(self.table, where, params)
+
+
+def search_places(text, columns="id, name, category, description, image, location", where=(), params=(),
+                  mode=BOOLEAN, limit=DEFAULT_PAGE_SIZE):
+    """Best matching places, most relevant first (relevance is the last column)."""
+    return SearchQuery("places", columns, text, where, params, mode).fetch_all(limit)
+
+
+def search_events(text, columns="id, name, category, date, time, location", where=(), params=(),
+                  mode=BOOLEAN, limit=DEFAULT_PAGE_SIZE):
+    """Best matching events, most relevant first (relevance is the last column)."""
+    return SearchQuery("events", columns, text, where, params, mode).fetch_all(limit)
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from PIL import Image
+
+# Resized copies live next to the app, like profile_pictures/ and uploads/
+THUMBNAIL_DIR = "thumbnail_cache"
+INDEX_FILE = os.path.join(THUMBNAIL_DIR, "index.json")
+
+# Sizes the dashboards display images at
+PLACE_CARD_SIZE = (500, 250)
+PLACE_RESULT_SIZE = (80, 60)
+EVENT_CARD_SIZE = (250, 180)
+EVENT_DETAIL_SIZE = (600, 350)
+
+# Sizes pre-rendered when an admin saves a place or event
+PLACE_SIZES = (PLACE_CARD_SIZE, PLACE_RESULT_SIZE)
+EVENT_SIZES = (EVENT_CARD_SIZE, EVENT_DETAIL_SIZE)
+
+_lock = threading.RLock()
+_index = None   # absolute source path -> {"mtime": ns, "size": bytes, "digest": sha1}
+
+
+def _load_index():
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_FILE, "r") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def _save_index():
+    try:
+        os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+        tmp_path = INDEX_FILE + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(_index, f)
+        os.replace(tmp_path, INDEX_FILE)
+    except OSError as e:
+        logging.warning(f"Could not save thumbnail index: {e}")
+
+
+def _hash_file(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _thumbnail_files(digest, size):
+    base = os.path.join(THUMBNAIL_DIR, f"{digest}_{size[0]}x{size[1]}")
+    return base + ".jpg", base + ".png"
+
+
+def _remove_thumbnails(digest):
+    """Delete every cached size of an image that no indexed source uses anymore."""
+    if any(entry["digest"] == digest for entry in _index.values()):
+        return
+    try:
+        for name in os.listdir(THUMBNAIL_DIR):
+            if name.startswith(digest + "_"):
+                os.remove(os.path.join(THUMBNAIL_DIR, name))
+    except OSError:
+        pass
+
+
+def source_digest(path):
+    """Content hash of a source image; only re-hashed when its mtime or size changes."""
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+    with _lock:
+        index = _load_index()
+        entry = index.get(key)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["digest"]
+
+    digest = _hash_file(path)
+    with _lock:
+        old_digest = index[key]["digest"] if key in index else None
+        index[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "digest": digest}
+        if old_digest and old_digest != digest:
+            _remove_thumbnails(old_digest)
+        _save_index()
+    return digest
+
+
+def _store(image, digest, size):
+    jpg_path, png_path = _thumbnail_files(digest, size)
+    # Keep transparency where the source has it, otherwise JPEG is smaller and faster to decode
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        target, fmt, options = png_path, "PNG", {}
+    else:
+        target, fmt, options = jpg_path, "JPEG", {"quality": 90}
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+    try:
+        os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+        tmp_path = f"{target}.{threading.get_ident()}.tmp"
+        image.save(tmp_path, fmt, **options)
+        os.replace(tmp_path, target)
+    except OSError as e:
+        logging.warning(f"Could not cache thumbnail for {digest}: {e}")
+
+
+def _load_cached(digest, size):
+    for cached_path in _thumbnail_files(digest, size):
+        if os.path.exists(cached_path):
+            try:
+                image = Image.open(cached_path)
+                image.load()
+                return image
+            except OSError as e:
+                logging.warning(f"Discarding unreadable thumbnail {cached_path}: {e}")
+                try:
+                    os.remove(cached_path)
+                except OSError:
+                    pass
+    return None
+
+
+def get_thumbnail(path, size):
+    """Return a PIL image of `path` resized to `size`, decoding the full image only on a cache miss."""
+    size = tuple(size)
+    digest = source_digest(path)
+    image = _load_cached(digest, size)
+    if image is not None:
+        return image
+
+    with Image.open(path) as source:
+        # JPEG draft mode decodes at 1/2, 1/4 or 1/8 scale when that still covers `size`
+        source.draft("RGB", size)
+        image = source.resize(size, Image.Resampling.LANCZOS)
+    _store(image, digest, size)
+    return image
+
+
+def prewarm(path, sizes):
+    """Render every missing size of an image with a single full-size decode."""
+    try:
+        digest = source_digest(path)
+        missing = [tuple(size) for size in sizes if _load_cached(digest, tuple(size)) is None]
+        if not missing:
+            return
+        with Image.open(path) as source:
+            largest = (max(size[0] for size in missing), max(size[1] for size in missing))
+            source.draft("RGB", largest)
+            source.load()
+            for size in missing:
+                _store(source.resize(size, Image.Resampling.LANCZOS), digest, size)
+        logging.info(f"✅ Thumbnails cached for {path}")
+    except OSError as e:
+        logging.error(f"❌ Could not pre-render thumbnails for {path}: {e}")
+
+
+def prewarm_async(path, sizes):
+    """prewarm() on a background thread so saving a form doesn't wait on image decoding."""
+    if path:
+        threading.Thread(target=prewarm, args=(path, sizes), daemon=True).start()
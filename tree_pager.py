@@ -0,0 +1,259 @@
+import bisect
+import logging
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from pagination import DEFAULT_PAGE_SIZE, PAGE_SIZES
+
+
+def longest_increasing(positions):
+    """Indexes into positions of a longest strictly increasing subsequence."""
+    tail_values = []   # smallest last value of an increasing run of each length
+    tails = []         # index of that last value
+    previous = []      # index of the value before positions[i] in its run
+    for i, position in enumerate(positions):
+        k = bisect.bisect_left(tail_values, position)
+        previous.append(tails[k - 1] if k else -1)
+        if k == len(tails):
+            tail_values.append(position)
+            tails.append(i)
+        else:
+            tail_values[k] = position
+            tails[k] = i
+    run = []
+    i = tails[-1] if tails else -1
+    while i != -1:
+        run.append(i)
+        i = previous[i]
+    return run[::-1]
+
+
+class TreePager:
+    """Fills a Treeview from a KeysetQuery one page at a time.
+
+    The next page is fetched in the background when the table is scrolled to the
+    bottom (or "Load more" is clicked). A footer under the table shows how many
+    rows are loaded out of the cached total and lets the user pick the page size.
+    format_row(row) turns a database row into the Treeview values.
+
+    Items are keyed by key(row) (the id in the first column by default). A new
+    first page is diffed against the items in the table: only rows that were
+    added, changed, moved or removed are touched, and the selection and scroll
+    position are kept.
+    """
+
+    def __init__(self, table, scrollbar, queries, format_row, parent, error_text,
+                 page_size=DEFAULT_PAGE_SIZE, tag=None, key=None):
+        self.table = table
+        self.scrollbar = scrollbar
+        self.queries = queries
+        self.format_row = format_row
+        self.key = key or (lambda row: row[0])
+        self.error_text = error_text
+        self.page_size = page_size
+        self.tag = tag or str(table)
+
+        self.query = None
+        self.next_key = None
+        self.loaded = 0
+        self.total = None
+        self.loading = False
+        # Database row of every loaded item (by item id), for narrow() and the diff
+        self.rows = {}
+        # Items added, changed, moved or removed by the last first page
+        self.touched = 0
+        self.on_first_page = None
+        self._count_request = None
+
+        # Footer: "Showing X of Y", page size picker and a manual "Load more"
+        self.footer = ttk.Frame(parent)
+        self.footer.pack(fill=tk.X, pady=(0, 5))
+        self.status_label = ttk.Label(self.footer, text="")
+        self.status_label.pack(side=tk.LEFT)
+
+        self.more_button = ttk.Button(self.footer, text="Load More", bootstyle="secondary",
+                                      command=self.load_more, state="disabled")
+        self.more_button.pack(side=tk.RIGHT)
+
+        self.page_size_var = tk.StringVar(value=str(page_size))
+        page_size_combo = ttk.Combobox(self.footer, textvariable=self.page_size_var,
+                                       values=[str(size) for size in PAGE_SIZES],
+                                       state="readonly", width=6)
+        page_size_combo.pack(side=tk.RIGHT, padx=(5, 10))
+        ttk.Label(self.footer, text="Rows per page:").pack(side=tk.RIGHT)
+        page_size_combo.bind("<<ComboboxSelected>>", lambda event: self.set_page_size(int(self.page_size_var.get())))
+
+        self.table.configure(yscrollcommand=self._on_scroll)
+
+    def load(self, query, on_first_page=None, rows=None):
+        """Show the first page of a new query (new filter, search or sort).
+
+        The current rows stay in the table until the page arrives. on_first_page()
+        is called once the first page is in the table. rows overrides the size of
+        that first page (reload() uses it to refetch everything that was loaded).
+        """
+        self.query = query
+        self.next_key = None
+        self.total = None
+        self.on_first_page = on_first_page
+        self.status_label.configure(text="Loading...")
+        self._fetch(None, rows)
+        self._count_request = self.queries.submit(query.count, on_success=self._on_count,
+                                                  on_error=lambda e: logging.error(f"❌ Failed to count rows: {e}"),
+                                                  tag=self.tag + "_count")
+
+    def narrow(self, query, keep):
+        """Switch to a query whose rows are a subset of the current ones without fetching.
+
+        Only possible when every row of the current query is loaded: rows for which
+        keep(row) is false are removed. Returns False (and changes nothing) otherwise.
+        """
+        if self.query is None or self.loading or self.next_key is not None:
+            return False
+        if self._count_request is not None:
+            self._count_request.cancel()
+        for item, row in list(self.rows.items()):
+            if not keep(row):
+                self.table.delete(item)
+                del self.rows[item]
+        self.query = query
+        self.loaded = self.total = len(self.rows)
+        self._update_status()
+        return True
+
+    def reload(self):
+        """Re-run the current query after a change (an edit, approval, ...).
+
+        As many rows as are loaded now are fetched again, so the diff only touches
+        the rows that changed and the user keeps their place in the table.
+        """
+        if self.query is not None and self.table.winfo_exists():
+            self.load(self.query, rows=max(self.loaded, self.page_size))
+
+    def load_more(self):
+        """Fetch the page after the last loaded row, if there is one."""
+        if self.loading or self.next_key is None or self.query is None:
+            return
+        self._insert_loading("Loading more...")
+        self._fetch(self.next_key)
+
+    def set_page_size(self, page_size):
+        self.page_size = page_size
+        if self.query is not None:
+            self.load(self.query)
+
+    def _fetch(self, after, rows=None):
+        self.loading = True
+        self.more_button.configure(state="disabled")
+        self.queries.submit(self.query.fetch_page, after, rows or self.page_size,
+                            on_success=lambda result, first=after is None: self._on_page(result, first),
+                            on_error=self._on_error, tag=self.tag)
+
+    def _on_page(self, result, first):
+        # The table is gone if the page was switched while the query was running
+        if not self.table.winfo_exists():
+            return
+        rows, self.next_key = result
+        self.loading = False
+        self._remove_loading()
+        if first:
+            self.touched = self._apply(rows)
+            self.loaded = len(self.rows)
+        else:
+            for row in rows:
+                item = str(self.key(row))
+                # A row already shown can come back: an edit may move its sort key past the
+                # seek position (e.g. an event's date), and search results page by offset
+                if item not in self.rows:
+                    self.rows[self.table.insert("", tk.END, iid=item, values=self.format_row(row))] = row
+            self.loaded = len(self.rows)
+        self._update_status()
+        if first and self.on_first_page is not None:
+            self.on_first_page()
+
+    def _on_count(self, total):
+        if self.status_label.winfo_exists():
+            self.total = total
+            self._update_status()
+
+    def _on_error(self, error):
+        if not self.table.winfo_exists():
+            return
+        self.loading = False
+        self._remove_loading()
+        self._update_status()
+        messagebox.showerror("Database Error", f"{self.error_text}: {str(error)}")
+
+    def _update_status(self):
+        total = self.loaded if self.total is None and self.next_key is None else self.total
+        if total is None:
+            self.status_label.configure(text=f"Showing {self.loaded:,} rows")
+        else:
+            self.status_label.configure(text=f"Showing {self.loaded:,} of {max(total, self.loaded):,}")
+        self.more_button.configure(state="normal" if self.next_key is not None and not self.loading else "disabled")
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # Reaching the bottom pulls in the next page
+        if float(last) >= 1.0 and self.next_key is not None and not self.loading:
+            self.table.after_idle(self.load_more)
+
+    def _apply(self, rows):
+        """Make the table show rows, in order, touching only the items that differ.
+
+        Returns the number of items inserted, updated, moved or deleted.
+        """
+        top = self.table.yview()[0]
+        wanted = {}
+        for row in rows:
+            wanted.setdefault(str(self.key(row)), row)
+
+        touched = 0
+        gone = [item for item in self.rows if item not in wanted]
+        if gone:
+            self.table.delete(*gone)
+            touched += len(gone)
+
+        # The kept items forming a longest run already in the wanted order stay where
+        # they are; only the others are moved (one edited row moves one item)
+        old_position = {item: i for i, item in enumerate(self.table.get_children()) if item in wanted}
+        kept = [item for item in wanted if item in old_position]
+        staying = {kept[i] for i in longest_increasing([old_position[item] for item in kept])}
+        displaced = [item for item in kept if item not in staying]
+        if displaced:
+            selection = self.table.selection()
+            self.table.detach(*displaced)
+
+        # With the displaced items out, the children before each index are the wanted ones
+        rows_by_item = {}
+        for index, (item, row) in enumerate(wanted.items()):
+            old = self.rows.get(item)
+            if old is None:
+                self.table.insert("", index, iid=item, values=self.format_row(row))
+                touched += 1
+            else:
+                changed = old != row
+                if changed:
+                    self.table.item(item, values=self.format_row(row))
+                if item not in staying:
+                    self.table.move(item, "", index)
+                    changed = True
+                touched += changed
+            rows_by_item[item] = row
+        self.rows = rows_by_item
+        # Some Tk versions drop detached items from the selection
+        if displaced and self.table.selection() != selection:
+            self.table.selection_set(selection)
+
+        # Deleting rows above the view would otherwise shift it
+        if touched:
+            self.table.yview_moveto(top)
+        return touched
+
+    def _insert_loading(self, text):
+        columns = len(self.table["columns"])
+        self.table.insert("", tk.END, values=("",) + (text,) + ("",) * (columns - 2), tags=("loading",))
+
+    def _remove_loading(self):
+        for item in self.table.tag_has("loading"):
+            self.table.delete(item)
@@ -7,8 +7,6 @@ import mysql.connector
 from mysql.connector import Error
 from PIL import Image, ImageTk
 import os
-import cv2
-from ffpyplayer.player import MediaPlayer
 import logging
 import webbrowser
 import re
@@ -16,35 +14,101 @@ import bcrypt
 import time
 import sys
 from datetime import datetime, date
+import database
+from query_service import QueryService
+from virtual_scroller import VirtualScroller
+import thumbnails
+import image_cache
+from image_loader import ImageLoader
+import search
+from pagination import KeysetQuery, invalidate_counts
+import ratings
+import popularity
+from event_index import EventIndex
+from live_search import LiveSearch
+import live_search
+import autocomplete
+import fuzzy
+from autocomplete import SuggestionBox
+from page_cache import PageCache
+import card_styles
+from screen_router import ScreenRouter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Database connection (XAMPP MySQL)
-def connect_to_database():
-    try:
-        db = mysql.connector.connect(
-            host="localhost",
-            user="root",
-            password="",
-            database="tourism_db"
-        )
-        cursor = db.cursor()
-        logging.info("✅ Connected to MySQL successfully.")
-        return db, cursor
-    except mysql.connector.Error as err:
-        logging.error(f"❌ Database Error: {err}")
-        return None, None
-
-db, cursor = connect_to_database()
-
 # Session timeout in seconds (5 minutes)
 SESSION_TIMEOUT = 300
 
+# Fixed row heights (px) for the virtualized card lists
+PLACE_CARD_HEIGHT = 270
+EVENT_CARD_HEIGHT = 390
+REVIEW_ROW_HEIGHT = 210
+# A review row shows this many wrapped lines of the comment and of the admin reply
+# (with "Read more" for the rest), so every part of it fits in REVIEW_ROW_HEIGHT
+REVIEW_WRAP_LENGTH = 700
+REVIEW_COMMENT_LINES = 2
+REVIEW_REPLY_LINES = 1
+
+# Most search results shown for one query (best matches first)
+SEARCH_RESULT_LIMIT = 200
+
+# Reviews fetched per page in the All Reviews popup
+REVIEWS_PAGE_SIZE = 30
+
+# Events listed under "Popular Events" in the events sidebar
+POPULAR_EVENTS_COUNT = 3
+
+# Seconds a cached page's data is shown before it is reloaded on the next visit
+EXPLORE_MAX_AGE = 120
+EVENTS_MAX_AGE = 300
+
+# Areas of the events location filter (an event matches every area its location mentions)
+EVENT_LOCATIONS = ["General Santos City", "South Cotabato", "Koronadal City",
+                   "Sarangani Province", "Cotabato Province", "Sultan Kudarat"]
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December"]
+
+# Place card rows: the place followed by its rating aggregates (NULL when it has no reviews)
+PLACE_CARD_COLUMNS = ("places.id, places.name, places.category, places.description, places.image, "
+                      "places.location, place_rating_stats.avg_rating, place_rating_stats.rating_count")
+PLACE_CARD_TABLES = "places LEFT JOIN place_rating_stats ON place_rating_stats.place_id = places.id"
+
+def clip_lines(text, text_font, width, max_lines):
+    """Cut text to the first max_lines lines it takes when wrapped at width pixels
+    (at spaces, like a Label's wraplength). Returns (text, whether it was cut)."""
+    lines = []
+    for paragraph in text.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if line and text_font.measure(candidate) > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+            if len(lines) > max_lines:
+                break
+        lines.append(line)
+        if len(lines) > max_lines:
+            break
+    if len(lines) <= max_lines:
+        return text, False
+    # Make room for the ellipsis on the last line shown
+    last = lines[max_lines - 1].rstrip()
+    while last and text_font.measure(last + " …") > width:
+        last = last.rsplit(" ", 1)[0] if " " in last else last[:-1]
+    return "\n".join(lines[:max_lines - 1] + [last + " …"]), True
+
+
 class UserDashboard:
-    def __init__(self, root, user_id):
+    def __init__(self, root, user_id, router=None):
         self.root = root
         self.current_user_id = user_id
+        # Screen router of the app window (None when run on its own)
+        self.router = router
+        # after() ids of the periodic jobs, cancelled by close()
+        self.timers = {}
         self.root.title("Tourism Information System - User Dashboard")
         self.root.geometry("900x500")
         self.root.resizable(True, True)
@@ -106,6 +170,9 @@ class UserDashboard:
         self.style.configure("LightBlue.TLabel", background=self.dark_blue, foreground=self.light_blue)
         self.style.configure("ReadMore.TButton", background="#1e88e5", foreground="white")
 
+        # Event card badges share a fixed set of styles
+        card_styles.register(self.style)
+
         # Configure dark theme styles
         self.style.configure("dark.TFrame", background="#2c2c2c")
         self.style.configure("dark.TLabel", background="#2c2c2c", foreground="white")
@@ -133,7 +200,10 @@ class UserDashboard:
         self.user_data = self.fetch_user_data()
         if not self.user_data:
             messagebox.showerror("Error", "Failed to fetch user data. Please try again.")
-            self.root.destroy()
+            if self.router is not None:
+                self.root.after_idle(self.router.show_login)
+            else:
+                self.root.destroy()
             return
 
         # Navigation Menu
@@ -170,9 +240,34 @@ class UserDashboard:
         # Track current active page
         self.current_page = None
 
-        # Main Content Frame
-        self.content_frame = ttk.Frame(self.root)
-        self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        # Background worker for database queries (results are delivered on the Tk thread)
+        self.queries = QueryService(self.root)
+
+        # Decodes card images on worker threads; cards show a placeholder until they arrive
+        self.image_loader = ImageLoader(self.root)
+
+        # Custom fonts of the home page
+        self.title_font = font.Font(family="Segoe UI", size=24, weight="bold")
+        self.subtitle_font = font.Font(family="Segoe UI", size=12)
+        self.section_title_font = font.Font(family="Segoe UI", size=16, weight="bold")
+        self.regular_font = font.Font(family="Segoe UI", size=10)
+        self.feature_title_font = font.Font(family="Segoe UI", size=12, weight="bold")
+
+        # Fonts of the review rows (also used to measure where their text wraps)
+        self.review_font = font.Font(family="Arial", size=12)
+        self.review_reply_font = font.Font(family="Arial", size=12, slant="italic")
+
+        # Main Content Frame; every page is built into its own frame inside it
+        self.page_container = ttk.Frame(self.root)
+        self.page_container.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+        self.content_frame = self.page_container
+
+        # Built pages stay alive (hidden) while switching; stale ones reload only their data
+        self.pages = PageCache(self.page_container, self.build_page, self.set_content_frame, {
+            "Explore Places": (EXPLORE_MAX_AGE, lambda: self.place_search.search_now()),
+            "Saved Places": (None, self.load_saved_places),
+            "Events": (EVENTS_MAX_AGE, self.fetch_events),
+        })
 
         # Default Page
         self.show_page("Home")
@@ -183,31 +278,33 @@ class UserDashboard:
         # Check session timeout periodically
         self.check_session_timeout()
 
+        # Write event interaction counts periodically
+        self.timers["popularity"] = self.root.after(popularity.FLUSH_INTERVAL * 1000, self.flush_popularity)
+
+        # Load the search suggestions, then keep them up to date with approvals
+        self.refresh_autocomplete()
+
     def fetch_user_data(self):
         """Fetch user-specific data from the database."""
-        if db and cursor:
-            try:
-                cursor.execute(
-                    "SELECT username, email, phone, profile_picture_path, address, status, role FROM user_accounts WHERE id = %s",
-                    (self.current_user_id,)
-                )
-                user_data = cursor.fetchone()
-                if user_data:
-                    return {
-                        "username": user_data[0],
-                        "email": user_data[1],
-                        "phone": user_data[2],
-                        "profile_picture_path": user_data[3],
-                        "address": user_data[4],
-                        "status": user_data[5],
-                        "role": user_data[6]
-                    }
-                else:
-                    return None
-            except Error as e:
-                logging.error(f"Error fetching user data: {e}")
+        try:
+            user_data = database.fetch_one(
+                "SELECT username, email, phone, profile_picture_path, address, status, role FROM user_accounts WHERE id = %s",
+                (self.current_user_id,)
+            )
+            if user_data:
+                return {
+                    "username": user_data[0],
+                    "email": user_data[1],
+                    "phone": user_data[2],
+                    "profile_picture_path": user_data[3],
+                    "address": user_data[4],
+                    "status": user_data[5],
+                    "role": user_data[6]
+                }
+            else:
                 return None
-        else:
+        except Error as e:
+            logging.error(f"Error fetching user data: {e}")
             return None
 
     def create_session(self):
@@ -218,12 +315,10 @@ class UserDashboard:
 
     def update_last_activity(self):
         """Update the last_activity timestamp in the database."""
-        if db and cursor:
-            try:
-                cursor.execute("UPDATE user_accounts SET last_activity = NOW() WHERE id = %s", (self.current_user_id,))
-                db.commit()
-            except Error as e:
-                logging.error(f"Error updating last activity: {e}")
+        try:
+            database.execute("UPDATE user_accounts SET last_activity = NOW() WHERE id = %s", (self.current_user_id,))
+        except Error as e:
+            logging.error(f"Error updating last activity: {e}")
 
     def check_session_timeout(self):
         """Check if the session has expired and log out the user if it has."""
@@ -237,56 +332,47 @@ class UserDashboard:
                         return
 
         # Check again after 1 minute
-        self.root.after(60000, self.check_session_timeout)
-    
-    def logout(self):
-        """Log out the user and return to login screen."""
-        # Update database status
-        if db and cursor:
-            try:
-                cursor.execute("UPDATE user_accounts SET is_online = 0, last_activity = NULL WHERE id = %s", 
-                              (self.current_user_id,))
-                db.commit()
-            except Error as e:
-                logging.error(f"Error updating logout status: {e}")
-        
-        # Remove session file
-        if os.path.exists("session.txt"):
-            try:
-                os.remove("session.txt")
-            except Exception as e:
-                logging.error(f"Error removing session file: {e}")
-        
-        # Close the current window
-        self.root.destroy()
-        
-        # Restart login window
+        self.timers["session"] = self.root.after(60000, self.check_session_timeout)
+
+    def flush_popularity(self):
+        """Write the counted event interactions in the background, then schedule the next flush."""
+        self.queries.submit(popularity.flush, on_error=lambda e: logging.error(f"Error saving event popularity: {e}"),
+                            tag="popularity_flush")
+        self.timers["popularity"] = self.root.after(popularity.FLUSH_INTERVAL * 1000, self.flush_popularity)
+
+    def refresh_autocomplete(self):
+        """Apply new, approved and removed places/events to the search suggestions in the background."""
+        self.queries.submit(autocomplete.refresh, on_error=lambda e: logging.error(f"Error refreshing suggestions: {e}"),
+                            tag="autocomplete")
+        self.timers["autocomplete"] = self.root.after(autocomplete.REFRESH_INTERVAL * 1000, self.refresh_autocomplete)
+
+    def save_popularity(self):
+        """Write the remaining event interaction counts before the window closes."""
         try:
-            # Get the path to the current Python executable
-            python_executable = sys.executable
-            
-            # Get the path to the login script (assuming it's in the same directory)
-            login_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "login.py")
-            
-            # Check if the login script exists
-            if os.path.exists(login_script):
-                # Start a new process for the login window
-                os.system(f'"{python_executable}" "{login_script}"')
-            else:
-                messagebox.showerror("Error", "Login script not found. Please contact support.")
-        except Exception as e:
-            logging.error(f"Error restarting login window: {e}")
-            messagebox.showerror("Error", f"Could not restart login window: {str(e)}")
+            popularity.flush()
+        except Error as e:
+            logging.error(f"Error saving event popularity: {e}")
+    
+    def close(self):
+        """Stop the periodic jobs and background workers (the pool and caches stay for the next login)."""
+        for after_id in self.timers.values():
+            self.root.after_cancel(after_id)
+        self.timers.clear()
+        if hasattr(self, "queries"):
+            self.queries.shutdown()
+            self.image_loader.shutdown()
+            self.save_popularity()
+        image_cache.log_stats()
+        live_search.log_stats()
 
     def on_close(self):
         """Clean up resources when the window is closed."""
-        if db:
-            db.close()
-            logging.info("✅ Database connection closed.")
+        self.close()
+        database.close_pool()
         self.root.destroy()
         
     def show_page(self, page):
-        """Clears the content frame and displays the selected page."""
+        """Displays the selected page, reusing it if it was built before."""
         # Reset all buttons to default style
         for item, btn in self.menu_buttons.items():
             if item == page:
@@ -298,12 +384,15 @@ class UserDashboard:
         
         # Update current page tracker
         self.current_page = page
-        
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        self.pages.show(page)
+
+    def set_content_frame(self, frame):
+        """Point the page methods at the frame of the page being built or shown."""
+        self.content_frame = frame
 
-        ttk.Label(self.content_frame, text=page, font=("Arial", 24, "bold")).pack(pady=20)
+    def build_page(self, page, frame):
+        """Build a page into its (new) frame."""
+        ttk.Label(frame, text=page, font=("Arial", 24, "bold")).pack(pady=20)
 
         # Display page content
         if page == "Home":
@@ -322,13 +411,6 @@ class UserDashboard:
             self.account_page()
 
     def home_page(self):
-        # Create custom fonts
-        self.title_font = font.Font(family="Segoe UI", size=24, weight="bold")
-        self.subtitle_font = font.Font(family="Segoe UI", size=12)
-        self.section_title_font = font.Font(family="Segoe UI", size=16, weight="bold")
-        self.regular_font = font.Font(family="Segoe UI", size=10)
-        self.feature_title_font = font.Font(family="Segoe UI", size=12, weight="bold")
-
         # Main container - using ttk.Frame with proper styling
         self.main_frame = ttk.Frame(self.content_frame, padding=(30, 30, 30, 30))
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -586,10 +668,20 @@ class UserDashboard:
         search_frame = ttk.Frame(self.content_frame)
         search_frame.pack(pady=10)
 
-        self.search_var = tk.StringVar()
-        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=20, font=("Arial", 12))
+        self.place_search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.place_search_var, width=20, font=("Arial", 12))
         self.search_entry.pack(pady=5, side=tk.LEFT, padx=5)
-        self.search_entry.bind("<Return>", lambda event: self.search_places_explore())
+        # Suggestions bind first so picking one with Return doesn't also search the typed text
+        SuggestionBox(self.search_entry, self.place_search_var,
+                      lambda text: autocomplete.get_index().suggest(text, (autocomplete.PLACE, autocomplete.LOCATION)),
+                      on_select=lambda text: self.search_places_explore())
+        self.search_entry.bind("<Return>", lambda event: self.search_places_explore(), add="+")
+
+        # Results update while typing; a grown query narrows the results already shown
+        self.place_results = None
+        self.place_search_request = None
+        self.place_search = LiveSearch(self.search_entry, self.place_search_var, self.run_place_search,
+                                       refine=self.narrow_place_results, name="places")
 
         # Search Button
         search_button = ttk.Button(search_frame, text="Search", command=self.search_places_explore, bootstyle="primary")
@@ -601,32 +693,29 @@ class UserDashboard:
 
         ttk.Label(category_frame, text="Category:").pack(side=tk.LEFT, padx=5)
 
-        self.category_var = tk.StringVar()
-        self.category_dropdown = ttk.Combobox(category_frame, textvariable=self.category_var, 
+        self.place_category_var = tk.StringVar()
+        self.category_dropdown = ttk.Combobox(category_frame, textvariable=self.place_category_var, 
                                             values=["All", "Beach", "Mountains", "Museum", "Camping", 
                                                     "Hiking", "Farm", "Waterfalls", "Golf"],
                                             state="readonly", width=15)
         self.category_dropdown.current(0)
         self.category_dropdown.pack(side=tk.LEFT, padx=5)
 
-        filter_button = ttk.Button(category_frame, text="Filter", command=self.filter_places, bootstyle="primary")
-        filter_button.pack(side=tk.LEFT, padx=5)
-
-        # Scrollable Frame Setup
-        self.canvas = tk.Canvas(self.content_frame)
-        self.scroll_frame = ttk.Frame(self.canvas)
-        self.scrollbar = ttk.Scrollbar(self.content_frame, orient="vertical", command=self.canvas.yview)
+        ttk.Label(category_frame, text="Sort:").pack(side=tk.LEFT, padx=5)
 
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.place_sort_var = tk.StringVar(value="Default")
+        sort_dropdown = ttk.Combobox(category_frame, textvariable=self.place_sort_var,
+                                     values=["Default", "Top rated"], state="readonly", width=10)
+        sort_dropdown.pack(side=tk.LEFT, padx=5)
+        sort_dropdown.bind("<<ComboboxSelected>>", lambda event: self.filter_places())
 
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
+        filter_button = ttk.Button(category_frame, text="Filter", command=self.filter_places, bootstyle="primary")
+        filter_button.pack(side=tk.LEFT, padx=5)
 
-        # Bind scrolling
-        self.scroll_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
-        self.canvas.bind("<Leave>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
+        # Virtualized place list: only the cards in view are built
+        self.places_scroller = VirtualScroller(self.content_frame, PLACE_CARD_HEIGHT,
+                                               self.build_place_card, self.update_place_card)
+        self.places_scroller.frame.pack(fill=tk.BOTH, expand=True)
 
         # Load initial places
         self.load_places()
@@ -637,133 +726,158 @@ class UserDashboard:
 
     def load_places(self):
         """Loads all APPROVED places from the database into the UI."""
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-
-        if db is None:
-            messagebox.showerror("Database Error", "No database connection available.")
-            return
-
         try:
             # Only select places with status 'approved'
-            cursor.execute("SELECT id, name, category, description, image, location FROM places WHERE status = 'approved'")
-            places = cursor.fetchall()
+            places = database.fetch_all(f"SELECT {PLACE_CARD_COLUMNS} FROM {PLACE_CARD_TABLES} WHERE places.status = 'approved'")
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error fetching places: {err}")
             return
 
         if not places:
-            ttk.Label(self.scroll_frame, text="No approved places found.", font=("Arial", 14)).pack(pady=10)
+            self.places_scroller.set_message("No approved places found.")
             return
 
-        for place in places:
-            self.create_place_card(place)
+        self.places_scroller.set_items(places)
 
     def search_places_explore(self):
         """Searches APPROVED places in Explore Places page based on user input."""
-        query = self.search_var.get().strip()
-        
-        # Clear previous results
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
+        self.place_search.search_now()
 
+    def run_place_search(self, query):
+        """Search APPROVED places in the background (a newer search supersedes it)."""
         if not query:
-            self.load_places()
+            self.place_results = None
+            self.filter_places()
+            self.place_search.done(query)
             return
 
-        if db is None:
-            messagebox.showerror("Database Error", "No database connection available.")
-            return
-
-        try:
-            # Search by name, location or category in APPROVED places only
-            cursor.execute("""
-                SELECT id, name, category, description, image, location 
-                FROM places 
-                WHERE status = 'approved' AND (name LIKE %s OR location LIKE %s OR category LIKE %s)
-                """, (f"%{query}%", f"%{query}%", f"%{query}%"))
-            places = cursor.fetchall()
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Error searching places: {err}")
+        # Full-text search over APPROVED places only, best matches first; similar names if nothing matches
+        place_query = fuzzy.FuzzyFallbackQuery(search.SearchQuery(PLACE_CARD_TABLES, PLACE_CARD_COLUMNS, query,
+                                                                  where=["places.status = 'approved'"]))
+        self.place_search_request = self.queries.submit(place_query.fetch_all, SEARCH_RESULT_LIMIT,
+                                                        on_success=lambda places, text=query: self.show_place_results(
+                                                            text, places, place_query.fuzzy),
+                                                        on_error=lambda err: messagebox.showerror("Database Error", f"Error searching places: {err}"),
+                                                        tag="place_search")
+
+    def show_place_results(self, query, places, fuzzy_matches=False):
+        """Show the results of a place search unless the user has typed past it."""
+        if not self.search_entry.winfo_exists() or not self.place_search.is_current(query):
             return
-
+        # Similar names aren't word matches, so they can't be narrowed as the query grows
+        self.place_results = None if fuzzy_matches else places
         if not places:
-            ttk.Label(self.scroll_frame, text="No results found.", font=("Arial", 14)).pack(pady=10)
-            return
+            self.places_scroller.set_message("No results found.")
+        else:
+            self.places_scroller.set_items(places)
+        self.place_search.done(query)
 
-        for place in places:
-            self.create_place_card(place)
+    def narrow_place_results(self, previous, query):
+        """Filter the shown results for a grown query on the Tk thread, if they were complete."""
+        if (self.place_results is None or len(self.place_results) >= SEARCH_RESULT_LIMIT
+                or not search.can_narrow(previous, query)):
+            return False
+        # name, category, description and location are the searched columns
+        places = [place for place in self.place_results if search.matches(query, place[1:4] + place[5:6])]
+        self.place_results = places
+        if not places:
+            self.places_scroller.set_message("No results found.")
+        else:
+            self.places_scroller.set_items(places)
+        return True
 
     def filter_places(self):
-        """Filters APPROVED places based on selected category."""
-        category = self.category_var.get()
-        
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-
-        if db is None:
-            messagebox.showerror("Database Error", "No database connection available.")
-            return
-
-        query = "SELECT id, name, category, description, image, location FROM places WHERE status = 'approved'"
+        """Filters APPROVED places based on selected category, in the selected order."""
+        category = self.place_category_var.get()
+        self.place_results = None
+        self.place_search.reset()
+        # A search still running would replace the filtered list
+        if self.place_search_request is not None:
+            self.place_search_request.cancel()
+
+        where = ["places.status = 'approved'"]
         params = []
 
         if category != "All":
-            query += " AND category = %s"
+            where.append("places.category = %s")
             params.append(category)
 
         try:
-            cursor.execute(query, params)
-            places = cursor.fetchall()
+            if self.place_sort_var.get() == "Top rated":
+                places = ratings.top_rated_places(PLACE_CARD_COLUMNS, where, params)
+            else:
+                places = database.fetch_all(
+                    f"SELECT {PLACE_CARD_COLUMNS} FROM {PLACE_CARD_TABLES} WHERE {' AND '.join(where)}", params)
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error filtering places: {err}")
             return
 
         if not places:
-            ttk.Label(self.scroll_frame, text="No places found in this category.", font=("Arial", 14)).pack(pady=10)
+            self.places_scroller.set_message("No places found in this category.")
             return
 
-        for place in places:
-            self.create_place_card(place)
+        self.places_scroller.set_items(places)
 
-    def create_place_card(self, place, saved=False):
-        """Creates a UI card for each place in the database."""
-        place_frame = ttk.Frame(self.scroll_frame, relief="ridge", borderwidth=2)
-        place_frame.pack(fill=tk.X, pady=5, padx=5)
+    def build_place_card(self, parent):
+        """Creates an empty place card; the virtual scroller fills and reuses it."""
+        card = ttk.Frame(parent, relief="ridge", borderwidth=2)
 
-        # Load Image
-        img_path = place[4]
-        if os.path.exists(img_path):
-            img = Image.open(img_path)
-            img = img.resize((500, 250), Image.LANCZOS)
-            img = ImageTk.PhotoImage(img)
-            img_label = ttk.Label(place_frame, image=img)
-            img_label.image = img
-            img_label.pack(side=tk.LEFT, padx=10)
+        # Image
+        card.img_label = ttk.Label(card)
+        card.img_label.pack(side=tk.LEFT, padx=10)
 
         # Place Details
-        details_frame = ttk.Frame(place_frame)
+        details_frame = ttk.Frame(card)
         details_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        ttk.Label(details_frame, text=f"📍 {place[1]}", font=("Arial", 16, "bold")).pack(anchor="w")
-        ttk.Label(details_frame, text=f"Category: {place[2]}", font=("Arial", 12, "italic")).pack(anchor="w")
-        ttk.Label(details_frame, text=place[3], font=("Arial", 12), wraplength=400).pack(anchor="w", pady=5)
+        card.name_label = ttk.Label(details_frame, font=("Arial", 16, "bold"))
+        card.name_label.pack(anchor="w")
+        card.category_label = ttk.Label(details_frame, font=("Arial", 12, "italic"))
+        card.category_label.pack(anchor="w")
+        card.description_label = ttk.Label(details_frame, font=("Arial", 12), wraplength=400)
+        card.description_label.pack(anchor="w", pady=5)
 
         # Location
-        ttk.Label(details_frame, text=f"🗺️ {place[5]}", font=("Arial", 12)).pack(anchor="w", pady=5)
+        card.location_label = ttk.Label(details_frame, font=("Arial", 12))
+        card.location_label.pack(anchor="w", pady=5)
+
+        # Average rating
+        card.rating_label = ttk.Label(details_frame, font=("Arial", 12))
+        card.rating_label.pack(anchor="w")
 
         # Buttons
-        button_frame = ttk.Frame(place_frame)
+        button_frame = ttk.Frame(card)
         button_frame.pack(side=tk.RIGHT, padx=10)
 
-        map_button = ttk.Button(button_frame, text="🗺️ Map", command=lambda p=place: self.open_google_maps(p), bootstyle="info")
-        map_button.pack(side=tk.LEFT, padx=5)
+        card.map_button = ttk.Button(button_frame, text="🗺️ Map", bootstyle="info")
+        card.map_button.pack(side=tk.LEFT, padx=5)
+
+        card.save_button = ttk.Button(button_frame)
+        card.save_button.pack(side=tk.LEFT, padx=5)
+        return card
+
+    def update_place_card(self, card, place, index, saved=False):
+        """Fills a place card with the data of one place."""
+        # Load Image
+        img_path = place[4]
+        if img_path and os.path.exists(img_path):
+            self.image_loader.load_into(card.img_label, img_path, thumbnails.PLACE_CARD_SIZE)
+        else:
+            card.img_label.image_key = None
+            card.img_label.configure(image="")
+            card.img_label.image = None
 
+        card.name_label.configure(text=f"📍 {place[1]}")
+        card.category_label.configure(text=f"Category: {place[2]}")
+        card.description_label.configure(text=place[3])
+        card.location_label.configure(text=f"🗺️ {place[5]}")
+        card.rating_label.configure(text=ratings.format_rating(place[6], place[7]) if len(place) > 7 else "")
+
+        card.map_button.configure(command=lambda p=place: self.open_google_maps(p))
         if saved:
-            save_button = ttk.Button(button_frame, text="❌ Unsave", command=lambda p=place: self.toggle_save_place(p), bootstyle="danger")
+            card.save_button.configure(text="❌ Unsave", command=lambda p=place: self.toggle_save_place(p), bootstyle="danger")
         else:
-            save_button = ttk.Button(button_frame, text="💾 Save", command=lambda p=place: self.toggle_save_place(p), bootstyle="success")
-        save_button.pack(side=tk.LEFT, padx=5)
+            card.save_button.configure(text="💾 Save", command=lambda p=place: self.toggle_save_place(p), bootstyle="success")
 
     def open_google_maps(self, place):
         """Opens Google Maps for the selected place."""
@@ -773,15 +887,15 @@ class UserDashboard:
     def toggle_save_place(self, place):
         """Toggles save/unsave state and refreshes the saved places page."""
         try:
-            cursor.execute("SELECT * FROM saved_places WHERE user_id = %s AND place_id = %s", (self.current_user_id, place[0]))
-            saved = cursor.fetchone()
+            saved = database.fetch_one("SELECT * FROM saved_places WHERE user_id = %s AND place_id = %s", (self.current_user_id, place[0]))
 
             if saved:
                 self.unsave_place(place)
             else:
                 self.save_place(place)
 
-            self.saved_places_page()
+            self.pages.invalidate("Saved Places")
+            self.show_page("Saved Places")
 
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error toggling save state: {err}")
@@ -789,8 +903,7 @@ class UserDashboard:
     def save_place(self, place):
         """Saves a place to the saved_places table."""
         try:
-            cursor.execute("INSERT INTO saved_places (user_id, place_id) VALUES (%s, %s)", (self.current_user_id, place[0]))
-            db.commit()
+            database.execute("INSERT INTO saved_places (user_id, place_id) VALUES (%s, %s)", (self.current_user_id, place[0]))
             messagebox.showinfo("Saved", f"{place[1]} has been added to your saved places.")
 
         except mysql.connector.Error as err:
@@ -799,8 +912,7 @@ class UserDashboard:
     def unsave_place(self, place):
         """Removes a place from the saved_places table."""
         try:
-            cursor.execute("DELETE FROM saved_places WHERE user_id = %s AND place_id = %s", (self.current_user_id, place[0]))
-            db.commit()
+            database.execute("DELETE FROM saved_places WHERE user_id = %s AND place_id = %s", (self.current_user_id, place[0]))
             messagebox.showinfo("Removed", f"{place[1]} has been removed from your saved places.")
 
         except mysql.connector.Error as err:
@@ -815,41 +927,33 @@ class UserDashboard:
         # Title
         ttk.Label(self.content_frame, text="Saved Places", font=("Arial", 24, "bold")).pack(pady=20)
         
-        # Scrollable Frame Setup
-        self.canvas = tk.Canvas(self.content_frame)
-        self.scroll_frame = ttk.Frame(self.canvas)
-        self.scrollbar = ttk.Scrollbar(self.content_frame, orient="vertical", command=self.canvas.yview)
-
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
-
-        # Bind scrolling
-        self.scroll_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
-        self.canvas.bind("<Leave>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
+        # Virtualized place list: only the cards in view are built
+        self.saved_places_scroller = VirtualScroller(
+            self.content_frame, PLACE_CARD_HEIGHT, self.build_place_card,
+            lambda card, place, index: self.update_place_card(card, place, index, saved=True)
+        )
+        self.saved_places_scroller.frame.pack(fill=tk.BOTH, expand=True)
+        self.load_saved_places()
 
-        # Fetch saved places
+    def load_saved_places(self):
+        """Fetch the user's saved places into the Saved Places list."""
         try:
-            cursor.execute("""
-                SELECT p.id, p.name, p.category, p.description, p.image, p.location
-                FROM saved_places s
-                JOIN places p ON s.place_id = p.id
-                WHERE s.user_id = %s
+            saved_places = database.fetch_all(f"""
+                SELECT {PLACE_CARD_COLUMNS}
+                FROM saved_places
+                JOIN places ON saved_places.place_id = places.id
+                LEFT JOIN place_rating_stats ON place_rating_stats.place_id = places.id
+                WHERE saved_places.user_id = %s
                 """, (self.current_user_id,))
-            saved_places = cursor.fetchall()
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error fetching saved places: {err}")
             return
 
         if not saved_places:
-            ttk.Label(self.scroll_frame, text="No saved places yet.", font=("Arial", 14)).pack(pady=10)
+            self.saved_places_scroller.set_message("No saved places yet.")
             return
 
-        for place in saved_places:
-            self.create_place_card(place, saved=True)
+        self.saved_places_scroller.set_items(saved_places)
 
     def reviews_page(self):
         """Displays the reviews page with search, category filter, and review submission functionality."""
@@ -877,9 +981,12 @@ class UserDashboard:
         search_controls.pack(pady=5)
         
         # Search Input with styling
-        self.search_var = tk.StringVar()
-        search_entry = ttk.Entry(search_controls, textvariable=self.search_var, width=30, font=("Arial", 11))
+        self.review_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_controls, textvariable=self.review_search_var, width=30, font=("Arial", 11))
         search_entry.pack(side=tk.LEFT, padx=5)
+        SuggestionBox(search_entry, self.review_search_var,
+                      lambda text: autocomplete.get_index().suggest(text, (autocomplete.PLACE,)),
+                      on_select=lambda text: self.search_places())
         
         # Search Button styled to match the blue button in screenshot
         search_button = ttk.Button(search_controls, text="Search", bootstyle="primary", command=self.search_places)
@@ -890,8 +997,8 @@ class UserDashboard:
         category_frame.pack(side=tk.LEFT, padx=20)
         
         self.categories = ["Beach", "Mountains", "Museum", "Camping", "Hiking", "Farm", "Waterfalls", "Golf"]
-        self.category_var = tk.StringVar()
-        category_dropdown = ttk.Combobox(category_frame, textvariable=self.category_var, values=self.categories, state="readonly", width=15)
+        self.review_category_var = tk.StringVar()
+        category_dropdown = ttk.Combobox(category_frame, textvariable=self.review_category_var, values=self.categories, state="readonly", width=15)
         category_dropdown.pack(side=tk.LEFT, padx=5)
         category_dropdown.bind("<<ComboboxSelected>>", self.filter_by_category)
         
@@ -980,50 +1087,47 @@ class UserDashboard:
     def load_initial_places(self):
         """Load initial set of places to display with images."""
         try:
-            cursor.execute("SELECT id, name, description, category, location, image FROM places LIMIT 5")
-            places = cursor.fetchall()
+            places = database.fetch_all("SELECT id, name, description, category, location, image FROM places LIMIT 5")
             self.display_places(places)
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error loading places: {err}")
 
     def search_places(self):
         """Search places based on the search term with images."""
-        search_term = self.search_var.get().strip()
+        search_term = self.review_search_var.get().strip()
         if not search_term:
             self.load_initial_places()
             return
             
         try:
-            cursor.execute("SELECT id, name, description, category, location, image FROM places WHERE name LIKE %s", (f"%{search_term}%",))
-            places = cursor.fetchall()
+            places = search.search_places(search_term, columns="id, name, description, category, location, image",
+                                          limit=SEARCH_RESULT_LIMIT)
             self.display_places(places)
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error searching places: {err}")
 
     def filter_by_category(self, event=None):
         """Filter places by selected category with images (triggered by combobox selection)."""
-        selected_category = self.category_var.get()
+        selected_category = self.review_category_var.get()
         if not selected_category:
             self.load_initial_places()
             return
             
         try:
-            cursor.execute("SELECT id, name, description, category, location, image FROM places WHERE category = %s", (selected_category,))
-            places = cursor.fetchall()
+            places = database.fetch_all("SELECT id, name, description, category, location, image FROM places WHERE category = %s", (selected_category,))
             self.display_places(places)
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error filtering places: {err}")
 
     def filter_by_category_button(self):
         """Filter places by selected category with images (triggered by filter button)."""
-        selected_category = self.category_var.get()
+        selected_category = self.review_category_var.get()
         if not selected_category:
             messagebox.showwarning("No Category Selected", "Please select a category first.")
             return
             
         try:
-            cursor.execute("SELECT id, name, description, category, location, image FROM places WHERE category = %s", (selected_category,))
-            places = cursor.fetchall()
+            places = database.fetch_all("SELECT id, name, description, category, location, image FROM places WHERE category = %s", (selected_category,))
             self.display_places(places)
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error filtering places: {err}")
@@ -1058,12 +1162,11 @@ class UserDashboard:
                     
                     # Check if image_data is a file path or binary data
                     if isinstance(image_data, str) and os.path.exists(image_data):
-                        image = Image.open(image_data)
+                        photo = image_cache.get_photo(image_data, thumbnails.PLACE_RESULT_SIZE)
                     else:
                         image = Image.open(io.BytesIO(image_data))
-                    
-                    image = image.resize((80, 60))
-                    photo = ImageTk.PhotoImage(image)
+                        image = image.resize(thumbnails.PLACE_RESULT_SIZE)
+                        photo = ImageTk.PhotoImage(image)
                     
                     img_label = ttk.Label(img_frame, image=photo)
                     img_label.image = photo  # Keep a reference
@@ -1123,8 +1226,7 @@ class UserDashboard:
     def load_image_from_db(self, place_id, size=(80, 60)):
         """Load an image for a place from the database."""
         try:
-            cursor.execute("SELECT image FROM places WHERE id = %s", (place_id,))
-            image_data = cursor.fetchone()
+            image_data = database.fetch_one("SELECT image FROM places WHERE id = %s", (place_id,))
             
             if image_data and image_data[0]:
                 # Convert binary data to image
@@ -1134,11 +1236,10 @@ class UserDashboard:
                 # Check if the image is a path or binary data
                 if isinstance(image_data[0], str) and os.path.exists(image_data[0]):
                     # It's a file path
-                    image = Image.open(image_data[0])
-                else:
-                    # It's binary data
-                    image = Image.open(io.BytesIO(image_data[0]))
-                    
+                    return image_cache.get_photo(image_data[0], size)
+                
+                # It's binary data
+                image = Image.open(io.BytesIO(image_data[0]))
                 image = image.resize(size)
                 photo = ImageTk.PhotoImage(image)
                 return photo
@@ -1153,7 +1254,7 @@ class UserDashboard:
         messagebox.showinfo("Place Selected", f"You've selected {place_name}")
         
         # Update the UI to show which place is selected
-        self.search_var.set(place_name)
+        self.review_search_var.set(place_name)
         
     def select_place_for_review(self, place_id, place_name):
         """Set the selected place for review and scroll to review section."""
@@ -1206,8 +1307,7 @@ class UserDashboard:
         # Update the rating label with the selected place name if available
         if self.selected_place_id is not None:
             try:
-                cursor.execute("SELECT name FROM places WHERE id = %s", (self.selected_place_id,))
-                place_name = cursor.fetchone()[0]
+                place_name = database.fetch_one("SELECT name FROM places WHERE id = %s", (self.selected_place_id,))[0]
                 self.rating_label.config(text=f"Rating for {place_name}: {rating}")
             except:
                 self.rating_label.config(text=f"Rating: {rating}")
@@ -1227,44 +1327,54 @@ class UserDashboard:
         
         if messagebox.askyesno("Confirm Submission", "Are you sure you want to submit this review?"):
             try:
-                cursor.execute("INSERT INTO reviews (user_id, place_id, rating, comment) VALUES (%s, %s, %s, %s)",
-                              (self.current_user_id, self.selected_place_id, self.rating, comment))
-                db.commit()
+                # Inserts the review and updates the place's rating aggregates in one transaction
+                ratings.add_review(self.current_user_id, self.selected_place_id, self.rating, comment)
+                invalidate_counts("reviews")
                 messagebox.showinfo("Success", "Review submitted successfully!")
                 self.comment_box.delete("1.0", tk.END)
                 self.rating = 0
                 self.set_rating(0)
                 self.selected_place_id = None
-                self.search_var.set("")
+                self.review_search_var.set("")
                 self.rating_label.config(text="Select a rating")
             except mysql.connector.Error as err:
                 messagebox.showerror("Database Error", f"Error submitting review: {err}")
 
-    def fetch_all_reviews(self):
-        """Fetches all reviews from the database with user and place information."""
-        try:
-            cursor.execute("""
-                SELECT 
-                    r.id,
-                    r.user_id,
-                    u.username, 
-                    p.name AS place_name, 
-                    r.rating, 
-                    r.comment,
-                    r.date_created,
-                    rr.reply_text AS admin_reply,
-                    a.username AS admin_username
-                FROM reviews r
-                JOIN user_accounts u ON r.user_id = u.id
-                JOIN places p ON r.place_id = p.id
-                LEFT JOIN review_replies rr ON r.id = rr.review_id
-                LEFT JOIN user_accounts a ON rr.admin_id = a.id
-                ORDER BY r.date_created DESC
-            """)
-            return cursor.fetchall()
-        except mysql.connector.Error as err:
-            messagebox.showerror("Database Error", f"Error fetching reviews: {err}")
-            return []
+    # Reviews joined with their author and place; read a page at a time, newest first
+    REVIEW_COLUMNS = "r.id, r.user_id, u.username, p.name AS place_name, r.rating, r.comment, r.date_created"
+    REVIEW_TABLES = "reviews r JOIN user_accounts u ON r.user_id = u.id JOIN places p ON r.place_id = p.id"
+
+    def reviews_query(self):
+        """Keyset query for the All Reviews popup with its place / "my reviews" filters."""
+        where = ["r.date_deleted IS NULL"]
+        params = []
+        place_id = self.review_filter_place_id()
+        if place_id is not None:
+            where.append("r.place_id = %s")
+            params.append(place_id)
+        if self.my_reviews_var.get():
+            where.append("r.user_id = %s")
+            params.append(self.current_user_id)
+        return KeysetQuery(self.REVIEW_COLUMNS, self.REVIEW_TABLES,
+                           order=[("r.date_created", "DESC", 6), ("r.id", "DESC", 0)],
+                           where=where, params=params)
+
+    @staticmethod
+    def fetch_reviews_page(query, after):
+        """One page of reviews plus each review's latest admin reply (runs on a worker thread)."""
+        rows, next_key = query.fetch_page(after, REVIEWS_PAGE_SIZE)
+        replies = {}
+        if rows:
+            placeholders = ", ".join(["%s"] * len(rows))
+            for review_id, reply_text, admin_username in database.fetch_all(f"""
+                SELECT rr.review_id, rr.reply_text, a.username
+                FROM review_replies rr
+                JOIN user_accounts a ON rr.admin_id = a.id
+                WHERE rr.review_id IN ({placeholders}) AND rr.date_deleted IS NULL
+                ORDER BY rr.date_created ASC
+                """, tuple(row[0] for row in rows)):
+                replies[review_id] = (reply_text, admin_username)
+        return [tuple(row) + replies.get(row[0], (None, None)) for row in rows], next_key
 
     def show_all_reviews_popup(self):
         """Displays all reviews in a popup window with edit/delete options for user's own reviews."""
@@ -1289,36 +1399,50 @@ class UserDashboard:
         title_label = ttk.Label(self.all_reviews_popup, text="All Reviews", font=("Arial", 16, "bold"))
         title_label.pack(pady=10)
         
-        # Create a Canvas and Scrollbar for scrolling
-        self.reviews_canvas = tk.Canvas(self.all_reviews_popup, borderwidth=0, highlightthickness=0)
-        self.reviews_scrollbar = ttk.Scrollbar(self.all_reviews_popup, orient="vertical", command=self.reviews_canvas.yview)
-        self.reviews_canvas.configure(yscrollcommand=self.reviews_scrollbar.set)
-        
-        # Pack the scrollbar and canvas
-        self.reviews_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.reviews_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Frame inside canvas for content
-        self.scrollable_reviews_frame = ttk.Frame(self.reviews_canvas)
-        self.reviews_canvas.create_window((0, 0), window=self.scrollable_reviews_frame, anchor="nw")
-        
-        # Configure the canvas to use the scrollbar
-        self.scrollable_reviews_frame.bind(
-            "<Configure>",
-            lambda e: self.reviews_canvas.configure(scrollregion=self.reviews_canvas.bbox("all"))
-        )
-        
-        # Bind mouse wheel to scroll properly
-        def _on_mousewheel(event):
-            self.reviews_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        
-        self.reviews_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Filters (applied in SQL) and the loaded/total counter
+        filter_frame = ttk.Frame(self.all_reviews_popup)
+        filter_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Label(filter_frame, text="Place:").pack(side=tk.LEFT, padx=(0, 5))
+        self.review_place_var = tk.StringVar(value="All places")
+        self.review_place_combo = ttk.Combobox(filter_frame, textvariable=self.review_place_var,
+                                               values=["All places"], state="readonly", width=30)
+        self.review_place_combo.pack(side=tk.LEFT, padx=(0, 10))
+        self.review_place_combo.bind("<<ComboboxSelected>>", lambda e: self.load_all_reviews())
+        self.review_place_ids = []
+        self.my_reviews_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text="Only my reviews", variable=self.my_reviews_var,
+                        command=self.load_all_reviews).pack(side=tk.LEFT)
+        self.reviews_count_label = ttk.Label(filter_frame, text="")
+        self.reviews_count_label.pack(side=tk.RIGHT)
+        
+        # Virtualized review list: only the rows in view are built, and the next
+        # page is fetched as the list is scrolled towards its end
+        self.reviews_scroller = VirtualScroller(self.all_reviews_popup, REVIEW_ROW_HEIGHT,
+                                                self.build_review_row, self.update_review_row,
+                                                on_near_end=self.load_more_reviews)
+        self.reviews_scroller.frame.pack(fill=tk.BOTH, expand=True)
+        self.reviews_canvas = self.reviews_scroller.canvas
         
         # Bind the close event
         self.all_reviews_popup.protocol("WM_DELETE_WINDOW", self.close_all_reviews_popup)
         
+        self.queries.fetch_all(
+            "SELECT id, name FROM places WHERE status = 'approved' AND date_deleted IS NULL ORDER BY name",
+            on_success=self.set_review_place_choices, tag="review_places")
         self.load_all_reviews()
 
+    def set_review_place_choices(self, places):
+        """Fill the popup's place filter."""
+        if not self.review_place_combo.winfo_exists():
+            return
+        self.review_place_ids = [place[0] for place in places]
+        self.review_place_combo['values'] = ["All places"] + [place[1] for place in places]
+
+    def review_filter_place_id(self):
+        """Id of the place picked in the popup's filter, or None for all places."""
+        index = self.review_place_combo.current()
+        return self.review_place_ids[index - 1] if index > 0 else None
+
     def on_mousewheel_reviews(self, event):
         """Handle mouse wheel scrolling for the reviews canvas."""
         if event.delta > 0:
@@ -1334,108 +1458,193 @@ class UserDashboard:
         self.results_canvas.bind_all("<MouseWheel>", self.on_mousewheel_results)
 
     def load_all_reviews(self):
-        """Loads all reviews into the scrollable frame with edit/delete options for user's own reviews."""
-        reviews = self.fetch_all_reviews()
-        
-        # Clear any existing reviews
-        for widget in self.scrollable_reviews_frame.winfo_children():
-            widget.destroy()
-        
-        if not reviews:
-            no_reviews_label = tk.Label(self.scrollable_reviews_frame, text="No reviews found", bg="white")
-            no_reviews_label.pack(pady=20)
+        """Fetches the first page of reviews in the background, showing a loading state until it arrives."""
+        if not (hasattr(self, 'all_reviews_popup') and self.all_reviews_popup.winfo_exists()):
+            return
+        self.reviews_scroller.set_message("Loading reviews...")
+        self.reviews_count_label.configure(text="")
+        self.reviews_query_current = self.reviews_query()
+        self.reviews_next_key = None
+        self.reviews_total = None
+        self.fetch_reviews(None)
+        self.queries.submit(self.reviews_query_current.count, on_success=self.set_reviews_total,
+                            tag="all_reviews_count")
+
+    def load_more_reviews(self):
+        """Fetches the next page once the list is scrolled near its end."""
+        if self.reviews_loading or self.reviews_next_key is None:
+            return
+        self.fetch_reviews(self.reviews_next_key)
+
+    def fetch_reviews(self, after):
+        def on_error(err):
+            self.reviews_loading = False
+            messagebox.showerror("Database Error", f"Error fetching reviews: {err}")
+            if after is None:
+                self.render_all_reviews(([], None))
+
+        self.reviews_loading = True
+        self.queries.submit(self.fetch_reviews_page, self.reviews_query_current, after,
+                            on_success=lambda result, first=after is None: self.render_all_reviews(result, first),
+                            on_error=on_error, tag="all_reviews")
+
+    def render_all_reviews(self, result, first=True):
+        """Shows a fetched page of reviews in the popup's virtual list."""
+        # The popup may have been closed while the query was running
+        if not (hasattr(self, 'all_reviews_popup') and self.all_reviews_popup.winfo_exists()):
             return
         
-        for review in reviews:
-            (review_id, user_id, username, place_name, rating, comment, 
-             date_created, admin_reply, admin_username) = review
-            
-            # Format the date
-            formatted_date = date_created.strftime("%B %d, %Y at %I:%M %p")
-            
-            # Create a frame for each review
-            review_frame = tk.Frame(self.scrollable_reviews_frame, bg="white", bd=1, relief="solid")
-            review_frame.pack(fill="x", pady=5, padx=5)
-            
-            # User and place information
-            user_place_label = tk.Label(
-                review_frame, 
-                text=f"{username} reviewed {place_name} on {formatted_date}", 
-                font=("Arial", 12), 
-                bg="white"
-            )
-            user_place_label.pack(anchor="w", padx=5, pady=5)
-            
-            # Star rating display
-            rating_frame = tk.Frame(review_frame, bg="white")
-            rating_frame.pack(anchor="w", padx=5, pady=5)
-            for i in range(5):
-                star = tk.Label(
-                    rating_frame, 
-                    text="★" if i < rating else "☆", 
-                    font=("Arial", 12), 
-                    fg="gold" if i < rating else "#bbb", 
-                    bg="white"
-                )
-                star.pack(side=tk.LEFT)
-            
-            # Review comment
-            comment_label = tk.Label(
-                review_frame, 
-                text=f"📝 {comment}", 
-                font=("Arial", 12), 
-                bg="white", 
-                wraplength=700,
-                justify="left"
-            )
-            comment_label.pack(anchor="w", padx=5, pady=5)
-            
-            # Admin reply if available
-            if admin_reply:
-                reply_label = tk.Label(
-                    review_frame, 
-                    text=f"🔹 {admin_username} (Admin): {admin_reply}", 
-                    font=("Arial", 12, "italic"), 
-                    fg="blue", 
-                    bg="white",
-                    wraplength=700,
-                    justify="left"
-                )
-                reply_label.pack(anchor="w", padx=5, pady=5)
-            
-            # Only show edit/delete buttons for the current user's reviews
-            if user_id == self.current_user_id:
-                buttons_frame = tk.Frame(review_frame, bg="white")
-                buttons_frame.pack(anchor="e", padx=5, pady=5)
-                
-                edit_button = tk.Button(
-                    buttons_frame, 
-                    text="Edit", 
-                    fg="#007bff", 
-                    bg="white", 
-                    bd=0, 
-                    cursor="hand2", 
-                    command=lambda rid=review_id: self.edit_review(rid)
-                )
-                edit_button.pack(side=tk.LEFT, padx=5)
-                
-                delete_button = tk.Button(
-                    buttons_frame, 
-                    text="Delete", 
-                    fg="#dc3545", 
-                    bg="white", 
-                    bd=0, 
-                    cursor="hand2", 
-                    command=lambda rid=review_id: self.delete_review(rid)
-                )
-                delete_button.pack(side=tk.LEFT, padx=5)
+        reviews, self.reviews_next_key = result
+        self.reviews_loading = False
+        if first and not reviews:
+            self.reviews_scroller.set_message("No reviews found")
+        elif first:
+            self.reviews_scroller.set_items(reviews)
+        else:
+            self.reviews_scroller.append_items(reviews)
+        self.update_reviews_count()
+
+    def set_reviews_total(self, total):
+        if hasattr(self, 'all_reviews_popup') and self.all_reviews_popup.winfo_exists():
+            self.reviews_total = total
+            self.update_reviews_count()
+
+    def update_reviews_count(self):
+        loaded = len(self.reviews_scroller.items)
+        if self.reviews_total is not None:
+            self.reviews_count_label.configure(text=f"Showing {loaded:,} of {max(self.reviews_total, loaded):,} reviews")
+
+    def build_review_row(self, parent):
+        """Creates an empty review row; the virtual scroller fills and reuses it."""
+        review_frame = tk.Frame(parent, bg="white", bd=1, relief="solid")
+        
+        # User and place information
+        review_frame.user_place_label = tk.Label(review_frame, font=("Arial", 12), bg="white")
+        review_frame.user_place_label.pack(anchor="w", padx=5, pady=5)
+        
+        # Star rating display
+        rating_frame = tk.Frame(review_frame, bg="white")
+        rating_frame.pack(anchor="w", padx=5, pady=5)
+        review_frame.stars = []
+        for i in range(5):
+            star = tk.Label(rating_frame, font=("Arial", 12), bg="white")
+            star.pack(side=tk.LEFT)
+            review_frame.stars.append(star)
+        
+        # Review comment (clipped to REVIEW_COMMENT_LINES lines)
+        review_frame.comment_label = tk.Label(
+            review_frame, 
+            font=self.review_font, 
+            bg="white", 
+            wraplength=REVIEW_WRAP_LENGTH,
+            justify="left"
+        )
+        review_frame.comment_label.pack(anchor="w", padx=5, pady=5)
+        
+        # Admin reply (shown only when there is one, clipped to REVIEW_REPLY_LINES lines)
+        review_frame.reply_label = tk.Label(
+            review_frame, 
+            font=self.review_reply_font, 
+            fg="blue", 
+            bg="white",
+            wraplength=REVIEW_WRAP_LENGTH,
+            justify="left"
+        )
+        
+        # Read more (when the text was clipped) and edit/delete (for the current user's reviews)
+        review_frame.buttons_frame = tk.Frame(review_frame, bg="white")
+        review_frame.read_more_button = tk.Button(
+            review_frame.buttons_frame, 
+            text="Read more", 
+            fg="#007bff", 
+            bg="white", 
+            bd=0, 
+            cursor="hand2"
+        )
+        review_frame.edit_button = tk.Button(
+            review_frame.buttons_frame, 
+            text="Edit", 
+            fg="#007bff", 
+            bg="white", 
+            bd=0, 
+            cursor="hand2"
+        )
+        review_frame.delete_button = tk.Button(
+            review_frame.buttons_frame, 
+            text="Delete", 
+            fg="#dc3545", 
+            bg="white", 
+            bd=0, 
+            cursor="hand2"
+        )
+        return review_frame
+
+    def update_review_row(self, review_frame, review, index):
+        """Fills a review row with one review, with edit/delete options for the user's own reviews."""
+        (review_id, user_id, username, place_name, rating, comment, 
+         date_created, admin_reply, admin_username) = review
+        
+        # Format the date
+        formatted_date = date_created.strftime("%B %d, %Y at %I:%M %p")
+        review_frame.user_place_label.configure(text=f"{username} reviewed {place_name} on {formatted_date}")
+        
+        for i, star in enumerate(review_frame.stars):
+            star.configure(text="★" if i < rating else "☆", fg="gold" if i < rating else "#bbb")
+        
+        comment_text, clipped = clip_lines(f"📝 {comment or ''}", self.review_font,
+                                           REVIEW_WRAP_LENGTH, REVIEW_COMMENT_LINES)
+        review_frame.comment_label.configure(text=comment_text)
+        
+        # Optional parts are re-packed in order for every review
+        review_frame.reply_label.pack_forget()
+        review_frame.buttons_frame.pack_forget()
+        for button in review_frame.buttons_frame.winfo_children():
+            button.pack_forget()
+        
+        # Admin reply if available
+        if admin_reply:
+            reply_text, reply_clipped = clip_lines(f"🔹 {admin_username} (Admin): {admin_reply}",
+                                                   self.review_reply_font, REVIEW_WRAP_LENGTH, REVIEW_REPLY_LINES)
+            clipped = clipped or reply_clipped
+            review_frame.reply_label.configure(text=reply_text)
+            review_frame.reply_label.pack(anchor="w", padx=5, pady=5)
+        
+        if clipped:
+            review_frame.read_more_button.configure(command=lambda r=review: self.show_full_review(r))
+            review_frame.read_more_button.pack(side=tk.LEFT, padx=5)
+        
+        # Only show edit/delete buttons for the current user's reviews
+        if user_id == self.current_user_id:
+            review_frame.edit_button.configure(command=lambda rid=review_id: self.edit_review(rid))
+            review_frame.delete_button.configure(command=lambda rid=review_id: self.delete_review(rid))
+            review_frame.edit_button.pack(side=tk.LEFT, padx=5)
+            review_frame.delete_button.pack(side=tk.LEFT, padx=5)
+        
+        if clipped or user_id == self.current_user_id:
+            review_frame.buttons_frame.pack(anchor="e", padx=5, pady=5)
+
+    def show_full_review(self, review):
+        """Opens a window with the whole comment and admin reply of a review."""
+        (review_id, user_id, username, place_name, rating, comment, 
+         date_created, admin_reply, admin_username) = review
+        popup = Toplevel(self.all_reviews_popup)
+        popup.title(f"{username}'s review of {place_name}")
+        popup.geometry("600x400")
+        
+        text = scrolledtext.ScrolledText(popup, wrap=tk.WORD, font=self.review_font)
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        text.insert(tk.END, f"{'★' * rating}{'☆' * (5 - rating)}\n\n📝 {comment or ''}\n")
+        if admin_reply:
+            text.insert(tk.END, f"\n🔹 {admin_username} (Admin): {admin_reply}\n")
+        text.configure(state=tk.DISABLED)
+        
+        ttk.Button(popup, text="Close", command=popup.destroy).pack(pady=(0, 10))
 
     def edit_review(self, review_id):
         """Handles the editing of a review after verifying ownership."""
         try:
             # First verify that the review belongs to the current user
-            cursor.execute("SELECT user_id FROM reviews WHERE id = %s", (review_id,))
-            result = cursor.fetchone()
+            result = database.fetch_one("SELECT user_id FROM reviews WHERE id = %s", (review_id,))
             
             if not result:
                 messagebox.showerror("Error", "Review not found.")
@@ -1448,17 +1657,15 @@ class UserDashboard:
                 return
                 
             # If ownership is verified, proceed with editing
-            cursor.execute("SELECT place_id, comment, rating FROM reviews WHERE id = %s", (review_id,))
-            review = cursor.fetchone()
+            review = database.fetch_one("SELECT place_id, comment, rating FROM reviews WHERE id = %s", (review_id,))
             
             if review:
                 place_id, comment, rating = review
-                cursor.execute("SELECT name FROM places WHERE id = %s", (place_id,))
-                place_name = cursor.fetchone()[0]
+                place_name = database.fetch_one("SELECT name FROM places WHERE id = %s", (place_id,))[0]
                 
                 # Update UI
                 self.selected_place_id = place_id
-                self.search_var.set(place_name)
+                self.review_search_var.set(place_name)
                 self.comment_box.delete("1.0", tk.END)
                 self.comment_box.insert("1.0", comment)
                 self.set_rating(rating)
@@ -1480,8 +1687,7 @@ class UserDashboard:
         """Updates the existing review in the database after verifying ownership."""
         # Verify ownership again before updating
         try:
-            cursor.execute("SELECT user_id FROM reviews WHERE id = %s", (review_id,))
-            result = cursor.fetchone()
+            result = database.fetch_one("SELECT user_id FROM reviews WHERE id = %s", (review_id,))
             
             if not result or result[0] != self.current_user_id:
                 messagebox.showerror("Permission Denied", "You can only update your own reviews.")
@@ -1493,19 +1699,14 @@ class UserDashboard:
                 return
             
             if messagebox.askyesno("Confirm Update", "Are you sure you want to update this review?"):
-                cursor.execute("""
-                    UPDATE reviews 
-                    SET comment = %s, rating = %s, date_modified = NOW() 
-                    WHERE id = %s
-                """, (comment, self.rating, review_id))
-                db.commit()
+                ratings.update_review(review_id, comment, self.rating)
                 messagebox.showinfo("Success", "Review updated successfully!")
                 self.comment_box.delete("1.0", tk.END)
                 self.rating = 0
                 self.set_rating(0)
                 self.submit_button.config(text="Submit", command=self.submit_review)
                 self.selected_place_id = None
-                self.search_var.set("")
+                self.review_search_var.set("")
                 self.rating_label.config(text="Select a rating")
         except mysql.connector.Error as err:
             messagebox.showerror("Database Error", f"Error updating review: {err}")
@@ -1514,16 +1715,15 @@ class UserDashboard:
         """Deletes a review from the database after verifying ownership."""
         # Verify ownership before deleting
         try:
-            cursor.execute("SELECT user_id FROM reviews WHERE id = %s", (review_id,))
-            result = cursor.fetchone()
+            result = database.fetch_one("SELECT user_id FROM reviews WHERE id = %s", (review_id,))
             
             if not result or result[0] != self.current_user_id:
                 messagebox.showerror("Permission Denied", "You can only delete your own reviews.")
                 return
                 
             if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this review?"):
-                cursor.execute("DELETE FROM reviews WHERE id = %s", (review_id,))
-                db.commit()
+                ratings.delete_review(review_id)
+                invalidate_counts("reviews")
                 messagebox.showinfo("Success", "Review deleted successfully!")
                 self.load_all_reviews()  # Refresh the reviews list
         except mysql.connector.Error as err:
@@ -1545,8 +1745,8 @@ class UserDashboard:
         search_frame = ttk.Frame(left_content)
         search_frame.pack(fill=tk.X, pady=10)
         
-        self.search_var = tk.StringVar()
-        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
+        self.event_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.event_search_var, width=40)
         search_entry.pack(side=tk.LEFT, padx=(0, 5))
         
         search_button = ttk.Button(search_frame, text="Search", style="CustomBlue.TButton", 
@@ -1554,13 +1754,18 @@ class UserDashboard:
         search_button.pack(side=tk.LEFT)
         
         # Add binding for Enter key
-        search_entry.bind("<Return>", lambda e: self.search_events())
+        SuggestionBox(search_entry, self.event_search_var,
+                      lambda text: autocomplete.get_index().suggest(text, (autocomplete.EVENT, autocomplete.LOCATION)),
+                      on_select=lambda text: self.search_events())
+        search_entry.bind("<Return>", lambda e: self.search_events(), add="+")
         
         # Category Filters
         category_frame = ttk.Frame(left_content)
         category_frame.pack(fill=tk.X, pady=10)
 
         self.current_category = "all"  # Track current category filter
+        # Last filter applied to the grid (search/category or sidebar); a refresh reapplies it
+        self.event_filter = None
 
         # Style for the category links
         link_font = font.Font(family="Arial", size=10, underline=False)
@@ -1612,9 +1817,16 @@ class UserDashboard:
         self.main_event_container = ttk.Frame(left_content)
         self.main_event_container.pack(fill=tk.BOTH, expand=True)
         
+        # Event grid view: virtualized, only the cards in view are built
+        self.event_grid = VirtualScroller(self.main_event_container, EVENT_CARD_HEIGHT,
+                                          self.build_event_card, self.update_event_card, columns=3)
+        
+        # The detail view scrolls on its own canvas
+        self.detail_container = ttk.Frame(self.main_event_container)
+        
         # Create a canvas and scrollbar for the main content
-        self.main_canvas = tk.Canvas(self.main_event_container, borderwidth=0, highlightthickness=0)
-        self.main_scrollbar = ttk.Scrollbar(self.main_event_container, orient="vertical", command=self.main_canvas.yview)
+        self.main_canvas = tk.Canvas(self.detail_container, borderwidth=0, highlightthickness=0)
+        self.main_scrollbar = ttk.Scrollbar(self.detail_container, orient="vertical", command=self.main_canvas.yview)
         self.main_canvas.configure(yscrollcommand=self.main_scrollbar.set)
         
         # Pack the scrollbar and canvas
@@ -1633,16 +1845,6 @@ class UserDashboard:
         self.main_canvas.bind("<Enter>", self.bind_mousewheel)
         self.main_canvas.bind("<Leave>", self.unbind_mousewheel)
         
-        # No results message (hidden initially)
-        self.no_results_frame = ttk.Frame(self.main_content_frame)
-        no_results_label = ttk.Label(self.no_results_frame, 
-                                    text="No events found matching your search criteria.\nTry adjusting your search terms or filters.",
-                                    font=("Arial", 12))
-        no_results_label.pack(pady=20)
-        
-        # Event grid view (inside main_content_frame)
-        self.event_grid = ttk.Frame(self.main_content_frame)
-        
         # Event detail view (inside main_content_frame)
         self.event_detail_frame = ttk.Frame(self.main_content_frame)
         
@@ -1703,10 +1905,6 @@ class UserDashboard:
         
         # Display the event grid by default
         self.show_event_grid()
-        
-        # Update the canvas scroll region
-        self.main_content_frame.update_idletasks()
-        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
 
     def category_link_click(self, category):
         """Handle category link clicks."""
@@ -1770,14 +1968,21 @@ class UserDashboard:
                                       state="readonly", width=15)
         event_type_combo.pack(fill=tk.X, padx=10, pady=5)
         
+        # Filter dropdowns by facet: (combobox, variable, [(option, facet value)])
+        self.facet_filters = {
+            "category": (event_type_combo, self.event_type_var,
+                         [(name, name.lower()) for name in ["Festival", "Concert", "Exhibition", "Sports", "Conference", "Workshop"]]),
+        }
+        
         # Location filter
         ttk.Label(self.sidebar_content, text="Location:", style="RightSidebar.TLabel").pack(anchor="w", padx=10, pady=(5, 0))
         self.location_var = tk.StringVar(value="All")
         location_combo = ttk.Combobox(self.sidebar_content, textvariable=self.location_var,
-                                    values=["All", "General Santos City", "South Cotabato", "Koronadal City", 
-                                           "Sarangani Province", "Cotabato Province", "Sultan Kudarat"],
+                                    values=["All"] + EVENT_LOCATIONS,
                                     state="readonly", width=15)
         location_combo.pack(fill=tk.X, padx=10, pady=5)
+        self.facet_filters["location"] = (location_combo, self.location_var,
+                                          [(name, name.lower()) for name in EVENT_LOCATIONS])
         
         # Entry Fee filter
         ttk.Label(self.sidebar_content, text="Entry Fee:", style="RightSidebar.TLabel").pack(anchor="w", padx=10, pady=(5, 0))
@@ -1786,6 +1991,7 @@ class UserDashboard:
                                values=["All", "Free", "Paid"],
                                state="readonly", width=15)
         fee_combo.pack(fill=tk.X, padx=10, pady=5)
+        self.facet_filters["fee"] = (fee_combo, self.fee_var, [("Free", "free"), ("Paid", "paid")])
         
         # Date filter section
         ttk.Label(self.sidebar_content, text="Filter by Date", font=("Arial", 14, "bold"), 
@@ -1795,10 +2001,11 @@ class UserDashboard:
         ttk.Label(self.sidebar_content, text="Month:", style="RightSidebar.TLabel").pack(anchor="w", padx=10, pady=(5, 0))
         self.month_var = tk.StringVar(value="All")
         month_combo = ttk.Combobox(self.sidebar_content, textvariable=self.month_var, 
-                                  values=["All", "January", "February", "March", "April", "May", "June", 
-                                          "July", "August", "September", "October", "November", "December"],
+                                  values=["All"] + MONTH_NAMES,
                                   state="readonly", width=15)
         month_combo.pack(fill=tk.X, padx=10, pady=5)
+        self.facet_filters["month"] = (month_combo, self.month_var,
+                                       [(name, number) for number, name in enumerate(MONTH_NAMES, 1)])
         
         # Year filter
         ttk.Label(self.sidebar_content, text="Year:", style="RightSidebar.TLabel").pack(anchor="w", padx=10, pady=(5, 0))
@@ -1808,6 +2015,12 @@ class UserDashboard:
                                   values=["All", str(current_year), str(current_year+1)],
                                   state="readonly", width=15)
         year_combo.pack(fill=tk.X, padx=10, pady=5)
+        self.facet_filters["year"] = (year_combo, self.year_var,
+                                      [(str(year), year) for year in (current_year, current_year + 1)])
+        
+        # Show how many events each option would leave as the selection changes
+        for combo, _, _ in self.facet_filters.values():
+            combo.bind("<<ComboboxSelected>>", lambda e: self.update_facet_counts())
         
         # Add Apply and Clear buttons
         buttons_frame = ttk.Frame(self.sidebar_content, style="RightSidebar.TFrame")
@@ -1851,185 +2064,175 @@ class UserDashboard:
         self.sidebar_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
     def fetch_events(self):
-        """Fetch events from the database."""
-        if not db or not cursor:
-            messagebox.showerror("Database Error", "Failed to connect to the database.")
-            return
-
-        try:
-            # Query to get all events that haven't been soft deleted
-            query = """
-            SELECT id, name, description, category, location, date, time, image, is_free
-            FROM events
-            WHERE status = 'approved' AND date_deleted IS NULL
-            ORDER BY date ASC
-            """
-            cursor.execute(query)
-            result = cursor.fetchall()
-            
-            # Convert tuple results to dictionaries for easier access
-            self.events = []
-            for row in result:
-                self.events.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'description': row[2],
-                    'category': row[3],
-                    'location': row[4],
-                    'date': row[5],
-                    'time': row[6],
-                    'image': row[7],
-                    'is_free': bool(row[8]) if row[8] is not None else True
-                })
-                
+        """Fetch events from the database in the background and render them when they arrive."""
+        # Query to get all events that haven't been soft deleted
+        query = """
+        SELECT id, name, description, category, location, date, time, image, is_free
+        FROM events
+        WHERE status = 'approved' AND date_deleted IS NULL
+        ORDER BY date ASC
+        """
+        self.events = []
+        self.events_by_id = {}
+        self.event_index = EventIndex([])
+        self.filtered_events = []
+        # Events whose card was shown since the page loaded (each counts as one view)
+        self.viewed_event_ids = set()
+        self.show_events_loading()
+        self.queries.fetch_all(query, on_success=self.on_events_loaded,
+                               on_error=self.on_events_error, tag="events")
+
+    def show_events_loading(self):
+        """Show a loading placeholder in the event grid while events are fetched."""
+        self.event_grid.set_message("Loading events...")
+
+    def on_events_loaded(self, result):
+        """Render events once the background query finishes."""
+        # Convert tuple results to dictionaries for easier access
+        self.events = []
+        for row in result:
+            self.events.append({
+                'id': row[0],
+                'name': row[1],
+                'description': row[2],
+                'category': row[3],
+                'location': row[4],
+                'date': row[5],
+                'time': row[6],
+                'image': row[7],
+                'is_free': bool(row[8]) if row[8] is not None else True
+            })
+        self.events_by_id = {event['id']: event for event in self.events}
+        # Word and facet bitsets for filtering without passes over the list
+        self.event_index = EventIndex(self.events, EVENT_LOCATIONS)
+            
+        self.update_facet_counts()
+        
+        # A refresh of the cached page keeps the search and filters the controls show
+        if self.event_filter is not None:
+            self.event_filter()
+        else:
             self.filtered_events = self.events.copy()  # Initial filtered events is all events
-            
-            # Update the event grid
             self.update_event_grid()
-            
-            # Add popular events to sidebar
-            self.update_popular_events()
-            
-        except Error as e:
-            logging.error(f"Error fetching events: {e}")
-            messagebox.showerror("Database Error", f"Failed to fetch events: {e}")
+        
+        # Add popular events to sidebar
+        self.update_popular_events()
+
+    def on_events_error(self, e):
+        logging.error(f"Error fetching events: {e}")
+        messagebox.showerror("Database Error", f"Failed to fetch events: {e}")
 
-    def create_event_card(self, event, index):
-        """Create an event card widget."""
+    def build_event_card(self, parent):
+        """Create an empty event card; the virtual scroller fills and reuses it."""
         # Card frame with white background and border
-        card = ttk.Frame(self.event_grid, relief="solid", borderwidth=1)
+        card = ttk.Frame(parent, relief="solid", borderwidth=1)
         
         # Image
         img_frame = ttk.Frame(card)
         img_frame.pack(fill=tk.X)
-        
-        # Default image path
-        DEFAULT_IMAGE = "assets/no_image.jpg"
-        
-        # Try to load the image
-        try:
-            img_path = event['image'] if event['image'] else DEFAULT_IMAGE
-            if os.path.exists(img_path):
-                img = Image.open(img_path)
-                img = img.resize((250, 180), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                img_label = ttk.Label(img_frame)
-                img_label.image = photo  # Keep a reference to prevent garbage collection
-                img_label.configure(image=photo)
-                img_label.pack(fill=tk.X)
-            else:
-                ttk.Label(img_frame, text="Image not available", font=("Arial", 10, "italic")).pack(fill=tk.X, pady=80)
-        except Exception as e:
-            logging.error(f"Error loading image for event {event['id']}: {e}")
-            ttk.Label(img_frame, text="Image not available", font=("Arial", 10, "italic")).pack(fill=tk.X, pady=80)
+        card.img_label = ttk.Label(img_frame, font=("Arial", 10, "italic"), anchor="center")
+        card.img_label.pack(fill=tk.X)
         
         # Event info
         info_frame = ttk.Frame(card, padding=10)
         info_frame.pack(fill=tk.X)
         
-        ttk.Label(info_frame, text=event['name'], font=("Arial", 12, "bold")).pack(anchor="w")
-        ttk.Label(info_frame, text=event['location'], foreground="#666").pack(anchor="w")
+        card.name_label = ttk.Label(info_frame, font=("Arial", 12, "bold"))
+        card.name_label.pack(anchor="w")
+        card.location_label = ttk.Label(info_frame, foreground="#666")
+        card.location_label.pack(anchor="w")
+        card.date_label = ttk.Label(info_frame, foreground="#f44336")
+        card.date_label.pack(anchor="w")
+        
+        # Category badge
+        card.category_frame = ttk.Frame(info_frame)
+        card.category_frame.pack(anchor="w", pady=2)
+        card.category_label = ttk.Label(card.category_frame)
+        card.category_label.pack(pady=2, padx=5)
+        
+        # Fee label with green background for free events
+        card.fee_frame = ttk.Frame(info_frame)
+        card.fee_frame.pack(anchor="w", pady=2)
+        card.fee_label = ttk.Label(card.fee_frame)
+        card.fee_label.pack(pady=2, padx=5)
+        
+        # View details button
+        card.view_btn = ttk.Button(info_frame, text="View Details", style="CustomBlue.TButton")
+        card.view_btn.pack(fill=tk.X, pady=5)
+        
+        return card
+
+    def update_event_card(self, card, event, index):
+        """Fill an event card with the data of one event."""
+        # Default image path
+        DEFAULT_IMAGE = "assets/no_image.jpg"
+        
+        # Load the image in the background; the card shows a placeholder until it arrives
+        img_path = event['image'] if event['image'] else DEFAULT_IMAGE
+        if os.path.exists(img_path):
+            self.image_loader.load_into(card.img_label, img_path, thumbnails.EVENT_CARD_SIZE,
+                                        on_error=self.show_image_unavailable)
+        else:
+            card.img_label.image_key = None
+            self.show_image_unavailable(card.img_label)
+        
+        card.name_label.configure(text=event['name'])
+        card.location_label.configure(text=event['location'])
         
         # Format date
+        date_str = ""
         if event['date']:
             try:
                 date_obj = event['date']
                 date_str = date_obj.strftime("%B %d, %Y")
             except:
                 date_str = str(event['date'])
-            ttk.Label(info_frame, text=date_str, foreground="#f44336").pack(anchor="w")
+        card.date_label.configure(text=date_str)
         
         # Category badge
         if event.get('category'):
-            category_frame = ttk.Frame(info_frame)
-            category_frame.pack(anchor="w", pady=2)
-            
-            # Create custom style for category label
-            category_style = f"Category{index}.TLabel"
-            self.style.configure(category_style, background="#1e88e5", foreground="white")
-            
-            category_label = ttk.Label(category_frame, text=event['category'].title(), 
-                                      style=category_style)
-            category_label.pack(pady=2, padx=5)
-        
-        # Fee label with green background for free events
-        fee_frame = ttk.Frame(info_frame)
-        fee_frame.pack(anchor="w", pady=2)
-        
-        # Create custom style for fee label
-        fee_style = f"Fee{index}.TLabel"
-        fee_color = "#4caf50" if event.get('is_free', True) else "#f44336"
-        self.style.configure(fee_style, background=fee_color, foreground="white")
+            card.category_label.configure(text=event['category'].title(), style=card_styles.CATEGORY_STYLE)
+            card.category_frame.pack(anchor="w", pady=2, before=card.fee_frame)
+        else:
+            card.category_frame.pack_forget()
         
+        # Fee badge: green for free events, red for paid ones
         fee_text = "Free" if event.get('is_free', True) else "Paid"
-        fee_label = ttk.Label(fee_frame, text=fee_text, style=fee_style)
-        fee_label.pack(pady=2, padx=5)
-        
-        # View details button
-        view_btn = ttk.Button(
-            info_frame, 
-            text="View Details", 
-            style="CustomBlue.TButton",
-            command=lambda idx=index: self.view_event_details(idx)
-        )
-        view_btn.pack(fill=tk.X, pady=5)
+        card.fee_label.configure(text=fee_text, style=card_styles.fee_style(event.get('is_free', True)))
         
-        return card
+        card.view_btn.configure(command=lambda idx=index: self.view_event_details(idx))
+
+        # Count a view the first time the card is shown on this page
+        if event['id'] not in self.viewed_event_ids:
+            self.viewed_event_ids.add(event['id'])
+            popularity.record(event['id'], popularity.VIEW)
+
+    def show_image_unavailable(self, label, error=None):
+        """Replace an event card image with a text notice."""
+        label.image = None
+        label.configure(image="", text="Image not available")
 
     def update_event_grid(self):
         """Update the event grid with current filtered events."""
-        # Clear existing widgets
-        for widget in self.event_grid.winfo_children():
-            widget.destroy()
-        
-        # Hide no results message if it's showing
-        self.no_results_frame.pack_forget()
-        
-        # Show event grid if we have events
         if len(self.filtered_events) > 0:
-            # Create 3 columns
-            cols = 3
-            for i, event in enumerate(self.filtered_events):
-                row = i // cols
-                col = i % cols
-                
-                card = self.create_event_card(event, i)
-                card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-                
-                # Configure row and column weights for even spacing
-                self.event_grid.grid_rowconfigure(row, weight=1)
-                self.event_grid.grid_columnconfigure(col, weight=1)
+            self.event_grid.set_items(self.filtered_events)
         else:
             # Show "no results" message if we have no events
-            self.no_results_frame.pack(fill=tk.BOTH, expand=True)
-            
-        # Update the canvas scroll region
-        self.main_content_frame.update_idletasks()
-        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
+            self.event_grid.set_message("No events found matching your search criteria.\nTry adjusting your search terms or filters.")
 
     def search_events(self):
         """Search events based on search query."""
-        query = self.search_var.get().lower().strip()
-        
-        if query:
-            self.filtered_events = [
-                event for event in self.events 
-                if query in event['name'].lower() 
-                or query in event['description'].lower() 
-                or query in event['location'].lower()
-            ]
-        else:
+        self.event_filter = self.search_events
+        query = self.event_search_var.get().strip()
+        
+        if not query:
             # If search query is empty, apply category filter only
             self.filter_by_category(self.current_category)
             return
-            
-        # Apply category filter to search results if category isn't "all"
-        if self.current_category != "all":
-            self.filtered_events = [
-                event for event in self.filtered_events 
-                if event['category'].lower() == self.current_category
-            ]
+        
+        # Every word must start a word of the event (as in the full-text search), within the category
+        selection = {} if self.current_category == "all" else {"category": self.current_category}
+        self.filtered_events = self.event_index.select(self.event_index.filter_mask(selection, query))
             
         # Update grid with filtered results
         self.update_event_grid()
@@ -2037,79 +2240,50 @@ class UserDashboard:
     def filter_by_category(self, category):
         """Filter events by category."""
         self.current_category = category
+        self.event_filter = self.search_events
+        
+        # Also apply search query if there is any
+        if self.event_search_var.get().strip():
+            self.search_events()
+            return
         
         if category == "all":
             self.filtered_events = self.events.copy()
         else:
-            self.filtered_events = [
-                event for event in self.events 
-                if event['category'] and event['category'].lower() == category
-            ]
-            
-        # Also apply search query if there is any
-        query = self.search_var.get().lower().strip()
-        if query:
-            self.filtered_events = [
-                event for event in self.filtered_events 
-                if query in event['name'].lower() 
-                or query in event['description'].lower() 
-                or query in event['location'].lower()
-            ]
+            self.filtered_events = self.event_index.select(self.event_index.facet_mask("category", category))
             
         # Update grid with filtered results
         self.update_event_grid()
+
+    def facet_selection(self):
+        """The sidebar filter values as {facet: value} (facets left at "All" are omitted)."""
+        selection = {}
+        for facet, (_, var, options) in self.facet_filters.items():
+            # Options carry their event count, e.g. "Concert (4)"
+            chosen = var.get().rsplit(" (", 1)[0]
+            for option, value in options:
+                if option == chosen:
+                    selection[facet] = value
+        return selection
+
+    def update_facet_counts(self):
+        """Show next to every sidebar option how many events it would leave."""
+        if not self.facet_filters["category"][0].winfo_exists():
+            return
+        counts = self.event_index.facet_counts(self.facet_selection())
+        for facet, (combo, var, options) in self.facet_filters.items():
+            labels = {option: f"{option} ({counts[facet].get(value, 0)})" for option, value in options}
+            combo.configure(values=["All"] + list(labels.values()))
+            chosen = var.get().rsplit(" (", 1)[0]
+            if chosen in labels:
+                var.set(labels[chosen])
         
     def apply_all_filters(self):
         """Apply all filters from the sidebar."""
-        # Start with all events
-        self.filtered_events = self.events.copy()
-        
-        # Apply event type filter
-        event_type = self.event_type_var.get()
-        if event_type != "All":
-            self.filtered_events = [
-                event for event in self.filtered_events
-                if event['category'] and event['category'].lower() == event_type.lower()
-            ]
-            
-        # Apply location filter
-        location = self.location_var.get()
-        if location != "All":
-            self.filtered_events = [
-                event for event in self.filtered_events
-                if event['location'] and location in event['location']
-            ]
-            
-        # Apply fee filter
-        fee_filter = self.fee_var.get()
-        if fee_filter != "All":
-            is_free = (fee_filter == "Free")
-            self.filtered_events = [
-                event for event in self.filtered_events
-                if event.get('is_free', True) == is_free
-            ]
-            
-        # Apply month filter
-        month = self.month_var.get()
-        if month != "All":
-            # Get month number (1-12) from month name
-            month_names = ["January", "February", "March", "April", "May", "June", 
-                          "July", "August", "September", "October", "November", "December"]
-            month_num = month_names.index(month) + 1
-            
-            self.filtered_events = [
-                event for event in self.filtered_events
-                if event['date'] and event['date'].month == month_num
-            ]
-            
-        # Apply year filter
-        year = self.year_var.get()
-        if year != "All":
-            year_num = int(year)
-            self.filtered_events = [
-                event for event in self.filtered_events
-                if event['date'] and event['date'].year == year_num
-            ]
+        self.event_filter = self.apply_all_filters
+        # Intersect the bitsets of the selected facet values
+        mask = self.event_index.filter_mask(self.facet_selection())
+        self.filtered_events = self.event_index.select(mask)
             
         # Update grid with filtered results
         self.update_event_grid()
@@ -2121,8 +2295,9 @@ class UserDashboard:
         self.fee_var.set("All")
         self.month_var.set("All")
         self.year_var.set("All")
-        self.search_var.set("")
+        self.event_search_var.set("")
         self.current_category = "all"
+        self.event_filter = None
         
         # Reset all category links to default state
         for cat, lbl in self.category_labels.items():
@@ -2130,16 +2305,30 @@ class UserDashboard:
         
         # Reset to all events
         self.filtered_events = self.events.copy()
+        self.update_facet_counts()
         self.update_event_grid()
         
     def update_popular_events(self):
-        """Update the popular events section in the sidebar."""
+        """Fetch the most popular events (from the precomputed ranking) for the sidebar."""
+        self.queries.submit(popularity.top_events, POPULAR_EVENTS_COUNT,
+                            on_success=self.show_popular_events,
+                            on_error=lambda e: logging.error(f"Error ranking popular events: {e}"),
+                            tag="popular_events")
+
+    def show_popular_events(self, event_ids):
+        """Show the ranked events in the sidebar, topped up with the next events by date."""
+        if not self.popular_events_frame.winfo_exists():
+            return
         # Clear existing popular events
         for widget in self.popular_events_frame.winfo_children():
             widget.destroy()
-            
-        # Get top 3 events (for demo purposes, we'll just use the first 3)
-        top_events = self.events[:3] if len(self.events) >= 3 else self.events
+
+        top_events = [self.events_by_id[event_id] for event_id in event_ids if event_id in self.events_by_id]
+        for event in self.events[:POPULAR_EVENTS_COUNT]:
+            if len(top_events) >= POPULAR_EVENTS_COUNT:
+                break
+            if event not in top_events:
+                top_events.append(event)
         
         for event in top_events:
             # Create a mini event card
@@ -2150,7 +2339,7 @@ class UserDashboard:
             name_btn = ttk.Label(card, text=event['name'], font=("Arial", 10, "bold"), 
                                style="LightBlue.TLabel", cursor="hand2")
             name_btn.pack(anchor="w")
-            name_btn.bind("<Button-1>", lambda e, idx=self.events.index(event): self.view_event_details(idx))
+            name_btn.bind("<Button-1>", lambda e, event_id=event['id']: self.view_event_by_id(event_id))
             
             # Event date
             if event['date']:
@@ -2162,38 +2351,39 @@ class UserDashboard:
                 date_label = ttk.Label(card, text=date_str, style="RightSidebar.TLabel")
                 date_label.pack(anchor="w")
     
+    def view_event_by_id(self, event_id):
+        """Show the details of an event, clearing the filters if they hide it."""
+        event = self.events_by_id.get(event_id)
+        if event is None:
+            return
+        if event not in self.filtered_events:
+            self.clear_all_filters()
+        self.view_event_details(self.filtered_events.index(event))
+
     def view_event_details(self, index):
         """Show detailed view of an event."""
-        # Hide the grid view and no results frame
-        self.event_grid.pack_forget()
-        self.no_results_frame.pack_forget()
+        # Hide the grid view
+        self.event_grid.frame.pack_forget()
         
         # Store current event index for navigation
         self.current_event_index = index
         
         # Show the detail view
+        self.detail_container.pack(fill=tk.BOTH, expand=True)
         self.event_detail_frame.pack(fill=tk.BOTH, expand=True)
         
         # Get the current event
         event = self.filtered_events[index]
+        popularity.record(event['id'], popularity.DETAIL_OPEN)
         
         # Display event image
         DEFAULT_IMAGE = "assets/no_image.jpg"
-        try:
-            img_path = event['image'] if event['image'] else DEFAULT_IMAGE
-            if os.path.exists(img_path):
-                img = Image.open(img_path)
-                img = img.resize((600, 350), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                
-                self.detail_image_label.image = photo  # Keep a reference
-                self.detail_image_label.configure(image=photo)
-            else:
-                # Clear image if not available
-                self.detail_image_label.image = None
-                self.detail_image_label.configure(image="")
-        except Exception as e:
-            logging.error(f"Error loading image for event details: {e}")
+        img_path = event['image'] if event['image'] else DEFAULT_IMAGE
+        if os.path.exists(img_path):
+            self.image_loader.load_into(self.detail_image_label, img_path, thumbnails.EVENT_DETAIL_SIZE)
+        else:
+            # Clear image if not available
+            self.detail_image_label.image_key = None
             self.detail_image_label.image = None
             self.detail_image_label.configure(image="")
             
@@ -2230,13 +2420,10 @@ class UserDashboard:
         """Show the event grid view."""
         # Hide the detail view
         self.event_detail_frame.pack_forget()
+        self.detail_container.pack_forget()
         
         # Show the grid view
-        self.event_grid.pack(fill=tk.BOTH, expand=True)
-        
-        # Update scroll region
-        self.main_content_frame.update_idletasks()
-        self.main_canvas.configure(scrollregion=self.main_canvas.bbox("all"))
+        self.event_grid.frame.pack(fill=tk.BOTH, expand=True)
             
     def show_prev_event(self):
         """Show the previous event in the list."""
@@ -2532,69 +2719,52 @@ class UserDashboard:
             return
         
         # Save to database 
-        if db and cursor:
-            try:
-                # Get current user ID
-                user_id = self.current_user_id
-                
-                # Insert into database with 'pending' status
-                sql = """
-                INSERT INTO events (
-                    user_id, name, description, location, 
-                    date, time, category, is_free, image, status
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, 'pending')
-                """
-                
-                # Format date for MySQL
-                mysql_date = f"{year}-{month}-{day}"
-                
-                # Convert time to 24-hour format for MySQL
-                if ampm == "PM" and hour != "12":
-                    hour_24 = str(int(hour) + 12)
-                elif ampm == "AM" and hour == "12":
-                    hour_24 = "00"
-                else:
-                    hour_24 = hour
-                
-                mysql_time = f"{hour_24}:{minute}:00"
-                
-                cursor.execute(sql, (
-                    user_id, name, description, location, 
-                    mysql_date, mysql_time, category, is_free, 
-                    file_path if file_path else ""
-                ))
-                
-                db.commit()
-                
-                # Show confirmation message
-                messagebox.showinfo("Success", 
-                    f"Event '{name}' has been submitted for approval.\n\n"
-                    f"Date: {date_str}\nTime: {time_str}\nLocation: {location}\n"
-                    f"Category: {category}\nEntry Fee: {'Free' if is_free else 'Paid'}"
-                )
-                
-                # Clear form fields
-                name_entry.delete(0, tk.END)
-                location_entry.delete(0, tk.END)
-                description_text.delete("1.0", tk.END)
-                category_combo.set("")
-                
-            except Error as e:
-                db.rollback()
-                messagebox.showerror("Database Error", f"Could not save event: {e}")
-        else:
-            # If no database connection, just show a success message
+        try:
+            # Get current user ID
+            user_id = self.current_user_id
+            
+            # Insert into database with 'pending' status
+            sql = """
+            INSERT INTO events (
+                user_id, name, description, location, 
+                date, time, category, is_free, image, status
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, 'pending')
+            """
+            
+            # Format date for MySQL
+            mysql_date = f"{year}-{month}-{day}"
+            
+            # Convert time to 24-hour format for MySQL
+            if ampm == "PM" and hour != "12":
+                hour_24 = str(int(hour) + 12)
+            elif ampm == "AM" and hour == "12":
+                hour_24 = "00"
+            else:
+                hour_24 = hour
+            
+            mysql_time = f"{hour_24}:{minute}:00"
+            
+            database.execute(sql, (
+                user_id, name, description, location, 
+                mysql_date, mysql_time, category, is_free, 
+                file_path if file_path else ""
+            ))
+            
+            # Show confirmation message
             messagebox.showinfo("Success", 
                 f"Event '{name}' has been submitted for approval.\n\n"
                 f"Date: {date_str}\nTime: {time_str}\nLocation: {location}\n"
                 f"Category: {category}\nEntry Fee: {'Free' if is_free else 'Paid'}"
             )
             
-            # Clear form fields anyway
+            # Clear form fields
             name_entry.delete(0, tk.END)
             location_entry.delete(0, tk.END)
             description_text.delete("1.0", tk.END)
             category_combo.set("")
+            
+        except Error as e:
+            messagebox.showerror("Database Error", f"Could not save event: {e}")
 
     def submit_place_form(self, name_entry, location_entry, description_text, category_combo, file_path=None):
         """Process the place submission."""
@@ -2610,55 +2780,38 @@ class UserDashboard:
             return
         
         # Save to database
-        if db and cursor:
-            try:
-                # First get the current user ID
-                user_id = self.current_user_id
-                
-                # Save the place to the database
-                sql = """
-                INSERT INTO places (
-                    user_id, name, description, location, 
-                    category, image, status
-                ) VALUES (%s, %s, %s, %s, %s, %s, 'pending')
-                """
-                
-                # Execute the query with parameters
-                cursor.execute(sql, (
-                    user_id, name, description, location, 
-                    category, file_path if file_path else ""
-                ))
-                
-                # Commit the transaction
-                db.commit()
-                
-                messagebox.showinfo("Success", 
-                    f"Place '{name}' has been submitted for approval.\n\n"
-                    f"Location: {location}\nCategory: {category}"
-                )
-                
-                # Clear form fields
-                name_entry.delete(0, tk.END)
-                location_entry.delete(0, tk.END)
-                description_text.delete("1.0", tk.END)
-                category_combo.set("")
-                
-            except Error as e:
-                db.rollback()
-                messagebox.showerror("Database Error", f"Could not save place: {e}")
-        else:
-            # If no database connection, just show a success message
+        try:
+            # First get the current user ID
+            user_id = self.current_user_id
+            
+            # Save the place to the database
+            sql = """
+            INSERT INTO places (
+                user_id, name, description, location, 
+                category, image, status
+            ) VALUES (%s, %s, %s, %s, %s, %s, 'pending')
+            """
+            
+            # Execute the query with parameters (commits on success)
+            database.execute(sql, (
+                user_id, name, description, location, 
+                category, file_path if file_path else ""
+            ))
+            
             messagebox.showinfo("Success", 
                 f"Place '{name}' has been submitted for approval.\n\n"
                 f"Location: {location}\nCategory: {category}"
             )
             
-            # Clear form fields anyway
+            # Clear form fields
             name_entry.delete(0, tk.END)
             location_entry.delete(0, tk.END)
             description_text.delete("1.0", tk.END)
             category_combo.set("")
             
+        except Error as e:
+            messagebox.showerror("Database Error", f"Could not save place: {e}")
+            
     def account_page(self):
         """Displays the user account settings page."""
         # Create scrollable container
@@ -2692,20 +2845,15 @@ class UserDashboard:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Get user data
-        if db and cursor:
-            try:
-                cursor.execute("SELECT username, email, phone, profile_picture_path, address, status FROM user_accounts WHERE id = %s", (self.current_user_id,))
-                user_data = cursor.fetchone()
-                if not user_data:
-                    ttk.Label(scrollable_frame, text="User data not found!", font=("Arial", 12)).pack(pady=10)
-                    return
-                
-                username, email, phone, profile_pic, address, status = user_data
-            except mysql.connector.Error as err:
-                ttk.Label(scrollable_frame, text=f"Error fetching user data: {err}", font=("Arial", 12)).pack(pady=10)
+        try:
+            user_data = database.fetch_one("SELECT username, email, phone, profile_picture_path, address, status FROM user_accounts WHERE id = %s", (self.current_user_id,))
+            if not user_data:
+                ttk.Label(scrollable_frame, text="User data not found!", font=("Arial", 12)).pack(pady=10)
                 return
-        else:
-            ttk.Label(scrollable_frame, text="Database connection failed!", font=("Arial", 12)).pack(pady=10)
+            
+            username, email, phone, profile_pic, address, status = user_data
+        except mysql.connector.Error as err:
+            ttk.Label(scrollable_frame, text=f"Error fetching user data: {err}", font=("Arial", 12)).pack(pady=10)
             return
 
         # Profile Section with Preview
@@ -2939,16 +3087,12 @@ class UserDashboard:
             image.save(save_path)
             
             # Update database
-            if db and cursor:
-                cursor.execute("UPDATE user_accounts SET profile_picture_path = %s WHERE id = %s", (save_path, self.current_user_id))
-                db.commit()
-                logging.info(f"✅ Profile picture updated: {save_path}")
-                
-                # Update UI
-                self.refresh_profile_picture(save_path)
-                messagebox.showinfo("Success", "Profile picture updated successfully!")
-            else:
-                messagebox.showerror("Error", "Database connection failed!")
+            database.execute("UPDATE user_accounts SET profile_picture_path = %s WHERE id = %s", (save_path, self.current_user_id))
+            logging.info(f"✅ Profile picture updated: {save_path}")
+            
+            # Update UI
+            self.refresh_profile_picture(save_path)
+            messagebox.showinfo("Success", "Profile picture updated successfully!")
         except Exception as e:
             logging.error(f"Error uploading profile picture: {e}")
             messagebox.showerror("Error", f"Failed to upload profile picture: {e}")
@@ -2982,11 +3126,12 @@ class UserDashboard:
         else:
             # For other fields, show a dialog
             current_value = None
-            if db and cursor:
-                cursor.execute(f"SELECT {field} FROM user_accounts WHERE id = %s", (self.current_user_id,))
-                result = cursor.fetchone()
+            try:
+                result = database.fetch_one(f"SELECT {field} FROM user_accounts WHERE id = %s", (self.current_user_id,))
                 if result:
                     current_value = result[0]
+            except mysql.connector.Error as err:
+                logging.error(f"❌ Database Error: {err}")
             
             # Show dialog with current value
             prompt_text = f"Enter new {field.capitalize()}:"
@@ -2997,10 +3142,6 @@ class UserDashboard:
 
     def update_user_field(self, field, value):
         """Update user field in database."""
-        if not db or not cursor:
-            messagebox.showerror("Error", "Database connection failed!")
-            return False
-        
         # Validation for specific fields
         if field == "email" and not self.validate_email(value):
             messagebox.showerror("Invalid Input", "Please enter a valid email address.")
@@ -3010,8 +3151,7 @@ class UserDashboard:
             return False
         
         try:
-            cursor.execute(f"UPDATE user_accounts SET {field} = %s WHERE id = %s", (value, self.current_user_id))
-            db.commit()
+            database.execute(f"UPDATE user_accounts SET {field} = %s WHERE id = %s", (value, self.current_user_id))
             logging.info(f"✅ User {field} updated for user ID {self.current_user_id}")
             
             # Update UI
@@ -3033,21 +3173,15 @@ class UserDashboard:
 
     def toggle_account_status(self):
         """Toggle user account status between active and inactive."""
-        if not db or not cursor:
-            messagebox.showerror("Error", "Database connection failed!")
-            return
-        
         try:
             # Get current status
-            cursor.execute("SELECT status FROM user_accounts WHERE id = %s", (self.current_user_id,))
-            current_status = cursor.fetchone()[0]
+            current_status = database.fetch_one("SELECT status FROM user_accounts WHERE id = %s", (self.current_user_id,))[0]
             
             # Toggle status
             new_status = "inactive" if current_status.lower() == "active" else "active"
             
             # Update database
-            cursor.execute("UPDATE user_accounts SET status = %s WHERE id = %s", (new_status, self.current_user_id))
-            db.commit()
+            database.execute("UPDATE user_accounts SET status = %s WHERE id = %s", (new_status, self.current_user_id))
             
             # Update UI
             self.status_label.config(text=f"Account Status: {new_status.capitalize()}")
@@ -3077,14 +3211,9 @@ class UserDashboard:
             messagebox.showerror("Error", "Password must be at least 8 characters with uppercase, lowercase, and numbers!")
             return
         
-        if not db or not cursor:
-            messagebox.showerror("Error", "Database connection failed!")
-            return
-        
         try:
             # Get current password hash from DB
-            cursor.execute("SELECT password_hash FROM user_accounts WHERE id = %s", (self.current_user_id,))
-            result = cursor.fetchone()
+            result = database.fetch_one("SELECT password_hash FROM user_accounts WHERE id = %s", (self.current_user_id,))
             
             if not result:
                 messagebox.showerror("Error", "User not found!")
@@ -3101,8 +3230,7 @@ class UserDashboard:
             hashed_pwd = bcrypt.hashpw(new_pwd.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
             
             # Update database
-            cursor.execute("UPDATE user_accounts SET password_hash = %s WHERE id = %s", (hashed_pwd, self.current_user_id))
-            db.commit()
+            database.execute("UPDATE user_accounts SET password_hash = %s WHERE id = %s", (hashed_pwd, self.current_user_id))
             
             logging.info(f"✅ Password updated for user ID {self.current_user_id}")
             messagebox.showinfo("Success", "Password changed successfully!")
@@ -3142,14 +3270,29 @@ class UserDashboard:
         return True
 
     def logout(self):
-        """Handle user logout."""
-        if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
-            logging.info(f"User ID {self.current_user_id} logged out")
+        """Log out the user and return to the login screen."""
+        if not messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            return
+        logging.info(f"User ID {self.current_user_id} logged out")
+        try:
+            database.execute("UPDATE user_accounts SET is_online = 0, last_activity = NULL WHERE id = %s",
+                             (self.current_user_id,))
+        except Error as e:
+            logging.error(f"Error updating logout status: {e}")
+
+        if os.path.exists("session.txt"):
+            try:
+                os.remove("session.txt")
+            except Exception as e:
+                logging.error(f"Error removing session file: {e}")
+
+        if self.router is not None:
+            # Same window and process: the pool and caches are reused by the next login
+            self.router.show_login()
+        else:
+            self.close()
             self.root.destroy()
-            # Here you would typically redirect to login screen
-            # For demonstration, just show a message
             messagebox.showinfo("Logged Out", "You have been logged out successfully.")
-            # In a real app, you would launch the login window here
 
 # Main Program
 if __name__ == "__main__":
@@ -3159,5 +3302,5 @@ if __name__ == "__main__":
 
     user_id = int(sys.argv[1])
     root = tk.Tk()
-    dashboard = UserDashboard(root, user_id)
+    ScreenRouter(root).show_dashboard("user", user_id)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,163 @@
+import tkinter as tk
+from tkinter import ttk
+
+# Extra rows kept alive above and below the viewport so fast scrolling doesn't flash
+DEFAULT_OVERSCAN = 2
+# on_near_end fires when the viewport comes within this many rows of the last item
+NEAR_END_ROWS = 3
+
+
+class VirtualScroller:
+    """Scrollable list/grid that only builds widgets for the rows in view.
+
+    Rows have a fixed height. create_row(parent) builds an empty row widget once;
+    update_row(widget, item, index) fills it with data. Widgets that scroll out of
+    view are hidden and reused for the rows scrolling in, so the number of live
+    widgets stays proportional to the window size, not the number of items.
+    on_near_end() is called when scrolling approaches the last item, so the next
+    page of a paged list can be fetched and added with append_items().
+    Pack/grid the `frame` attribute to place the scroller.
+    """
+
+    def __init__(self, parent, row_height, create_row, update_row, columns=1,
+                 overscan=DEFAULT_OVERSCAN, padding=5, on_near_end=None, **canvas_options):
+        self.row_height = row_height
+        self.create_row = create_row
+        self.update_row = update_row
+        self.on_near_end = on_near_end
+        self.columns = max(1, columns)
+        self.overscan = overscan
+        self.padding = padding
+
+        self.frame = ttk.Frame(parent)
+        canvas_options.setdefault("borderwidth", 0)
+        canvas_options.setdefault("highlightthickness", 0)
+        self.canvas = tk.Canvas(self.frame, yscrollincrement=20, **canvas_options)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.items = []
+        self._visible = {}   # item index -> (canvas window id, widget)
+        self._free = []      # hidden (canvas window id, widget) pairs ready for reuse
+        self._message_id = None
+        self._refresh_pending = False
+        self._width = 0
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_mousewheel))
+        self.canvas.bind("<Leave>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
+
+    def set_items(self, items):
+        """Replace the displayed items and scroll back to the top."""
+        self.items = list(items)
+        self._clear_message()
+        self._recycle_all()
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def append_items(self, items):
+        """Add items after the current ones, keeping the scroll position."""
+        self.items.extend(items)
+        self._update_scrollregion()
+        self._schedule_refresh()
+
+    def set_message(self, text):
+        """Clear the list and show a centred message (loading, no results, ...)."""
+        self.items = []
+        self._recycle_all()
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self._clear_message()
+        self._message_id = self.canvas.create_text(
+            max(self._width, self.canvas.winfo_width()) // 2, 40,
+            text=text, font=("Arial", 12), justify="center", anchor="n"
+        )
+
+    def refresh_item(self, index):
+        """Re-run update_row for an item that is currently on screen."""
+        if index in self._visible:
+            self.update_row(self._visible[index][1], self.items[index], index)
+
+    def refresh(self):
+        """Materialize the rows intersecting the viewport (plus overscan)."""
+        self._refresh_pending = False
+        if not self.canvas.winfo_exists():
+            return
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or not self.items:
+            return
+
+        top = self.canvas.canvasy(0)
+        total_rows = (len(self.items) + self.columns - 1) // self.columns
+        first_row = max(0, int(top // self.row_height) - self.overscan)
+        last_row = min(total_rows - 1, int((top + height) // self.row_height) + self.overscan)
+        wanted = range(first_row * self.columns, min(len(self.items), (last_row + 1) * self.columns))
+
+        # Hide rows that left the viewport so their widgets can be reused
+        for index in [i for i in self._visible if i not in wanted]:
+            window_id, widget = self._visible.pop(index)
+            self.canvas.itemconfigure(window_id, state="hidden")
+            self._free.append((window_id, widget))
+
+        cell_width = width // self.columns
+        for index in wanted:
+            if index not in self._visible:
+                if self._free:
+                    window_id, widget = self._free.pop()
+                    self.canvas.itemconfigure(window_id, state="normal")
+                else:
+                    widget = self.create_row(self.canvas)
+                    window_id = self.canvas.create_window(0, 0, window=widget, anchor="nw")
+                self.update_row(widget, self.items[index], index)
+                self._visible[index] = (window_id, widget)
+
+            window_id = self._visible[index][0]
+            row, col = divmod(index, self.columns)
+            self.canvas.coords(window_id, col * cell_width + self.padding, row * self.row_height + self.padding)
+            self.canvas.itemconfigure(window_id, width=cell_width - 2 * self.padding,
+                                      height=self.row_height - 2 * self.padding)
+
+        if self.on_near_end and last_row >= total_rows - 1 - NEAR_END_ROWS:
+            self.on_near_end()
+
+    def destroy(self):
+        self.frame.destroy()
+
+    def _recycle_all(self):
+        for window_id, widget in self._visible.values():
+            self.canvas.itemconfigure(window_id, state="hidden")
+            self._free.append((window_id, widget))
+        self._visible.clear()
+
+    def _clear_message(self):
+        if self._message_id is not None:
+            self.canvas.delete(self._message_id)
+            self._message_id = None
+
+    def _update_scrollregion(self):
+        total_rows = (len(self.items) + self.columns - 1) // self.columns
+        self.canvas.configure(scrollregion=(0, 0, self._width, total_rows * self.row_height))
+
+    def _schedule_refresh(self):
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.canvas.after_idle(self.refresh)
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_refresh()
+
+    def _on_configure(self, event):
+        self._width = event.width
+        self._update_scrollregion()
+        if self._message_id is not None:
+            self.canvas.coords(self._message_id, event.width // 2, 40)
+        self._schedule_refresh()
+
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
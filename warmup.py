@@ -0,0 +1,137 @@
+"""Startup work done while the splash screen is showing.
+
+A background thread opens pooled database connections, renders the thumbnails
+of the first cards the dashboards show, and loads the reference data the first
+pages need. The dashboards (with ttkbootstrap and the Tk widgets) are imported
+on the Tk thread instead, one module per `step()`, because ttkbootstrap sets up
+Tk state at import time and Tk isn't thread-safe. The splash calls `step()` and
+`progress()` from its poll and closes when `done`.
+Every phase is timed; `report()` logs the timings.
+"""
+import functools
+import importlib
+import logging
+import os
+import threading
+import time
+
+import database
+import thumbnails
+
+# Pooled connections opened ahead of the login query and the dashboards' first queries
+POOL_WARM_SIZE = 2
+# Cards on the first page of Explore Places and Events whose thumbnails are rendered
+FIRST_PAGE_IMAGES = 12
+# Modules the login screen imports on demand (imported on the Tk thread)
+DASHBOARD_MODULES = ("user_dashboard", "admin_dashboard")
+DEFAULT_EVENT_IMAGE = "assets/no_image.jpg"
+
+FIRST_PLACE_IMAGES_QUERY = """
+    SELECT image FROM places
+    WHERE status = 'approved' AND image IS NOT NULL AND image <> ''
+    LIMIT %s
+"""
+FIRST_EVENT_IMAGES_QUERY = """
+    SELECT image FROM events
+    WHERE status = 'approved' AND date_deleted IS NULL AND image IS NOT NULL AND image <> ''
+    ORDER BY date ASC
+    LIMIT %s
+"""
+
+
+def warm_pool():
+    database.prewarm(POOL_WARM_SIZE)
+
+
+def render_first_thumbnails():
+    """Cache the thumbnails of the first place and event cards on disk."""
+    jobs = [(row[0], (thumbnails.PLACE_CARD_SIZE,))
+            for row in database.fetch_all(FIRST_PLACE_IMAGES_QUERY, (FIRST_PAGE_IMAGES,))]
+    jobs += [(row[0], thumbnails.EVENT_SIZES)
+             for row in database.fetch_all(FIRST_EVENT_IMAGES_QUERY, (FIRST_PAGE_IMAGES,))]
+    jobs.append((DEFAULT_EVENT_IMAGE, (thumbnails.EVENT_CARD_SIZE,)))
+    for path, sizes in jobs:
+        if os.path.exists(path):
+            thumbnails.prewarm(path, sizes)
+
+
+def prime_reference_data():
+    """Load the caches behind the dashboards' first pages and search boxes."""
+    # Imported here (none of them touches Tk); the dashboards import them anyway
+    import autocomplete
+    import dashboard_stats
+    import fuzzy
+    import popularity
+    dashboard_stats.get_stats()
+    popularity.refresh_ranking()
+    autocomplete.refresh()
+    fuzzy.get_index()
+
+
+# Run in order on the background thread
+PHASES = (
+    ("database pool", warm_pool),
+    ("first-page thumbnails", render_first_thumbnails),
+    ("reference data", prime_reference_data),
+)
+# Run one at a time by step(), on the Tk thread
+TK_THREAD_PHASES = tuple((f"import {name}", functools.partial(importlib.import_module, name))
+                         for name in DASHBOARD_MODULES)
+
+
+class Warmup:
+    """Runs the warm-up phases (on a daemon thread and on the Tk thread) and records how long each took."""
+
+    def __init__(self, phases=PHASES, tk_thread_phases=TK_THREAD_PHASES):
+        self.phases = phases
+        self.tk_thread_phases = tk_thread_phases
+        self.timings = []   # (phase, seconds, error or None)
+        self._thread = None
+        self._thread_done = False
+        self._next_tk_phase = 0
+
+    @property
+    def done(self):
+        return self._thread_done and self._next_tk_phase == len(self.tk_thread_phases)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def step(self):
+        """Run the next Tk-thread phase, if any (call it from the Tk thread)."""
+        if self._next_tk_phase < len(self.tk_thread_phases):
+            name, phase = self.tk_thread_phases[self._next_tk_phase]
+            self._next_tk_phase += 1
+            self._time(name, phase)
+
+    def progress(self):
+        """Fraction of the phases finished (0.0 - 1.0)."""
+        return len(self.timings) / (len(self.phases) + len(self.tk_thread_phases))
+
+    def _run(self):
+        for name, phase in self.phases:
+            self._time(name, phase)
+        self._thread_done = True
+
+    def _time(self, name, phase):
+        started = time.perf_counter()
+        error = None
+        try:
+            phase()
+        # admin_dashboard exits on import when .env is incomplete; the login reports that later
+        except (Exception, SystemExit) as e:
+            error = e
+        self.timings.append((name, time.perf_counter() - started, error))
+
+    def report(self):
+        """Log how long every finished phase took."""
+        for name, seconds, error in self.timings:
+            if error is None:
+                logging.info(f"✅ Warm-up {name}: {seconds * 1000:.0f} ms")
+            else:
+                logging.error(f"❌ Warm-up {name} failed after {seconds * 1000:.0f} ms: {error}")
+        if not self.done:
+            logging.info(f"Warm-up still running: {len(self.timings)} of "
+                         f"{len(self.phases) + len(self.tk_thread_phases)} phases done")